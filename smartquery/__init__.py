@@ -1,4 +1,6 @@
 from smartquery.sq_parser import SqParser
 from smartquery.exceptions import ParserError
+from smartquery.cache import LRUCache, SqliteCache, ChainedCache
+from smartquery.executor import SqExecutor
 
-__all__ = ['SqParser', 'ParserError']
+__all__ = ['SqParser', 'ParserError', 'LRUCache', 'SqliteCache', 'ChainedCache', 'SqExecutor']
@@ -1,175 +1,304 @@
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from decimal import Decimal as Decimal_
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Type, TypeVar, cast
 
 import copy
+import sys
+import time
+
+import regex
 
-from smartquery.custom_types import Decimal
 from smartquery.exceptions import ParserError, OpsExecutionLimitExceededError
-from smartquery.functions import _dict_key_cast
+from smartquery.functions import FUNCTIONS, REGEX_FUNCTIONS, Pattern, _dict_key_cast, _float_dict_key_cast, \
+    compile_pattern
+from smartquery.operators import NUMERIC_TYPES, SHORT_CIRCUIT_OPERATORS, binary_operator, unary_operator, \
+    short_operator
 from smartquery.utils import safe_cast
+from smartquery.values import copy_value
 from smartquery.vm_state import VMState
 
+if TYPE_CHECKING:
+    from smartquery.stats import EvalStats
+
+
+IMMUTABLE_TYPES = (str, bool, type(None), Decimal_, int, float)
 
-NUMERIC_TYPES = (Decimal_, int, float)
+
+def charge(state: VMState, cost: int):
+    state.ops_evaluated += cost
+    if state.ops_evaluated >= state.max_ops_evaluated:
+        raise OpsExecutionLimitExceededError(f'Ops execution limit exceeded: {state.max_ops_evaluated}')
 
 
 class Op(ABC):
+    # nodes are immutable and shared (between cached trees, threads and parsers), so they have no __dict__:
+    # subclasses are frozen dataclasses with __slots__, see node();
+    # __weakref__ is for the table of interned nodes (see interning.py)
+    #
+    # ops accounting: instead of a charge per node, cost (the number of nodes evaluated unconditionally
+    # with the node, computed once by node()) is charged once per block: a program line, a lazy branch
+    # of and/or/if-else or a call of a lambda, before the block is evaluated;
+    # custom subclasses (not created by node()) keep the class default 0 and are charged by Op.eval
+    __slots__ = ('__weakref__',)
+
+    cost: int = 0
+
+    def __getstate__(self):
+        # fields with init=False may be unset, e.g. f of short circuit BinOp
+        return {f.name: getattr(self, f.name) for f in fields(self) if hasattr(self, f.name)}
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            object.__setattr__(self, k, v)
+
+        object.__setattr__(self, 'cost', self.static_cost())
+
+    def static_cost(self) -> int:
+        # custom subclasses are charged by Op.eval
+        return 0
+
+    def run(self, state: VMState):
+        # evaluates the node as a block
+        charge(state, self.cost)
+        if state.stats is not None:
+            state.stats.add_block(self)
+
+        return self.eval(state)
+
     def eval(self, state: VMState):
-        state.ops_evaluated += 1
-        if state.ops_evaluated >= state.max_ops_evaluated:
-            raise OpsExecutionLimitExceededError(f'Ops execution limit exceeded: {state.max_ops_evaluated}')
+        charge(state, 1)
+        if state.stats is not None:
+            state.stats.add_node(self)
+
+
+T = TypeVar('T', bound=Type[Op])
+
+
+if TYPE_CHECKING:
+    # mypy can't see through the class rebuild below: nodes are checked as plain dataclasses
+    from dataclasses import dataclass as node
+else:
+    def node(cls: T) -> T:
+        # frozen dataclass with __slots__ (as dataclass(frozen=True, slots=True) of python 3.10+):
+        # the class is created once again, with a slot per field (and cost) instead of __dict__
+        dc = dataclass(frozen=True)(cls)
+        names = tuple(f.name for f in fields(dc))
+
+        body = {k: v for k, v in dc.__dict__.items() if k not in names and k not in ('__dict__', '__weakref__')}
+        body['__slots__'] = names + ('cost',)
+
+        init = body['__init__']
+
+        def __init__(self, *args, **kwargs):
+            init(self, *args, **kwargs)
+            object.__setattr__(self, 'cost', self.static_cost())
+
+        body['__init__'] = __init__
+        slotted = type(dc)(dc.__name__, dc.__bases__, body)
+
+        # zero argument super() of methods refers to the class through a __class__ cell
+        for v in body.values():
+            for cell in getattr(v, '__closure__', None) or ():
+                if cell.cell_contents is dc:
+                    cell.cell_contents = slotted
+
+        return cast(T, slotted)
+
+
+def _intern_name(op: Any):
+    # equal names of all (cached) trees share one string, and dict lookups of them compare pointers;
+    # op is any node with a name field (AssignOp, ShortOp, NameOp, CallOp)
+    object.__setattr__(op, 'name', sys.intern(op.name))
 
 
-@dataclass
+@node
 class NoOp(Op):
-    pass
+    def static_cost(self) -> int:
+        return 1
+
+    def eval(self, state: VMState):
+        return None
 
 
-@dataclass
+@node
 class ValueOp(Op):
     v: Any
 
+    def static_cost(self) -> int:
+        return 1
+
     def eval(self, state: VMState):
-        super().eval(state)
         return self.v
 
 
-@dataclass
+# shared nodes of the constants
+NONE = ValueOp(None)
+TRUE = ValueOp(True)
+FALSE = ValueOp(False)
+
+
+# prebuilt value of a constant list/dict literal (see optimizer.py),
+# copied on every eval, so mutations of the result never leak into the next evaluation
+@node
+class ConstOp(Op):
+    v: Any
+    origin: Op
+    builtins: Tuple[str, ...] = ()
+
+    shallow: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        values = self.v.values() if isinstance(self.v, dict) else self.v
+        object.__setattr__(self, 'shallow', all(isinstance(v, IMMUTABLE_TYPES) for v in values))
+
+    def static_cost(self) -> int:
+        return 1
+
+    def eval(self, state: VMState):
+        for name in self.builtins:
+            if state.names[name] is not FUNCTIONS[name]:
+                # builtin, used by the literal, is overridden: build it as usual
+                charge(state, self.origin.cost - 1)
+                if state.stats is not None:
+                    state.stats.add_block(self.origin)
+                    state.stats.add_node(self, -1)
+
+                return self.origin.eval(state)
+
+        if self.shallow:
+            return copy.copy(self.v)
+
+        return copy_value(self.v)
+
+
+@node
 class CodeOp(Op):
     lines: List[Op]
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    def static_cost(self) -> int:
+        return 1
 
+    def eval(self, state: VMState):
         res = None
+        stats = state.stats
         for line in self.lines:
+            charge(state, line.cost)
+            if stats is not None:
+                stats.add_block(line)
+
             res = line.eval(state)
 
         return res
 
 
-@dataclass
+@node
 class BinOp(Op):
     op: str
     op1: Op
     op2: Op
+    # parsed with numeric_mode='float' (see SqParser)
+    float_mode: bool = False
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    # resolved from self.op once, at parse time
+    f: Callable[[Any, Any], Any] = field(init=False, repr=False, compare=False)
+    short_circuit: Optional[bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        short_circuit = SHORT_CIRCUIT_OPERATORS.get(self.op)
+        object.__setattr__(self, 'short_circuit', short_circuit)
+        if short_circuit is None:
+            object.__setattr__(self, 'f', binary_operator(self.op, self.float_mode))
+
+    def static_cost(self) -> int:
+        if self.short_circuit is not None:
+            return 1 + self.op1.cost
 
+        return 1 + self.op1.cost + self.op2.cost
+
+    def eval(self, state: VMState):
         op1 = self.op1.eval(state)
 
-        if self.op != 'and' and self.op != 'or':
-            op2 = self.op2.eval(state)
-        else:
-            op2 = None
-
-        if self.op == '+':
-            if isinstance(op1, str) and not isinstance(op2, str):
-                op2 = str(op2)
-            return op1 + op2
-        elif self.op == '-':
-            return op1 - op2
-        elif self.op == '*':
-            if not isinstance(op1, NUMERIC_TYPES) or not isinstance(op2, NUMERIC_TYPES):
-                raise ParserError(f'Can\'t multiply non-numbers')
-
-            return Decimal(op1) * Decimal(op2)
-        elif self.op == '**':
-            # explicitly cast to Decimal to avoid powering of big integers
-            return Decimal(op1) ** Decimal(op2)
-        elif self.op == '/':
-            return op1 / op2
-
-        elif self.op == '==':
-            return op1 == op2
-        elif self.op == '!=':
-            return op1 != op2
-        elif self.op == '>':
-            return op1 > op2
-        elif self.op == '<':
-            return op1 < op2
-        elif self.op == '>=':
-            return op1 >= op2
-        elif self.op == '<=':
-            return op1 <= op2
-        elif self.op == 'not in':
-            return op1 not in op2
-        elif self.op == 'in':
-            return op1 in op2
-
-        elif self.op == 'and':
-            return op1 and self.op2.eval(state)
-        elif self.op == 'or':
-            return op1 or self.op2.eval(state)
-
-        raise ParserError(f'Unsupported binary operation: {self.op}')
-
-
-@dataclass
+        if self.short_circuit is not None:
+            if bool(op1) is self.short_circuit:
+                return op1
+
+            charge(state, self.op2.cost)
+            if state.stats is not None:
+                state.stats.add_block(self.op2)
+
+            return self.op2.eval(state)
+
+        return self.f(op1, self.op2.eval(state))
+
+
+@node
 class UnaryOp(Op):
     op: str
     op1: Op
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    f: Callable[[Any], Any] = field(init=False, repr=False, compare=False)
 
-        op1 = self.op1.eval(state)
+    def __post_init__(self):
+        object.__setattr__(self, 'f', unary_operator(self.op))
 
-        if self.op == '-':
-            return -op1
+    def static_cost(self) -> int:
+        return 1 + self.op1.cost
 
-        if self.op == 'not':
-            return not op1
+    def eval(self, state: VMState):
+        return self.f(self.op1.eval(state))
 
 
-@dataclass
+@node
 class AssignOp(Op):
     name: str
     value: Op
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    __post_init__ = _intern_name
+
+    def static_cost(self) -> int:
+        return 1 + self.value.cost
 
+    def eval(self, state: VMState):
         value = self.value.eval(state)
-        state.names[self.name] = copy.deepcopy(value)
+        state.names[self.name] = state.copy_value(value)
         return None
 
 
-@dataclass
+@node
 class ShortOp(Op):
     name: str
     op: str
     value: Op
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    f: Callable[[Any, Any], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        _intern_name(self)
+        object.__setattr__(self, 'f', short_operator(self.op))
 
-        value = copy.deepcopy(self.value.eval(state))
+    def static_cost(self) -> int:
+        return 1 + self.value.cost
 
-        if self.op == '+=':
-            state.names[self.name] += value
-        elif self.op == '-=':
-            state.names[self.name] -= value
-        elif self.op == '*=':
-            state.names[self.name] *= value
-        elif self.op == '/=':
-            state.names[self.name] /= value
-        else:
-            raise ParserError(f'Unsupported short op: {self.op}')
+    def eval(self, state: VMState):
+        value = state.copy_value(self.value.eval(state))
+
+        names = state.names
+        names[self.name] = self.f(names[self.name], value)
 
         return None
 
 
-@dataclass
+@node
 class NameOp(Op):
     name: str
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    __post_init__ = _intern_name
 
+    def static_cost(self) -> int:
+        return 1
+
+    def eval(self, state: VMState):
         try:
             value = state.names[self.name]
         except LookupError:
@@ -178,28 +307,34 @@ class NameOp(Op):
         return value
 
 
-@dataclass
+@node
 class IfExprOp(Op):
     cond: Op
     op1: Op
     op2: Op
 
+    def static_cost(self) -> int:
+        return 1 + self.cond.cost
+
     def eval(self, state: VMState):
-        super().eval(state)
+        branch = self.op1 if self.cond.eval(state) else self.op2
+        charge(state, branch.cost)
+        if state.stats is not None:
+            state.stats.add_block(branch)
 
-        cond = self.cond.eval(state)
-        return self.op1.eval(state) if cond else self.op2.eval(state)
+        return branch.eval(state)
 
 
-@dataclass
+@node
 class SliceOp(Op):
-    start: Op = field(default_factory=lambda: ValueOp(None))
-    stop: Op = field(default_factory=lambda: ValueOp(None))
-    step: Op = field(default_factory=lambda: ValueOp(None))
+    start: Op = NONE
+    stop: Op = NONE
+    step: Op = NONE
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    def static_cost(self) -> int:
+        return 1 + self.start.cost + self.stop.cost + self.step.cost
 
+    def eval(self, state: VMState):
         return slice(
             safe_cast(self.start.eval(state), int),
             safe_cast(self.stop.eval(state), int),
@@ -207,14 +342,22 @@ class SliceOp(Op):
         )
 
 
-@dataclass
+@node
 class CallOp(Op):
     name: str
     args: list
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    # pattern of match/match_groups/match_all, compiled at parse time, when it's a literal
+    pattern: Optional[Pattern] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        _intern_name(self)
+        object.__setattr__(self, 'pattern', _literal_pattern(self))
+
+    def static_cost(self) -> int:
+        return 1 + sum(arg.cost for arg in self.args)
 
+    def eval(self, state: VMState):
         args = [
             arg.eval(state) for arg in self.args
         ]
@@ -223,33 +366,91 @@ class CallOp(Op):
         except LookupError:
             raise ParserError(f'Undefined function {self.name}')
 
+        if self.pattern is not None and f is FUNCTIONS[self.name]:
+            # builtin isn't overridden
+            args[1] = self.pattern
+
+        if state.stats is not None:
+            return _timed_call(state.stats, self.name, f, args)
+
         return f(*args)
 
 
-@dataclass
+def _timed_call(stats: 'EvalStats', name: str, f: Callable, args: list) -> Any:
+    start = time.perf_counter()
+    try:
+        return f(*args)
+    finally:
+        stats.add_call(name, time.perf_counter() - start)
+
+
+def _literal_pattern(op: CallOp) -> Optional[Pattern]:
+    if op.name not in REGEX_FUNCTIONS or not 2 <= len(op.args) <= 3:
+        return None
+
+    literals = op.args[1:]
+    if any(type(arg) is not ValueOp or not isinstance(arg.v, (str, type(None))) for arg in literals):
+        return None
+
+    pattern = literals[0].v
+    flags_str = literals[1].v if len(literals) > 1 else None
+    if pattern is None:
+        return None
+
+    try:
+        return compile_pattern(pattern, flags_str)
+    except regex.error:
+        # raised on evaluation, as usual
+        return None
+
+
+@node
 class DictOp(Op):
     d: List[tuple]
+    # parsed with numeric_mode='float' (see SqParser)
+    float_mode: bool = False
 
-    def eval(self, state: VMState):
-        super().eval(state)
+    key_cast: Callable[[Any], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'key_cast', _float_dict_key_cast if self.float_mode else _dict_key_cast)
+
+    def static_cost(self) -> int:
+        return 1 + sum(k.cost + v.cost for k, v in self.d)
 
+    def eval(self, state: VMState):
+        key_cast = self.key_cast
         return {
-            _dict_key_cast(k.eval(state)): v.eval(state) for k, v in self.d
+            key_cast(k.eval(state)): v.eval(state) for k, v in self.d
         }
 
 
-@dataclass
+@node
 class LambdaOp(Op):
     args: List[NameOp]
     expr: Op
 
+    def static_cost(self) -> int:
+        # the body is charged on every call
+        return 1
+
     def eval(self, state: VMState):
-        super().eval(state)
+        names = state.names
+        arg_names = [k.name for k in self.args]
+        expr = self.expr
 
         def f(*args):
-            with state.names.make_scope({
-                k.name: v for k, v in zip(self.args, args)
-            }):
-                return self.expr.eval(state)
+            charge(state, expr.cost)
+
+            # push/pop instead of make_scope(), which costs a generator per call
+            names.push_scope(dict(zip(arg_names, args)))
+            if state.stats is not None:
+                state.stats.add_block(expr)
+                state.stats.add_lambda_call(len(names.scopes))
+
+            try:
+                return expr.eval(state)
+            finally:
+                names.pop_scope()
 
         return f
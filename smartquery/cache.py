@@ -0,0 +1,293 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Iterator, MutableMapping, Optional, Set, Tuple, TypeVar, Union
+
+import hashlib
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class _Missing(Enum):
+    # sentinel of missing items, which (unlike object()) mypy narrows on with `is`
+    MISSING = 0
+
+
+_MISSING = _Missing.MISSING
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def source_size(key: Any) -> int:
+    if isinstance(key, str):
+        return len(key.encode())
+
+    return 0
+
+
+class LRUCache(MutableMapping[K, V]):
+    # Bounded cache for SqParser.parse_cache/code_cache:
+    # - max_entries: max number of cached items
+    # - max_bytes: max total size of keys (program sources), measured by sizeof
+    # - ttl: seconds after which an item is dropped
+    # Least recently used items are evicted first.
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[K], int] = source_size,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+
+        self.stats = CacheStats()
+        self.size = 0
+
+        self._items: 'OrderedDict[K, Tuple[V, int, Optional[float]]]' = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: K, default: Any = None) -> Any:
+        with self._lock:
+            item = self._items.get(key, _MISSING)
+            if item is _MISSING:
+                self.stats.misses += 1
+                return default
+
+            value, _, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return default
+
+            self._items.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            item = self._items.get(key, _MISSING)  # type: ignore
+            if item is _MISSING:
+                return False
+
+            expires_at = item[2]
+            return expires_at is None or expires_at > time.monotonic()
+
+    def __setitem__(self, key: K, value: V):
+        size = self.sizeof(key)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+
+            self._items[key] = (value, size, expires_at)
+            self.size += size
+
+            self._evict()
+
+    def __delitem__(self, key: K):
+        with self._lock:
+            self._remove(key)
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def _remove(self, key: K):
+        _, size, _ = self._items.pop(key)
+        self.size -= size
+
+    def _evict(self):
+        while self._items and (
+            (self.max_entries is not None and len(self._items) > self.max_entries)
+            or (self.max_bytes is not None and self.size > self.max_bytes)
+        ):
+            key = next(iter(self._items))
+            self._remove(key)
+            self.stats.evictions += 1
+
+
+def _grammar_version() -> str:
+    from smartquery.gen import lalrtab
+
+    return hashlib.sha256(lalrtab.SIGNATURE.encode()).hexdigest()[:16]
+
+
+class SqliteCache(MutableMapping[str, Any]):
+    # Persistent cache of parsed programs, shared between processes and restarts.
+    # Values are pickled, so the database file must be trusted (i.e. local and not user-writable).
+    # Keys are sha256 hashes of the source prefixed with the grammar version, FORMAT_VERSION
+    # and Python version (compiled bytecode is version specific), so any change to the grammar
+    # or to Op classes makes old entries unreachable.
+
+    FORMAT_VERSION = 6
+
+    def __init__(self, path: Union[str, Path], namespace: str = ''):
+        self.path = str(path)
+        self.namespace = namespace
+        self.stats = CacheStats()
+
+        python_version = '.'.join(map(str, sys.version_info[:2]))
+        self._prefix = f'{_grammar_version()}:{self.FORMAT_VERSION}:{python_version}:{namespace}:'
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS programs (key TEXT PRIMARY KEY, source TEXT NOT NULL, value BLOB NOT NULL)')
+
+    def key(self, source: str) -> str:
+        return hashlib.sha256((self._prefix + source).encode()).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM programs WHERE key = ?', (self.key(key),)).fetchone()
+
+            if row is None:
+                self.stats.misses += 1
+                return default
+
+            self.stats.hits += 1
+
+        return pickle.loads(row[0])
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+
+        with self._lock:
+            row = self._conn.execute('SELECT 1 FROM programs WHERE key = ?', (self.key(key),)).fetchone()
+
+        return row is not None
+
+    def __setitem__(self, key: str, value: Any):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO programs (key, source, value) VALUES (?, ?, ?)', (self.key(key), key, data))
+
+    def __delitem__(self, key: str):
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM programs WHERE key = ?', (self.key(key),))
+
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._conn.execute('SELECT key, source FROM programs').fetchall()
+
+        # entries of other grammar versions and namespaces are skipped
+        return iter([source for key, source in rows if key == self.key(source)])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def close(self):
+        self._conn.close()
+
+
+class ChainedCache(MutableMapping[K, V]):
+    # Multi-level cache, e.g. ChainedCache(LRUCache(max_entries=10000), SqliteCache('programs.db')):
+    # lookups go from the first cache to the last one, and hits are copied to the preceding caches;
+    # writes go to all of them.
+
+    def __init__(self, *caches: MutableMapping[K, V]):
+        self.caches = caches
+
+    def get(self, key: K, default: Any = None) -> Any:
+        for i, cache in enumerate(self.caches):
+            value: Union[V, _Missing] = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                for upper in self.caches[:i]:
+                    upper[key] = value
+
+                return value
+
+        return default
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in cache for cache in self.caches)
+
+    def __setitem__(self, key: K, value: V):
+        for cache in self.caches:
+            cache[key] = value
+
+    def __delitem__(self, key: K):
+        found = False
+        for cache in self.caches:
+            if key in cache:
+                del cache[key]
+                found = True
+
+        if not found:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[K]:
+        seen: Set[K] = set()
+        for cache in self.caches:
+            for key in cache:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @property
+    def stats(self) -> Optional[CacheStats]:
+        # stats of the first level cache
+        return getattr(self.caches[0], 'stats', None) if self.caches else None
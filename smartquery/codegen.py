@@ -0,0 +1,388 @@
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Any, Callable, Dict, List, Mapping, Optional, cast
+
+import ast
+import marshal
+import sys
+
+from smartquery.ast_ops import Op, NoOp, ValueOp, CodeOp, BinOp, UnaryOp, AssignOp, ShortOp, NameOp, IfExprOp, \
+    SliceOp, CallOp, DictOp, LambdaOp, charge
+from smartquery.exceptions import ParserError
+from smartquery.functions import BUILTINS, _dict_key_cast, _float_dict_key_cast
+from smartquery.operators import add, mul, power, float_add, float_mul, float_power
+from smartquery.persistent import plain_names, to_plain
+from smartquery.utils import safe_cast
+from smartquery.vm_state import VMState, make_state
+
+
+PROGRAM_NAME = '_program'
+FILENAME = '<smartquery>'
+
+
+# Python bytecode backend: the Op tree is translated to a Python module with a single function,
+# which is compiled with compile() and executed against a globals dict containing only
+# the helpers below (no Python builtins). All SmartQuery names (including FUNCTIONS)
+# are resolved through VMState.names, just like Op.eval does.
+@dataclass
+class BytecodeProgram:
+    code: CodeType
+    consts: Dict[str, Any]
+    # defaults of eval, bound by SqParser.compile_bytecode (the functions and the value mode of the parser);
+    # they aren't pickled, see SqParser.compile_bytecode
+    functions: Mapping[str, Callable] = field(default_factory=lambda: BUILTINS, compare=False)
+    persistent_values: bool = field(default=False, compare=False)
+    program: Callable[[VMState], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        env: Dict[str, Any] = {
+            '__builtins__': {},
+            **_HELPERS,
+            **self.consts,
+        }
+        exec(self.code, env)  # pylint: disable=exec-used
+
+        self.program = env[PROGRAM_NAME]
+
+    def __reduce__(self):
+        # code objects aren't picklable, but can be marshalled
+        return _load_program, (marshal.dumps(self.code), self.consts)
+
+    def bind(self, functions: Mapping[str, Callable], persistent_values: bool) -> 'BytecodeProgram':
+        # the same program with other defaults of eval: unlike dataclasses.replace, which runs __post_init__,
+        # the executed module is shared instead of being executed once again
+        bound = cast(BytecodeProgram, object.__new__(BytecodeProgram))
+        bound.__dict__.update(self.__dict__, functions=functions, persistent_values=persistent_values)
+        return bound
+
+    def eval(
+        self,
+        names: Dict[str, Any] = None,
+        ast_names: Dict[str, Op] = None,
+        max_ops_evaluated: int = 100,
+        functions: Optional[Mapping[str, Callable]] = None,
+        persistent_values: Optional[bool] = None,
+    ) -> Any:
+        if functions is None:
+            functions = self.functions
+        if persistent_values is None:
+            persistent_values = self.persistent_values
+
+        state = make_state(
+            names=names,
+            ast_names=ast_names,
+            max_ops_evaluated=max_ops_evaluated,
+            functions=functions,
+            persistent_values=persistent_values,
+        )
+        if not persistent_values:
+            return self.program(state)
+
+        try:
+            return to_plain(self.program(state))
+        finally:
+            if names is not None:
+                plain_names(names)
+
+
+def _load_program(code: bytes, consts: Dict[str, Any]) -> BytecodeProgram:
+    return BytecodeProgram(code=marshal.loads(code), consts=consts)
+
+
+def compile_bytecode(
+    ast_: Optional[Op],
+    functions: Mapping[str, Callable] = BUILTINS,
+    persistent_values: bool = False,
+) -> BytecodeProgram:
+    gen = _CodeGen()
+    module = gen.module(ast_)
+
+    return BytecodeProgram(
+        code=compile(module, FILENAME, 'exec'),
+        consts=gen.consts,
+        functions=functions,
+        persistent_values=persistent_values,
+    )
+
+
+# ops accounting is the same as of Op.eval: Op.cost of a block is charged once per basic block
+# (a program line, a lazy branch of and/or/if-else or a lambda body)
+
+
+def _is_native(op: Op) -> bool:
+    if type(op) is UnaryOp:
+        return op.op in ('-', 'not')
+    elif type(op) is LambdaOp:
+        return all(isinstance(arg, NameOp) for arg in op.args)
+
+    return type(op) in (ValueOp, NameOp, BinOp, IfExprOp, SliceOp, CallOp, DictOp)
+
+
+def _load(names, name: str):
+    try:
+        return names[name]
+    except LookupError:
+        raise ParserError(f'Undefined variable {name}')
+
+
+def _call(names, name: str, *args):
+    try:
+        f = names[name]
+    except LookupError:
+        raise ParserError(f'Undefined function {name}')
+
+    return f(*args)
+
+
+def _slice(start, stop, step) -> slice:
+    return slice(
+        safe_cast(start, int),
+        safe_cast(stop, int),
+        safe_cast(step, int),
+    )
+
+
+def _lambda(state: VMState, arg_names: tuple, body: Callable[[], Any]) -> Callable:
+    names = state.names
+
+    def f(*args):
+        names.push_scope(dict(zip(arg_names, args)))
+        try:
+            return body()
+        finally:
+            names.pop_scope()
+
+    return f
+
+
+_HELPERS: Dict[str, Any] = {
+    '_charge': charge,
+    '_load': _load,
+    '_call': _call,
+    '_slice': _slice,
+    '_lambda': _lambda,
+    '_dict_key_cast': _dict_key_cast,
+    '_float_dict_key_cast': _float_dict_key_cast,
+    '_add': add,
+    '_mul': mul,
+    '_pow': power,
+    '_float_add': float_add,
+    '_float_mul': float_mul,
+    '_float_pow': float_power,
+}
+
+_STATE = '_s'
+_NAMES = '_n'
+_RESULT = '_r'
+_VALUE = '_v'
+
+_ARITHMETIC_OPS = {
+    '-': ast.Sub,
+    '/': ast.Div,
+}
+
+_HELPER_OPS = {
+    '+': '_add',
+    '*': '_mul',
+    '**': '_pow',
+}
+
+# numeric_mode='float'
+_FLOAT_HELPER_OPS = {
+    '+': '_float_add',
+    '*': '_float_mul',
+    '**': '_float_pow',
+}
+
+_COMPARE_OPS = {
+    '==': ast.Eq,
+    '!=': ast.NotEq,
+    '>': ast.Gt,
+    '<': ast.Lt,
+    '>=': ast.GtE,
+    '<=': ast.LtE,
+    'in': ast.In,
+    'not in': ast.NotIn,
+}
+
+_SHORT_OPS = {
+    '+=': ast.Add,
+    '-=': ast.Sub,
+    '*=': ast.Mult,
+    '/=': ast.Div,
+}
+
+
+def _load_name(name: str) -> ast.Name:
+    return ast.Name(id=name, ctx=ast.Load())
+
+
+def _store_name(name: str) -> ast.Name:
+    return ast.Name(id=name, ctx=ast.Store())
+
+
+def _call_helper(name: str, *args: ast.expr) -> ast.Call:
+    return ast.Call(func=_load_name(name), args=list(args), keywords=[])
+
+
+class _CodeGen:
+    def __init__(self):
+        self.consts: Dict[str, Any] = {}
+
+    def module(self, root: Optional[Op]) -> ast.Module:
+        body: List[ast.stmt] = [
+            ast.Assign(
+                targets=[_store_name(_NAMES)],
+                value=ast.Attribute(value=_load_name(_STATE), attr='names', ctx=ast.Load())),
+        ]
+
+        if root is None:
+            body.append(ast.Return(value=ast.Constant(value=None)))
+        elif type(root) is CodeOp:
+            body.append(self.charge_stmt(1))
+            body.append(ast.Assign(targets=[_store_name(_RESULT)], value=ast.Constant(value=None)))
+
+            for line in root.lines:
+                body.append(self.charge_stmt(line.cost))
+                body.extend(self.line(line))
+
+            body.append(ast.Return(value=_load_name(_RESULT)))
+        else:
+            body.append(self.charge_stmt(root.cost))
+            body.extend(self.line(root))
+            body.append(ast.Return(value=_load_name(_RESULT)))
+
+        func = ast.FunctionDef(
+            name=PROGRAM_NAME,
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=_STATE)],
+                vararg=None,
+                kwonlyargs=[],
+                kw_defaults=[],
+                kwarg=None,
+                defaults=[],
+            ),
+            body=body,
+            decorator_list=[],
+            returns=None,
+        )
+
+        return ast.fix_missing_locations(ast.Module(body=[func], type_ignores=[]))
+
+    def line(self, op: Op) -> List[ast.stmt]:
+        if type(op) is AssignOp:
+            return [
+                ast.Assign(
+                    targets=[self.names_item(op.name, ast.Store())],
+                    value=self.copy_value(op.value)),
+                ast.Assign(targets=[_store_name(_RESULT)], value=ast.Constant(value=None)),
+            ]
+        elif type(op) is ShortOp:
+            if op.op not in _SHORT_OPS:
+                raise ParserError(f'Unsupported short op: {op.op}')
+
+            return [
+                ast.Assign(
+                    targets=[_store_name(_VALUE)],
+                    value=self.copy_value(op.value)),
+                ast.AugAssign(
+                    target=self.names_item(op.name, ast.Store()),
+                    op=_SHORT_OPS[op.op](),
+                    value=_load_name(_VALUE)),
+                ast.Assign(targets=[_store_name(_RESULT)], value=ast.Constant(value=None)),
+            ]
+        elif type(op) is NoOp:
+            return [ast.Assign(targets=[_store_name(_RESULT)], value=ast.Constant(value=None))]
+
+        return [ast.Assign(targets=[_store_name(_RESULT)], value=self.expr(op))]
+
+    def charge_stmt(self, cost: int) -> ast.stmt:
+        return ast.Expr(value=self.charge(cost))
+
+    def charge(self, cost: int) -> ast.expr:
+        return _call_helper('_charge', _load_name(_STATE), ast.Constant(value=cost))
+
+    def charged(self, op: Op) -> ast.expr:
+        # `_charge(...) or expr` charges the block and evaluates to the value of expr
+        return ast.BoolOp(op=ast.Or(), values=[self.charge(op.cost), self.expr(op)])
+
+    def const(self, value: Any) -> ast.expr:
+        name = f'_k{len(self.consts)}'
+        self.consts[name] = value
+        return _load_name(name)
+
+    def names_item(self, name: str, ctx: ast.expr_context) -> ast.Subscript:
+        key: Any = ast.Constant(value=name)
+        if sys.version_info < (3, 9):
+            key = ast.Index(value=key)
+
+        return ast.Subscript(value=_load_name(_NAMES), slice=key, ctx=ctx)
+
+    def copy_value(self, op: Op) -> ast.Call:
+        # the copy of an assigned value depends on the state (see VMState.copy_value)
+        func = ast.Attribute(value=_load_name(_STATE), attr='copy_value', ctx=ast.Load())
+        return ast.Call(func=func, args=[self.expr(op)], keywords=[])
+
+    def expr(self, op: Op) -> ast.expr:
+        if not _is_native(op):
+            # not supported in expression context (e.g. custom Op subclasses): evaluate with Op.eval
+            return ast.Call(
+                func=ast.Attribute(value=self.const(op), attr='eval', ctx=ast.Load()),
+                args=[_load_name(_STATE)],
+                keywords=[])
+        elif type(op) is ValueOp:
+            return self.const(op.v)
+        elif type(op) is NameOp:
+            return _call_helper('_load', _load_name(_NAMES), ast.Constant(value=op.name))
+        elif type(op) is BinOp:
+            return self.binop(op)
+        elif type(op) is UnaryOp:
+            return ast.UnaryOp(op=ast.USub() if op.op == '-' else ast.Not(), operand=self.expr(op.op1))
+        elif type(op) is IfExprOp:
+            return ast.IfExp(test=self.expr(op.cond), body=self.charged(op.op1), orelse=self.charged(op.op2))
+        elif type(op) is SliceOp:
+            return _call_helper('_slice', self.expr(op.start), self.expr(op.stop), self.expr(op.step))
+        elif type(op) is CallOp:
+            return _call_helper(
+                '_call', _load_name(_NAMES), ast.Constant(value=op.name), *[self.expr(arg) for arg in op.args])
+        elif type(op) is LambdaOp:
+            body = ast.Lambda(
+                args=ast.arguments(
+                    posonlyargs=[], args=[], vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[]),
+                body=self.charged(op.expr))
+
+            return _call_helper(
+                '_lambda',
+                _load_name(_STATE),
+                ast.Constant(value=tuple(arg.name for arg in op.args)),
+                body)
+
+        return self.expr_dict(cast(DictOp, op))
+
+    def expr_dict(self, op: DictOp) -> ast.expr:
+        return ast.Dict(
+            keys=[
+                _call_helper('_float_dict_key_cast' if op.float_mode else '_dict_key_cast', self.expr(k))
+                for k, _ in op.d
+            ],
+            values=[self.expr(v) for _, v in op.d])
+
+    def binop(self, op: BinOp) -> ast.expr:
+        op1 = self.expr(op.op1)
+
+        if op.op in ('and', 'or'):
+            return ast.BoolOp(
+                op=ast.And() if op.op == 'and' else ast.Or(),
+                values=[op1, self.charged(op.op2)])
+
+        op2 = self.expr(op.op2)
+
+        if op.op in _HELPER_OPS:
+            return _call_helper((_FLOAT_HELPER_OPS if op.float_mode else _HELPER_OPS)[op.op], op1, op2)
+        elif op.op in _ARITHMETIC_OPS:
+            return ast.BinOp(left=op1, op=_ARITHMETIC_OPS[op.op](), right=op2)
+        elif op.op in _COMPARE_OPS:
+            return ast.Compare(left=op1, ops=[_COMPARE_OPS[op.op]()], comparators=[op2])
+
+        raise ParserError(f'Unsupported binary operation: {op.op}')
@@ -0,0 +1,349 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional, Type
+
+from smartquery.ast_ops import Op, NoOp, ValueOp, CodeOp, BinOp, UnaryOp, AssignOp, ShortOp, NameOp, IfExprOp, \
+    SliceOp, CallOp, DictOp, LambdaOp
+from smartquery.exceptions import ParserError, OpsExecutionLimitExceededError
+from smartquery.functions import BUILTINS, FUNCTIONS
+from smartquery.persistent import plain_names, to_plain
+from smartquery.utils import safe_cast
+from smartquery.vm_state import VMState, make_state
+
+
+Compiled = Callable[[VMState], Any]
+
+
+# Op tree lowered to nested Python closures: node types and operators are resolved once,
+# at compile time, while evaluation semantics (including ops accounting) stay the same as of Op.eval
+@dataclass
+class CompiledProgram:
+    code: Compiled
+    # defaults of eval, bound by SqParser.compile (the functions and the value mode of the parser)
+    functions: Mapping[str, Callable] = field(default_factory=lambda: BUILTINS)
+    persistent_values: bool = False
+
+    def eval(
+        self,
+        names: Dict[str, Any] = None,
+        ast_names: Dict[str, Op] = None,
+        max_ops_evaluated: int = 100,
+        functions: Optional[Mapping[str, Callable]] = None,
+        persistent_values: Optional[bool] = None,
+    ) -> Any:
+        if functions is None:
+            functions = self.functions
+        if persistent_values is None:
+            persistent_values = self.persistent_values
+
+        state = make_state(
+            names=names,
+            ast_names=ast_names,
+            max_ops_evaluated=max_ops_evaluated,
+            functions=functions,
+            persistent_values=persistent_values,
+        )
+        if not persistent_values:
+            return self.code(state)
+
+        try:
+            return to_plain(self.code(state))
+        finally:
+            if names is not None:
+                plain_names(names)
+
+
+def compile_program(
+    ast: Optional[Op],
+    functions: Mapping[str, Callable] = BUILTINS,
+    persistent_values: bool = False,
+) -> CompiledProgram:
+    code: Compiled = (lambda state: None) if ast is None else compile_op(ast)
+
+    return CompiledProgram(code=code, functions=functions, persistent_values=persistent_values)
+
+
+def compile_op(op: Op) -> Compiled:
+    compiler = _COMPILERS.get(type(op))
+    if compiler is None:
+        # unknown Op subclass: fallback to the tree-walking interpreter
+        return op.run
+
+    return compiler(op)
+
+
+def _limit_exceeded(state: VMState):
+    raise OpsExecutionLimitExceededError(f'Ops execution limit exceeded: {state.max_ops_evaluated}')
+
+
+def _compile_noop(op: NoOp) -> Compiled:
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+    return f
+
+
+def _compile_value(op: ValueOp) -> Compiled:
+    v = op.v
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        return v
+
+    return f
+
+
+def _compile_code(op: CodeOp) -> Compiled:
+    lines = tuple(compile_op(line) for line in op.lines)
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        res = None
+        for line in lines:
+            res = line(state)
+
+        return res
+
+    return f
+
+
+def _compile_binop(op: BinOp) -> Compiled:
+    op1 = compile_op(op.op1)
+    op2 = compile_op(op.op2)
+
+    if op.short_circuit is not None:
+        short_circuit = op.short_circuit
+
+        def f_lazy(state: VMState):
+            state.ops_evaluated += 1
+            if state.ops_evaluated >= state.max_ops_evaluated:
+                _limit_exceeded(state)
+
+            v1 = op1(state)
+            return v1 if bool(v1) is short_circuit else op2(state)
+
+        return f_lazy
+
+    binary_operator = op.f
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        v1 = op1(state)
+        return binary_operator(v1, op2(state))
+
+    return f
+
+
+def _compile_unary(op: UnaryOp) -> Compiled:
+    op1 = compile_op(op.op1)
+    unary_operator = op.f
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        return unary_operator(op1(state))
+
+    return f
+
+
+def _compile_assign(op: AssignOp) -> Compiled:
+    name = op.name
+    value = compile_op(op.value)
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        state.names[name] = state.copy_value(value(state))
+        return None
+
+    return f
+
+
+def _compile_short(op: ShortOp) -> Compiled:
+    name = op.name
+    value = compile_op(op.value)
+    short_operator = op.f
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        v = state.copy_value(value(state))
+        names = state.names
+        names[name] = short_operator(names[name], v)
+        return None
+
+    return f
+
+
+def _compile_name(op: NameOp) -> Compiled:
+    name = op.name
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        try:
+            return state.names[name]
+        except LookupError:
+            raise ParserError(f'Undefined variable {name}')
+
+    return f
+
+
+def _compile_if_expr(op: IfExprOp) -> Compiled:
+    cond = compile_op(op.cond)
+    op1 = compile_op(op.op1)
+    op2 = compile_op(op.op2)
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        return op1(state) if cond(state) else op2(state)
+
+    return f
+
+
+def _compile_slice(op: SliceOp) -> Compiled:
+    start = compile_op(op.start)
+    stop = compile_op(op.stop)
+    step = compile_op(op.step)
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        return slice(
+            safe_cast(start(state), int),
+            safe_cast(stop(state), int),
+            safe_cast(step(state), int),
+        )
+
+    return f
+
+
+def _compile_call(op: CallOp) -> Compiled:
+    if op.pattern is not None:
+        return _compile_regex_call(op)
+
+    name = op.name
+    args = tuple(compile_op(arg) for arg in op.args)
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        arg_values = [arg(state) for arg in args]
+        try:
+            func = state.names[name]
+        except LookupError:
+            raise ParserError(f'Undefined function {name}')
+
+        return func(*arg_values)
+
+    return f
+
+
+def _compile_regex_call(op: CallOp) -> Compiled:
+    name = op.name
+    args = tuple(compile_op(arg) for arg in op.args)
+    pattern = op.pattern
+    builtin = FUNCTIONS[name]
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        arg_values = [arg(state) for arg in args]
+        try:
+            func = state.names[name]
+        except LookupError:
+            raise ParserError(f'Undefined function {name}')
+
+        if func is builtin:
+            arg_values[1] = pattern
+
+        return func(*arg_values)
+
+    return f
+
+
+def _compile_dict(op: DictOp) -> Compiled:
+    items = tuple((compile_op(k), compile_op(v)) for k, v in op.d)
+    key_cast = op.key_cast
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        return {
+            key_cast(k(state)): v(state) for k, v in items
+        }
+
+    return f
+
+
+def _compile_lambda(op: LambdaOp) -> Compiled:
+    for arg in op.args:
+        if not isinstance(arg, NameOp):
+            raise ParserError(f'Lambda argument is not a name: {arg}')
+
+    arg_names = tuple(arg.name for arg in op.args)
+    expr = compile_op(op.expr)
+
+    def f(state: VMState):
+        state.ops_evaluated += 1
+        if state.ops_evaluated >= state.max_ops_evaluated:
+            _limit_exceeded(state)
+
+        names = state.names
+
+        def func(*args):
+            names.push_scope(dict(zip(arg_names, args)))
+            try:
+                return expr(state)
+            finally:
+                names.pop_scope()
+
+        return func
+
+    return f
+
+
+_COMPILERS: Dict[Type[Op], Callable[[Any], Compiled]] = {
+    NoOp: _compile_noop,
+    ValueOp: _compile_value,
+    CodeOp: _compile_code,
+    BinOp: _compile_binop,
+    UnaryOp: _compile_unary,
+    AssignOp: _compile_assign,
+    ShortOp: _compile_short,
+    NameOp: _compile_name,
+    IfExprOp: _compile_if_expr,
+    SliceOp: _compile_slice,
+    CallOp: _compile_call,
+    DictOp: _compile_dict,
+    LambdaOp: _compile_lambda,
+}
@@ -5,3 +5,11 @@ class ParserError(Exception):
 
 class OpsExecutionLimitExceededError(ParserError):
     pass
+
+
+class ExecutionTimeoutError(ParserError):
+    pass
+
+
+class WorkerCrashedError(ParserError):
+    pass
@@ -0,0 +1,377 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing import reduction
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from typing import Any, Dict, Optional, Set, Tuple, cast
+
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import sys
+import threading
+import traceback
+
+from smartquery.exceptions import ExecutionTimeoutError, ParserError, WorkerCrashedError
+from smartquery.sq_parser import SqParser
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
+
+
+# SqExecutor runs SqParser.eval in pre-forked worker processes, so a script can't block
+# or exhaust memory of the calling process:
+# - timeout: seconds per script, after which its worker is killed and ExecutionTimeoutError is raised
+# - max_memory: bytes of address space per worker (RLIMIT_AS), allocations above it raise MemoryError
+# - max_rss: bytes of RSS a worker may gain over its RSS right after the fork (pages inherited from the caller
+#   don't count), after which it's replaced once it finishes the current script
+# - max_tasks_per_worker: number of scripts, after which a worker is replaced
+# Tasks and results are pickled and sent over pipes. Unlike SqParser.eval, assignments of a script to names
+# aren't propagated back to the caller's dict: the worker gets a copy of names, and only the result is returned.
+#
+# Workers are forked by a fork server: a single threaded process, which SqExecutor() forks before it starts
+# any threads of its own. A fork copies locks in their current state, but only the forking thread, so a worker
+# forked by the caller could inherit a lock held by another thread for good (e.g. of LRUCache, interning
+# or regex_cache); the fork server has no other threads. The parser is inherited as of SqExecutor().
+
+
+def _limit_memory(max_memory: Optional[int]):
+    if max_memory is None or resource is None:
+        return
+
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+class _Rss:
+    # current RSS of the process: /proc/self/statm on Linux, otherwise the peak RSS
+    def __init__(self):
+        try:
+            self._statm: Optional[int] = os.open('/proc/self/statm', os.O_RDONLY)
+        except OSError:  # pragma: no cover
+            self._statm = None
+
+    def __call__(self) -> int:
+        if self._statm is not None:
+            return int(os.pread(self._statm, 256, 0).split()[1]) * _PAGE_SIZE
+
+        if resource is None:  # pragma: no cover
+            return 0
+
+        # ru_maxrss is in kilobytes on Linux, and in bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # pragma: no cover
+        return rss if sys.platform == 'darwin' else rss * 1024  # pragma: no cover
+
+
+def _dumps_error(e: Exception) -> bytes:
+    try:
+        return pickle.dumps((False, e), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:  # pylint: disable=broad-except
+        return pickle.dumps((False, ParserError(f'{type(e).__name__}: {e}')), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _worker_main(conn: Connection, parser: Optional[SqParser], max_memory: Optional[int]):
+    if parser is None:
+        parser = SqParser()
+
+    _limit_memory(max_memory)
+
+    rss = _Rss()
+    initial_rss = rss()
+
+    while True:
+        try:
+            task = conn.recv_bytes()
+        except EOFError:
+            return
+
+        try:
+            expr, names, max_ops_evaluated = pickle.loads(task)
+            res = parser.eval(expr, names=names, max_ops_evaluated=max_ops_evaluated)
+        except Exception as e:  # pylint: disable=broad-except
+            data = _dumps_error(e)
+        else:
+            try:
+                data = pickle.dumps((True, res), protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:  # pylint: disable=broad-except
+                data = _dumps_error(ParserError(f'Unable to serialize the result: {e}'))
+
+        rss_growth = max(rss() - initial_rss, 0)
+        conn.send_bytes(data + rss_growth.to_bytes(8, 'little'))
+
+
+def _exit_code(status: int) -> int:
+    # as Process.exitcode: negative signal number of a killed process
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+
+    return os.WEXITSTATUS(status)
+
+
+def _fork_server_main(
+    conn: Connection, parent_conn: Connection, parser: Optional[SqParser], max_memory: Optional[int],
+):
+    # requests: ('fork',) followed by the handle of the worker's end of its pipe, answered with the pid;
+    # ('kill', pid), answered with the exit code (None for an unknown pid).
+    # The inherited end of the executor is closed, so the server gets EOF once the executor is closed or gone.
+    parent_conn.close()
+    workers: Set[int] = set()
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+
+        if request[0] == 'fork':
+            fd: int = reduction.recv_handle(conn)  # type: ignore
+
+            pid = os.fork()
+            if pid == 0:
+                conn.close()
+                code = 1
+                try:
+                    _worker_main(Connection(fd), parser, max_memory)
+                    code = 0
+                except BaseException:  # pylint: disable=broad-except
+                    traceback.print_exc()
+                finally:
+                    sys.stderr.flush()
+                    os._exit(code)  # pylint: disable=protected-access
+
+            os.close(fd)
+            workers.add(pid)
+            conn.send(pid)
+        else:
+            pid = request[1]
+            # workers are reaped here only, so the pid can't belong to another process yet
+            conn.send(_kill(pid) if pid in workers else None)
+            workers.discard(pid)
+
+    for pid in workers:
+        _kill(pid)
+
+
+def _kill(pid: int) -> int:
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:  # pragma: no cover
+        pass
+
+    return _exit_code(os.waitpid(pid, 0)[1])
+
+
+class _ForkServer:
+    def __init__(self, context: BaseContext, parser: Optional[SqParser], max_memory: Optional[int]):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_fork_server_main,
+            args=(child_conn, self.conn, parser, max_memory),
+            daemon=True)
+        self.process.start()
+        child_conn.close()
+
+        # requests of the threads of submit() are sent one at a time
+        self._lock = threading.Lock()
+
+    def start(self) -> Tuple[Connection, int]:
+        conn, child_conn = multiprocessing.Pipe()
+        try:
+            with self._lock:
+                self.conn.send(('fork',))
+                reduction.send_handle(self.conn, child_conn.fileno(), self.process.pid)
+                pid = self.conn.recv()
+        finally:
+            child_conn.close()
+
+        return conn, pid
+
+    def kill(self, pid: int) -> Optional[int]:
+        with self._lock:
+            self.conn.send(('kill', pid))
+            return self.conn.recv()
+
+    def close(self):
+        # the server kills the workers left, if any, and exits
+        self.conn.close()
+        self.process.join()
+
+
+class _Spawner:  # pragma: no cover
+    # no fork (e.g. on Windows): every worker is a new interpreter, which builds its own parser
+    def __init__(self, context: BaseContext, max_memory: Optional[int]):
+        self.context = context
+        self.max_memory = max_memory
+        self.processes: Dict[int, Any] = {}
+
+    def start(self) -> Tuple[Connection, int]:
+        conn, child_conn = self.context.Pipe()
+        process = self.context.Process(target=_worker_main, args=(child_conn, None, self.max_memory), daemon=True)
+        process.start()
+        child_conn.close()
+
+        pid = cast(int, process.pid)
+        self.processes[pid] = process
+        return conn, pid
+
+    def kill(self, pid: int) -> Optional[int]:
+        process = self.processes.pop(pid, None)
+        if process is None:
+            return None
+
+        if process.is_alive():
+            process.kill()
+        process.join()
+        return process.exitcode
+
+    def close(self):
+        pass
+
+
+class _Worker:
+    def __init__(self, starter: Any):
+        self.starter = starter
+        self.conn, self.pid = starter.start()
+        self.tasks = 0
+
+    def run(self, task: bytes, timeout: Optional[float]) -> bytes:
+        self.tasks += 1
+
+        try:
+            # a worker, which died since its last task, fails the send (BrokenPipeError) or the receive (EOFError)
+            self.conn.send_bytes(task)
+            if self.conn.poll(timeout):
+                return self.conn.recv_bytes()
+        except (EOFError, OSError):
+            code = self.kill()
+            raise WorkerCrashedError(f'Worker exited with code {code}')
+
+        self.kill()
+        raise ExecutionTimeoutError(f'Script execution took more than {timeout} seconds')
+
+    def kill(self) -> Optional[int]:
+        self.conn.close()
+        return self.starter.kill(self.pid)
+
+
+class SqExecutor:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_memory: Optional[int] = None,
+        max_rss: Optional[int] = None,
+        max_tasks_per_worker: Optional[int] = None,
+        parser: Optional[SqParser] = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.max_rss = max_rss
+        self.max_tasks_per_worker = max_tasks_per_worker
+
+        self._parser = parser if parser is not None else SqParser()
+
+        # the fork server is forked first, before the executor has any threads
+        self._starter: Any
+        if 'fork' in multiprocessing.get_all_start_methods():
+            self._starter = _ForkServer(multiprocessing.get_context('fork'), self._parser, max_memory)
+        else:  # pragma: no cover
+            self._starter = _Spawner(multiprocessing.get_context(), max_memory)
+
+        self._idle: 'queue.Queue[_Worker]' = queue.Queue()
+        self._all: Dict[int, _Worker] = {}
+        self._lock = threading.Lock()
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+        for _ in range(self.workers):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._starter)
+        with self._lock:
+            self._all[id(worker)] = worker
+
+        return worker
+
+    def _retire(self, worker: _Worker):
+        worker.kill()
+        with self._lock:
+            self._all.pop(id(worker), None)
+
+    def eval(
+        self,
+        expr: str,
+        names: Dict[str, Any] = None,
+        max_ops_evaluated: int = 100,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        if self._closed:
+            raise RuntimeError('SqExecutor is closed')
+
+        task = pickle.dumps((expr, names, max_ops_evaluated), protocol=pickle.HIGHEST_PROTOCOL)
+        timeout = timeout if timeout is not None else self.timeout
+
+        worker = self._idle.get()
+        try:
+            data = worker.run(task, timeout)
+        except BaseException:
+            self._retire(worker)
+            self._idle.put(self._spawn())
+            raise
+
+        rss_growth = int.from_bytes(data[-8:], 'little')
+        if (
+            (self.max_tasks_per_worker is not None and worker.tasks >= self.max_tasks_per_worker)
+            or (self.max_rss is not None and rss_growth > self.max_rss)
+        ):
+            self._retire(worker)
+            worker = self._spawn()
+
+        self._idle.put(worker)
+
+        ok, res = pickle.loads(data[:-8])
+        if not ok:
+            raise res
+
+        return res
+
+    def submit(
+        self,
+        expr: str,
+        names: Dict[str, Any] = None,
+        max_ops_evaluated: int = 100,
+        timeout: Optional[float] = None,
+    ) -> 'Future[Any]':
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.workers)
+
+        return self._threads.submit(self.eval, expr, names, max_ops_evaluated, timeout)
+
+    def close(self):
+        self._closed = True
+
+        if self._threads is not None:
+            self._threads.shutdown(wait=True)
+
+        with self._lock:
+            workers = list(self._all.values())
+            self._all.clear()
+
+        for worker in workers:
+            worker.kill()
+
+        self._starter.close()
+
+    def __enter__(self) -> 'SqExecutor':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,4 +1,5 @@
-from typing import Any, Callable, Iterable, Union, Optional, List, Dict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Union, Optional, List, Dict, Mapping, Tuple
 
 import functools
 
@@ -10,26 +11,45 @@ from decimal import Decimal as Decimal_
 
 import regex
 
+from smartquery.cache import LRUCache
 from smartquery.custom_types import Decimal
 from smartquery.exceptions import ParserError
+from smartquery.operators import float_str, short_operator
+from smartquery.persistent import PList, PDict
+from smartquery.values import copy_value
 
 
 REGEX_TIMEOUT = 0.05
+REGEX_CACHE_SIZE = 4096
 MAX_ARRAY_SIZE = 10000
 CAST_DICT_KEYS_TO_STRINGS = True  # for JSON serialisation compatability
 
+# plain and persistent (see persistent.py) containers
+LIST_TYPES = (list, PList)
+DICT_TYPES = (dict, PDict)
 
-def pretty(value: Any, sep=...) -> str:
-    if isinstance(value, dict):
+
+def _to_str(float_mode: bool) -> Callable[[Any], str]:
+    # numeric_mode='float' prints integral floats as ints (see float_str)
+    if float_mode:
+        return float_str
+
+    return str
+
+
+def pretty(value: Any, sep=..., *, float_mode: bool = False) -> str:
+    to_str = _to_str(float_mode)
+
+    if isinstance(value, DICT_TYPES):
         if sep is ...:
             sep = '\n'
 
-        return sep.join([f'{k}: {v}' for k, v in value.items()])
-    elif isinstance(value, list):
+        return sep.join([f'{k}: {to_str(v)}' for k, v in value.items()])
+    elif isinstance(value, LIST_TYPES):
         if sep is ...:
             sep = ', '
 
-        return sep.join([str(v) for v in value])
+        return sep.join([to_str(v) for v in value])
     elif isinstance(value, Decimal_):
         if sep is ...:
             sep = ' '
@@ -53,7 +73,7 @@ def pretty(value: Any, sep=...) -> str:
         else:
             return f'-{sep.join(chunks)}'
     else:
-        return str(value)
+        return to_str(value)
 
 
 def keys(value: Any) -> list:
@@ -69,22 +89,22 @@ def items(value: Any) -> list:
 
 
 def _sum(value: Any) -> Any:
-    if isinstance(value, list):
+    if isinstance(value, LIST_TYPES):
         return sum(value)
     else:
         return value
 
 
-def _get(container: Any, key: Any, default=None) -> Any:
-    key = _key_cast(container, key)
+def _get(container: Any, key: Any, default=None, *, float_mode: bool = False) -> Any:
+    key = _key_cast(container, key, float_mode)
     return container.get(key, default)
 
 
-def _key_cast(container: Any, key: Any) -> Any:
-    if isinstance(container, dict):
-        return _dict_key_cast(key)
+def _key_cast(container: Any, key: Any, float_mode: bool = False) -> Any:
+    if isinstance(container, DICT_TYPES):
+        return _float_dict_key_cast(key) if float_mode else _dict_key_cast(key)
     else:
-        return _list_key_cast(key)
+        return _float_list_key_cast(key) if float_mode else _list_key_cast(key)
 
 
 def _list_key_cast(key: Any) -> Any:
@@ -104,8 +124,24 @@ def _dict_key_cast(key: Any) -> Any:
     return key
 
 
-def _get_item(container: Any, key: Any) -> Any:
-    key = _key_cast(container, key)
+# numeric_mode='float': numbers are floats, so indexes are cast to int,
+# and integral keys are the same as in decimal mode (i.e. {1: v} has the key '1' or 1, not '1.0' or 1.0)
+def _float_list_key_cast(key: Any) -> Any:
+    if isinstance(key, float):
+        return int(key)
+
+    return _list_key_cast(key)
+
+
+def _float_dict_key_cast(key: Any) -> Any:
+    if isinstance(key, float) and key.is_integer():
+        key = int(key)
+
+    return _dict_key_cast(key)
+
+
+def _get_item(container: Any, key: Any, *, float_mode: bool = False) -> Any:
+    key = _key_cast(container, key, float_mode)
 
     try:
         return container[key]
@@ -113,10 +149,10 @@ def _get_item(container: Any, key: Any) -> Any:
         raise ParserError(f'Key error \'{key}\'')
 
 
-def _del(container: Any, key: Any) -> Any:
-    key = _key_cast(container, key)
+def _del(container: Any, key: Any, *, float_mode: bool = False) -> Any:
+    key = _key_cast(container, key, float_mode)
 
-    if isinstance(container, dict):
+    if isinstance(container, DICT_TYPES):
         if key in container:
             del container[key]
     else:
@@ -124,41 +160,32 @@ def _del(container: Any, key: Any) -> Any:
             del container[key]
 
 
-def _set(container: Any, key: Any, value: Any) -> Any:
+def _set(container: Any, key: Any, value: Any, *, float_mode: bool = False) -> Any:
     _check_array_size(container)
 
-    key = _key_cast(container, key)
+    key = _key_cast(container, key, float_mode)
 
-    container[key] = copy.deepcopy(value)
+    container[key] = copy_value(value)
     return value
 
 
-def _set_with_op(container: Any, key: Any, op: str, value: Any) -> Any:
+def _set_with_op(container: Any, key: Any, op: str, value: Any, *, float_mode: bool = False) -> Any:
     _check_array_size(container)
 
-    key = _key_cast(container, key)
-    value = copy.deepcopy(value)
-
-    if op == '+=':
-        container[key] += value
-    elif op == '-=':
-        container[key] -= value
-    elif op == '*=':
-        container[key] *= value
-    elif op == '/=':
-        container[key] /= value
-    else:
-        raise ParserError(f'Unsupported short op: {op}')
+    key = _key_cast(container, key, float_mode)
+    value = copy_value(value)
+
+    container[key] = short_operator(op)(container[key], value)
 
     return value
 
 
 def _map(container: Any, f: Callable) -> Any:
-    if isinstance(container, (list, str)):
+    if isinstance(container, (*LIST_TYPES, str)):
         return [
             f(v) for v in container
         ]
-    elif isinstance(container, dict):
+    elif isinstance(container, DICT_TYPES):
         return [
             f(k, v) for k, v in container.items()
         ]
@@ -167,7 +194,7 @@ def _map(container: Any, f: Callable) -> Any:
 
 
 def _filter(container: Any, f: Callable) -> Any:
-    if isinstance(container, list):
+    if isinstance(container, LIST_TYPES):
         return list(filter(f, container))
 
     raise ParserError(f'{container} is not a list')
@@ -205,23 +232,31 @@ def _replace(s: str, old: str, new: str, count: int = -1):
     return s.replace(old, new, int(count))
 
 
-def _join(container: list, sep='\n'):
-    return sep.join(map(str, container))
+def _join(container: list, sep='\n', *, float_mode: bool = False):
+    return sep.join(map(_to_str(float_mode), container))
 
 
-def _rand(*args):
+def _random(number: Callable[[Any], Any], args: tuple):
     if len(args) == 0:
-        return Decimal(random.random())
-    elif len(args) == 1 and isinstance(args[0], list):
+        return number(random.random())
+    elif len(args) == 1 and isinstance(args[0], LIST_TYPES):
         return random.choice(args[0])
     elif len(args) == 2:
         min_ = args[0]
         max_ = args[1]
-        return Decimal(random.randint(min_, max_))
+        return number(random.randint(min_, max_))
 
     raise ParserError(f'Not supported rand() params: {args}')
 
 
+def _rand(*args):
+    return _random(Decimal, args)
+
+
+def _float_rand(*args):
+    return _random(float, args)
+
+
 def _parse_flags(flags_str: Optional[str]):
     if not flags_str:
         return 0
@@ -241,9 +276,38 @@ def _parse_flags(flags_str: Optional[str]):
     return flags
 
 
+if TYPE_CHECKING:
+    from regex import Pattern
+else:
+    # regex.Pattern is missing in older versions of regex
+    Pattern = type(regex.compile(''))
+
+# compiled patterns by (pattern, flags_str): the internal cache of regex is small and shared with everything else;
+# hit rate is in regex_cache.stats
+regex_cache: LRUCache[Tuple[str, Optional[str]], Pattern] = LRUCache(max_entries=REGEX_CACHE_SIZE)
+
+REGEX_FUNCTIONS = ('match', 'match_groups', 'match_all')
+
+
+def compile_pattern(pattern: str, flags_str: Optional[str] = None) -> Pattern:
+    return regex.compile(pattern, _parse_flags(flags_str))
+
+
+def _pattern(pattern: Union[str, Pattern], flags_str: Optional[str]) -> Pattern:
+    if type(pattern) is Pattern:
+        # compiled from a literal at parse time (see CallOp)
+        return pattern
+
+    key = (pattern, flags_str)
+    compiled = regex_cache.get(key)
+    if compiled is None:
+        compiled = regex_cache[key] = compile_pattern(pattern, flags_str)
+
+    return compiled
+
+
 def _match(s: str, pattern: str, flags_str: str = None):
-    flags = _parse_flags(flags_str)
-    m = regex.search(pattern, s, flags=flags, timeout=REGEX_TIMEOUT)
+    m = _pattern(pattern, flags_str).search(s, timeout=REGEX_TIMEOUT)
     if m is None:
         return None
 
@@ -251,8 +315,7 @@ def _match(s: str, pattern: str, flags_str: str = None):
 
 
 def _match_groups(s: str, pattern: str, flags_str: str = None):
-    flags = _parse_flags(flags_str)
-    m = regex.search(pattern, s, flags=flags, timeout=REGEX_TIMEOUT)
+    m = _pattern(pattern, flags_str).search(s, timeout=REGEX_TIMEOUT)
     if m is None:
         return None
 
@@ -260,8 +323,7 @@ def _match_groups(s: str, pattern: str, flags_str: str = None):
 
 
 def _match_all(s: str, pattern: str, flags_str: str = None):
-    flags = _parse_flags(flags_str)
-    return regex.findall(pattern, s, flags=flags, timeout=REGEX_TIMEOUT)
+    return _pattern(pattern, flags_str).findall(s, timeout=REGEX_TIMEOUT)
 
 
 def _push(arr: list, v: Any):
@@ -276,7 +338,7 @@ def _insert(arr: list, i: Any, v: Any):
 
 def _remove(container: Union[list, dict], v: Any):
     try:
-        if isinstance(container, list):
+        if isinstance(container, LIST_TYPES):
             container.remove(v) if v in container else None
         else:
             if v in container:
@@ -293,7 +355,7 @@ def _pop(arr: list, i: Optional[int] = None):
 
 
 def _sorted(container: Union[list, dict], key: Any = None, reverse: bool = False):
-    if isinstance(container, dict):
+    if isinstance(container, DICT_TYPES):
         if isinstance(key, Callable):  # type: ignore
             return dict(sorted(
                 container.items(),
@@ -311,6 +373,12 @@ def _reversed(container: Union[list, str]):
         return list(reversed(container))
 
 
+def _round(v: Any, nd: Any = None) -> Decimal:
+    res = round(v, int(nd) if nd is not None else None)
+    # Decimals and ints are wrapped as is, while floats are converted by their shortest repr (i.e. 0.67, not 0.6700...)
+    return Decimal(str(res)) if isinstance(res, float) else Decimal(res)
+
+
 def _check_array_size(arr: Union[list, dict]):
     if len(arr) >= MAX_ARRAY_SIZE:
         raise ParserError(f'Array size overflow: {MAX_ARRAY_SIZE}')
@@ -356,9 +424,9 @@ FUNCTIONS: Dict[str, Callable] = {
     'split': _split,
 
     # math:
-    'round': lambda v, nd=None: Decimal(str(round(v, int(nd) if nd is not None else None))),
-    'floor': lambda *args: Decimal(str(math.floor(*args))),
-    'ceil': lambda *args: Decimal(str(math.ceil(*args))),
+    'round': _round,
+    'floor': lambda *args: Decimal(math.floor(*args)),
+    'ceil': lambda *args: Decimal(math.ceil(*args)),
     'abs': lambda v: Decimal(abs(v)),
     'min': min,
     'max': max,
@@ -376,3 +444,28 @@ FUNCTIONS: Dict[str, Callable] = {
     'shuffle': _shuffle,
     'index_of': _index_of,
 }
+
+# functions of numeric_mode='float' (see SqParser): math functions return native floats instead of Decimals,
+# and float keys and indexes are cast as Decimals are
+FLOAT_FUNCTIONS: Dict[str, Callable] = {
+    **FUNCTIONS,
+    'str': float_str,
+    'pretty': functools.partial(pretty, float_mode=True),
+    'join': functools.partial(_join, float_mode=True),
+    'get': functools.partial(_get, float_mode=True),
+    '__getitem__': functools.partial(_get_item, float_mode=True),
+    '__delitem__': functools.partial(_del, float_mode=True),
+    '__setitem__': functools.partial(_set, float_mode=True),
+    '__setitem_with_op__': functools.partial(_set_with_op, float_mode=True),
+    'int': lambda v: float(int(v)),
+    'float': float,
+    'round': lambda v, nd=None: float(round(v, int(nd) if nd is not None else None)),
+    'floor': lambda *args: float(math.floor(*args)),
+    'ceil': lambda *args: float(math.ceil(*args)),
+    'abs': abs,
+    'rand': _float_rand,
+}
+
+# read-only root scope of every evaluation, shared instead of copying FUNCTIONS per eval
+BUILTINS: Mapping[str, Callable] = MappingProxyType(FUNCTIONS)
+FLOAT_BUILTINS: Mapping[str, Callable] = MappingProxyType(FLOAT_FUNCTIONS)
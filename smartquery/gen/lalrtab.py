@@ -0,0 +1,429 @@
+# lalrtab.py
+# This file is automatically generated by `python -m smartquery.lalr`. Do not edit.
+# pylint: skip-file
+SIGNATURE = ('leftASSIGNleftSHORT_OPleftORleftANDnonassocEQNEGTLTGTELTEINleftPLUSMINUSleftTIMESDIVIDErightPOWERleftPIPEleftDOTrightNOTrightUMINUSleftLBRACKETAND '
+ 'ASSIGN BREAK COLON COMMA COMMENT CONTINUE DEF DEL DIVIDE DOT ELIF ELSE EQ FALSE FOR GT GTE IF IN LAMBDA LBRACE '
+ 'LBRACKET LPAREN LT LTE MINUS NAME NE NEWLINE NONE NOT NUMBER OR PIPE PLUS POWER RAISE RBRACE RBRACKET RPAREN '
+ 'SHORT_OP STRING TIMES TRUE WHILE code : line\n'
+ '             | code NEWLINE line line : statement  statement : expression statement :  statement : COMMENT  '
+ 'expression : FOR\n'
+ '                   | WHILE\n'
+ '                   | ELIF\n'
+ '                   | BREAK\n'
+ '                   | CONTINUE\n'
+ '                   | DEF\n'
+ '                   | RAISE expression : NUMBER  expression : STRING  statement : NAME ASSIGN expression  statement : '
+ 'NAME SHORT_OP expression  expression : NAME LPAREN arglist RPAREN\n'
+ '                   | NAME LPAREN arglist COMMA RPAREN\n'
+ '                   | NAME LPAREN RPAREN\n'
+ '     expression : expression DOT NAME LPAREN arglist RPAREN\n'
+ '                   | expression PIPE NAME LPAREN arglist RPAREN\n'
+ '                   | expression DOT NAME LPAREN arglist COMMA RPAREN\n'
+ '                   | expression PIPE NAME LPAREN arglist COMMA RPAREN\n'
+ '                   | expression DOT NAME LPAREN RPAREN\n'
+ '                   | expression PIPE NAME\n'
+ '     expression : NAME LAMBDA expression\n'
+ '                   | LPAREN arglist_def RPAREN LAMBDA expression\n'
+ '     dict_item : dict_item COMMA dict_item\n'
+ '                  | expression COLON expression\n'
+ '     expression : expression PLUS expression\n'
+ '                   | expression MINUS expression\n'
+ '                   | expression TIMES expression\n'
+ '                   | expression POWER expression\n'
+ '                   | expression DIVIDE expression\n'
+ '                   | expression EQ expression\n'
+ '                   | expression NE expression\n'
+ '                   | expression GT expression\n'
+ '                   | expression LT expression\n'
+ '                   | expression GTE expression\n'
+ '                   | expression LTE expression\n'
+ '                   | expression NOT IN expression\n'
+ '                   | expression IN expression\n'
+ '                   | expression AND expression\n'
+ '                   | expression OR expression\n'
+ '     expression : LBRACKET RBRACKET\n'
+ '                   | LBRACKET arglist RBRACKET\n'
+ '                   | LBRACKET arglist COMMA RBRACKET\n'
+ '     expression : LBRACE RBRACE\n'
+ '                   | LBRACE dict_item RBRACE\n'
+ '                   | LBRACE dict_item COMMA RBRACE\n'
+ '     slice : expression\n'
+ '              | COLON\n'
+ '              | expression COLON expression\n'
+ '              | expression COLON\n'
+ '              | COLON expression\n'
+ '              | expression COLON COLON\n'
+ '              | COLON expression COLON\n'
+ '              | COLON COLON expression\n'
+ '     expression : expression LBRACKET slice RBRACKET\n'
+ '                   | expression LBRACKET expression RBRACKET\n'
+ '     statement : DEL expression LBRACKET expression RBRACKET\n'
+ '     statement : expression LBRACKET expression RBRACKET ASSIGN expression\n'
+ '     statement : expression LBRACKET expression RBRACKET SHORT_OP expression\n'
+ '     expression : expression IF expression ELSE expression\n'
+ '     expression : MINUS expression %prec UMINUS  expression : LPAREN expression RPAREN expression : TRUE  expression '
+ ': FALSE  expression : NONE  expression : NOT expression  expression : NAME  arglist : arglist COMMA expression\n'
+ '                | expression\n'
+ '     arglist_def : arglist COMMA NAME\n'
+ '                    | NAME\n'
+ '    ')
+TERMINALS = ('$end', 'AND', 'ASSIGN', 'BREAK', 'COLON', 'COMMA', 'COMMENT', 'CONTINUE', 'DEF', 'DEL', 'DIVIDE', 'DOT', 'ELIF',
+ 'ELSE', 'EQ', 'FALSE', 'FOR', 'GT', 'GTE', 'IF', 'IN', 'LAMBDA', 'LBRACE', 'LBRACKET', 'LPAREN', 'LT', 'LTE', 'MINUS',
+ 'NAME', 'NE', 'NEWLINE', 'NONE', 'NOT', 'NUMBER', 'OR', 'PIPE', 'PLUS', 'POWER', 'RAISE', 'RBRACE', 'RBRACKET',
+ 'RPAREN', 'SHORT_OP', 'STRING', 'TIMES', 'TRUE', 'WHILE')
+NONTERMINALS = ('arglist', 'arglist_def', 'code', 'dict_item', 'expression', 'line', 'slice', 'statement')
+PRODUCTIONS = (("S'", None, 1), ('code', 'p_code', 1), ('code', 'p_code', 3), ('line', 'p_line', 1),
+ ('statement', 'p_statement_expr', 1), ('statement', 'p_statement_empty', 0), ('statement', 'p_statement_comment', 1),
+ ('expression', 'p_expression_reserved_unused', 1), ('expression', 'p_expression_reserved_unused', 1),
+ ('expression', 'p_expression_reserved_unused', 1), ('expression', 'p_expression_reserved_unused', 1),
+ ('expression', 'p_expression_reserved_unused', 1), ('expression', 'p_expression_reserved_unused', 1),
+ ('expression', 'p_expression_reserved_unused', 1), ('expression', 'p_expression_number', 1),
+ ('expression', 'p_expression_string', 1), ('statement', 'p_statement_assign', 3),
+ ('statement', 'p_statement_short_op', 3), ('expression', 'p_expression_call', 4),
+ ('expression', 'p_expression_call', 5), ('expression', 'p_expression_call', 3),
+ ('expression', 'p_expression_method_call', 6), ('expression', 'p_expression_method_call', 6),
+ ('expression', 'p_expression_method_call', 7), ('expression', 'p_expression_method_call', 7),
+ ('expression', 'p_expression_method_call', 5), ('expression', 'p_expression_method_call', 3),
+ ('expression', 'p_expression_lambda', 3), ('expression', 'p_expression_lambda', 5), ('dict_item', 'p_dict_item', 3),
+ ('dict_item', 'p_dict_item', 3), ('expression', 'p_expression_binop', 3), ('expression', 'p_expression_binop', 3),
+ ('expression', 'p_expression_binop', 3), ('expression', 'p_expression_binop', 3),
+ ('expression', 'p_expression_binop', 3), ('expression', 'p_expression_binop', 3),
+ ('expression', 'p_expression_binop', 3), ('expression', 'p_expression_binop', 3),
+ ('expression', 'p_expression_binop', 3), ('expression', 'p_expression_binop', 3),
+ ('expression', 'p_expression_binop', 3), ('expression', 'p_expression_binop', 4),
+ ('expression', 'p_expression_binop', 3), ('expression', 'p_expression_binop', 3),
+ ('expression', 'p_expression_binop', 3), ('expression', 'p_list_literal', 2), ('expression', 'p_list_literal', 3),
+ ('expression', 'p_list_literal', 4), ('expression', 'p_dict_literal', 2), ('expression', 'p_dict_literal', 3),
+ ('expression', 'p_dict_literal', 4), ('slice', 'p_slice', 1), ('slice', 'p_slice', 1), ('slice', 'p_slice', 3),
+ ('slice', 'p_slice', 2), ('slice', 'p_slice', 2), ('slice', 'p_slice', 3), ('slice', 'p_slice', 3),
+ ('slice', 'p_slice', 3), ('expression', 'p_getitem', 4), ('expression', 'p_getitem', 4), ('statement', 'p_delitem', 5),
+ ('statement', 'p_setitem', 6), ('statement', 'p_setitem_with_op', 6), ('expression', 'p_if_expr', 5),
+ ('expression', 'p_expression_uminus', 2), ('expression', 'p_expression_group', 3),
+ ('expression', 'p_expression_true', 1), ('expression', 'p_expression_false', 1),
+ ('expression', 'p_expression_none', 1), ('expression', 'p_expression_not', 2), ('expression', 'p_expression_name', 1),
+ ('arglist', 'p_arglist', 3), ('arglist', 'p_arglist', 1), ('arglist_def', 'p_arglist_def', 3),
+ ('arglist_def', 'p_arglist_def', 1))
+ACCEPT = 143
+ACTION = ((-5, 0, 0, 12, 0, 0, 5, 13, 14, 7, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 6, 0, -5, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (143, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0),
+ (-1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (-3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -3, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (-4, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 26, 0, 37, 39, 30, 0, 35, -4, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, 0, 0, 0, 0, 31, 0, 0),
+ (-6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -6, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (-72, -72, 45, 0, 0, 0, 0, 0, 0, 0, -72, -72, 0, 0, -72, 0, 0, -72, -72, -72, -72, 48, 0, -72, 47, -72, -72, -72, 0,
+  -72, -72, 0, -72, 0, -72, -72, -72, -72, 0, 0, 0, 0, 46, 0, -72, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 51, 0, 0, 17, 0, 22, 10),
+ (-7, -7, 0, 0, -7, -7, 0, 0, 0, 0, -7, -7, 0, -7, -7, 0, 0, -7, -7, -7, -7, 0, 0, -7, 0, -7, -7, -7, 0, -7, -7, 0, -7,
+  0, -7, -7, -7, -7, 0, -7, -7, -7, 0, 0, -7, 0, 0),
+ (-8, -8, 0, 0, -8, -8, 0, 0, 0, 0, -8, -8, 0, -8, -8, 0, 0, -8, -8, -8, -8, 0, 0, -8, 0, -8, -8, -8, 0, -8, -8, 0, -8,
+  0, -8, -8, -8, -8, 0, -8, -8, -8, 0, 0, -8, 0, 0),
+ (-9, -9, 0, 0, -9, -9, 0, 0, 0, 0, -9, -9, 0, -9, -9, 0, 0, -9, -9, -9, -9, 0, 0, -9, 0, -9, -9, -9, 0, -9, -9, 0, -9,
+  0, -9, -9, -9, -9, 0, -9, -9, -9, 0, 0, -9, 0, 0),
+ (-10, -10, 0, 0, -10, -10, 0, 0, 0, 0, -10, -10, 0, -10, -10, 0, 0, -10, -10, -10, -10, 0, 0, -10, 0, -10, -10, -10, 0,
+  -10, -10, 0, -10, 0, -10, -10, -10, -10, 0, -10, -10, -10, 0, 0, -10, 0, 0),
+ (-11, -11, 0, 0, -11, -11, 0, 0, 0, 0, -11, -11, 0, -11, -11, 0, 0, -11, -11, -11, -11, 0, 0, -11, 0, -11, -11, -11, 0,
+  -11, -11, 0, -11, 0, -11, -11, -11, -11, 0, -11, -11, -11, 0, 0, -11, 0, 0),
+ (-12, -12, 0, 0, -12, -12, 0, 0, 0, 0, -12, -12, 0, -12, -12, 0, 0, -12, -12, -12, -12, 0, 0, -12, 0, -12, -12, -12, 0,
+  -12, -12, 0, -12, 0, -12, -12, -12, -12, 0, -12, -12, -12, 0, 0, -12, 0, 0),
+ (-13, -13, 0, 0, -13, -13, 0, 0, 0, 0, -13, -13, 0, -13, -13, 0, 0, -13, -13, -13, -13, 0, 0, -13, 0, -13, -13, -13, 0,
+  -13, -13, 0, -13, 0, -13, -13, -13, -13, 0, -13, -13, -13, 0, 0, -13, 0, 0),
+ (-14, -14, 0, 0, -14, -14, 0, 0, 0, 0, -14, -14, 0, -14, -14, 0, 0, -14, -14, -14, -14, 0, 0, -14, 0, -14, -14, -14, 0,
+  -14, -14, 0, -14, 0, -14, -14, -14, -14, 0, -14, -14, -14, 0, 0, -14, 0, 0),
+ (-15, -15, 0, 0, -15, -15, 0, 0, 0, 0, -15, -15, 0, -15, -15, 0, 0, -15, -15, -15, -15, 0, 0, -15, 0, -15, -15, -15, 0,
+  -15, -15, 0, -15, 0, -15, -15, -15, -15, 0, -15, -15, -15, 0, 0, -15, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 57, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 60, 0, 0, 0, 17, 0, 22, 10),
+ (-68, -68, 0, 0, -68, -68, 0, 0, 0, 0, -68, -68, 0, -68, -68, 0, 0, -68, -68, -68, -68, 0, 0, -68, 0, -68, -68, -68, 0,
+  -68, -68, 0, -68, 0, -68, -68, -68, -68, 0, -68, -68, -68, 0, 0, -68, 0, 0),
+ (-69, -69, 0, 0, -69, -69, 0, 0, 0, 0, -69, -69, 0, -69, -69, 0, 0, -69, -69, -69, -69, 0, 0, -69, 0, -69, -69, -69, 0,
+  -69, -69, 0, -69, 0, -69, -69, -69, -69, 0, -69, -69, -69, 0, 0, -69, 0, 0),
+ (-70, -70, 0, 0, -70, -70, 0, 0, 0, 0, -70, -70, 0, -70, -70, 0, 0, -70, -70, -70, -70, 0, 0, -70, 0, -70, -70, -70, 0,
+  -70, -70, 0, -70, 0, -70, -70, -70, -70, 0, -70, -70, -70, 0, 0, -70, 0, 0),
+ (-5, 0, 0, 12, 0, 0, 5, 13, 14, 7, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 6, 0, -5, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 66, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 67, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 68, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 88, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 90, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, 0, 0, 0, 0, 31, 0, 0),
+ (-72, -72, 0, 0, -72, -72, 0, 0, 0, 0, -72, -72, 0, -72, -72, 0, 0, -72, -72, -72, -72, 48, 0, -72, 47, -72, -72, -72,
+  0, -72, -72, 0, -72, 0, -72, -72, -72, -72, 0, -72, -72, -72, 0, 0, -72, 0, 0),
+ (-46, -46, 0, 0, -46, -46, 0, 0, 0, 0, -46, -46, 0, -46, -46, 0, 0, -46, -46, -46, -46, 0, 0, -46, 0, -46, -46, -46, 0,
+  -46, -46, 0, -46, 0, -46, -46, -46, -46, 0, -46, -46, -46, 0, 0, -46, 0, 0),
+ (0, 0, 0, 0, 0, 92, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 91, 0, 0, 0, 0, 0, 0),
+ (0, 42, 0, 0, 0, -74, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, -74, -74, 0, 0, 31, 0, 0),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 94, 0, 0, 0, 0, 0),
+ (0, 42, 0, 0, 0, -74, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, 0, 95, 0, 0, 31, 0, 0),
+ (0, 0, 0, 0, 0, 96, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (0, -72, 0, 0, 0, -72, 0, 0, 0, 0, -72, -72, 0, 0, -72, 0, 0, -72, -72, -72, -72, 48, 0, -72, 47, -72, -72, -72, 0,
+  -72, 0, 0, -72, 0, -72, -72, -72, -72, 0, 0, 0, -72, 0, 0, -72, 0, 0),
+ (-66, -66, 0, 0, -66, -66, 0, 0, 0, 0, -66, -66, 0, -66, -66, 0, 0, -66, -66, -66, -66, 0, 0, 93, 0, -66, -66, -66, 0,
+  -66, -66, 0, -66, 0, -66, -66, -66, -66, 0, -66, -66, -66, 0, 0, -66, 0, 0),
+ (-71, -71, 0, 0, -71, -71, 0, 0, 0, 0, -71, -71, 0, -71, -71, 0, 0, -71, -71, -71, -71, 0, 0, 93, 0, -71, -71, -71, 0,
+  -71, -71, 0, 40, 0, -71, -71, -71, -71, 0, -71, -71, -71, 0, 0, -71, 0, 0),
+ (-49, -49, 0, 0, -49, -49, 0, 0, 0, 0, -49, -49, 0, -49, -49, 0, 0, -49, -49, -49, -49, 0, 0, -49, 0, -49, -49, -49, 0,
+  -49, -49, 0, -49, 0, -49, -49, -49, -49, 0, -49, -49, -49, 0, 0, -49, 0, 0),
+ (0, 0, 0, 0, 0, 98, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  97, 0, 0, 0, 0, 0, 0, 0),
+ (0, 42, 0, 0, 99, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, 0, 0, 0, 0, 31, 0, 0),
+ (-2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (0, 42, 0, 0, 101, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, 100, 0, 0, 0, 31, 0, 0),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 102, 0, 0, 0, 0, 0, 0),
+ (0, 0, 0, 12, 103, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, -53, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 105, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (-26, -26, 0, 0, -26, -26, 0, 0, 0, 0, -26, -26, 0, -26, -26, 0, 0, -26, -26, -26, -26, 0, 0, -26, 106, -26, -26, -26,
+  0, -26, -26, 0, -26, 0, -26, -26, -26, -26, 0, -26, -26, -26, 0, 0, -26, 0, 0),
+ (-31, -31, 0, 0, -31, -31, 0, 0, 0, 0, 33, 27, 0, -31, -31, 0, 0, -31, -31, -31, -31, 0, 0, 93, 0, -31, -31, -31, 0,
+  -31, -31, 0, 40, 0, -31, 28, -31, 32, 0, -31, -31, -31, 0, 0, 31, 0, 0),
+ (-32, -32, 0, 0, -32, -32, 0, 0, 0, 0, 33, 27, 0, -32, -32, 0, 0, -32, -32, -32, -32, 0, 0, 93, 0, -32, -32, -32, 0,
+  -32, -32, 0, 40, 0, -32, 28, -32, 32, 0, -32, -32, -32, 0, 0, 31, 0, 0),
+ (-33, -33, 0, 0, -33, -33, 0, 0, 0, 0, -33, 27, 0, -33, -33, 0, 0, -33, -33, -33, -33, 0, 0, 93, 0, -33, -33, -33, 0,
+  -33, -33, 0, 40, 0, -33, 28, -33, 32, 0, -33, -33, -33, 0, 0, -33, 0, 0),
+ (-34, -34, 0, 0, -34, -34, 0, 0, 0, 0, -34, 27, 0, -34, -34, 0, 0, -34, -34, -34, -34, 0, 0, 93, 0, -34, -34, -34, 0,
+  -34, -34, 0, 40, 0, -34, 28, -34, 32, 0, -34, -34, -34, 0, 0, -34, 0, 0),
+ (-35, -35, 0, 0, -35, -35, 0, 0, 0, 0, -35, 27, 0, -35, -35, 0, 0, -35, -35, -35, -35, 0, 0, 93, 0, -35, -35, -35, 0,
+  -35, -35, 0, 40, 0, -35, 28, -35, 32, 0, -35, -35, -35, 0, 0, -35, 0, 0),
+ (-36, -36, 0, 0, -36, -36, 0, 0, 0, 0, 33, 27, 0, -36, 0, 0, 0, 0, 0, -36, 0, 0, 0, 93, 0, 0, 0, 30, 0, 0, -36, 0, 40,
+  0, -36, 28, 29, 32, 0, -36, -36, -36, 0, 0, 31, 0, 0),
+ (-37, -37, 0, 0, -37, -37, 0, 0, 0, 0, 33, 27, 0, -37, 0, 0, 0, 0, 0, -37, 0, 0, 0, 93, 0, 0, 0, 30, 0, 0, -37, 0, 40,
+  0, -37, 28, 29, 32, 0, -37, -37, -37, 0, 0, 31, 0, 0),
+ (-38, -38, 0, 0, -38, -38, 0, 0, 0, 0, 33, 27, 0, -38, 0, 0, 0, 0, 0, -38, 0, 0, 0, 93, 0, 0, 0, 30, 0, 0, -38, 0, 40,
+  0, -38, 28, 29, 32, 0, -38, -38, -38, 0, 0, 31, 0, 0),
+ (-39, -39, 0, 0, -39, -39, 0, 0, 0, 0, 33, 27, 0, -39, 0, 0, 0, 0, 0, -39, 0, 0, 0, 93, 0, 0, 0, 30, 0, 0, -39, 0, 40,
+  0, -39, 28, 29, 32, 0, -39, -39, -39, 0, 0, 31, 0, 0),
+ (-40, -40, 0, 0, -40, -40, 0, 0, 0, 0, 33, 27, 0, -40, 0, 0, 0, 0, 0, -40, 0, 0, 0, 93, 0, 0, 0, 30, 0, 0, -40, 0, 40,
+  0, -40, 28, 29, 32, 0, -40, -40, -40, 0, 0, 31, 0, 0),
+ (-41, -41, 0, 0, -41, -41, 0, 0, 0, 0, 33, 27, 0, -41, 0, 0, 0, 0, 0, -41, 0, 0, 0, 93, 0, 0, 0, 30, 0, 0, -41, 0, 40,
+  0, -41, 28, 29, 32, 0, -41, -41, -41, 0, 0, 31, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (-43, -43, 0, 0, -43, -43, 0, 0, 0, 0, 33, 27, 0, -43, 0, 0, 0, 0, 0, -43, 0, 0, 0, 93, 0, 0, 0, 30, 0, 0, -43, 0, 40,
+  0, -43, 28, 29, 32, 0, -43, -43, -43, 0, 0, 31, 0, 0),
+ (-44, -44, 0, 0, -44, -44, 0, 0, 0, 0, 33, 27, 0, -44, 34, 0, 0, 36, 38, -44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -44,
+  0, 40, 0, -44, 28, 29, 32, 0, -44, -44, -44, 0, 0, 31, 0, 0),
+ (-45, 42, 0, 0, -45, -45, 0, 0, 0, 0, 33, 27, 0, -45, 34, 0, 0, 36, 38, -45, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -45,
+  0, 40, 0, -45, 28, 29, 32, 0, -45, -45, -45, 0, 0, 31, 0, 0),
+ (0, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 108, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, 0, 0, 0, 0, 31, 0, 0),
+ (-16, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -16, 0, 40,
+  0, 43, 28, 29, 32, 0, 0, 0, 0, 0, 0, 31, 0, 0),
+ (-17, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -17, 0, 40,
+  0, 43, 28, 29, 32, 0, 0, 0, 0, 0, 0, 31, 0, 0),
+ (0, 0, 0, 0, 0, 110, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 109, 0, 0, 0, 0, 0),
+ (-20, -20, 0, 0, -20, -20, 0, 0, 0, 0, -20, -20, 0, -20, -20, 0, 0, -20, -20, -20, -20, 0, 0, -20, 0, -20, -20, -20, 0,
+  -20, -20, 0, -20, 0, -20, -20, -20, -20, 0, -20, -20, -20, 0, 0, -20, 0, 0),
+ (-27, 42, 0, 0, -27, -27, 0, 0, 0, 0, 33, 27, 0, -27, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -27, 0,
+  40, 0, 43, 28, 29, 32, 0, -27, -27, -27, 0, 0, 31, 0, 0),
+ (0, 0, 0, 12, 66, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (-47, -47, 0, 0, -47, -47, 0, 0, 0, 0, -47, -47, 0, -47, -47, 0, 0, -47, -47, -47, -47, 0, 0, -47, 0, -47, -47, -47, 0,
+  -47, -47, 0, -47, 0, -47, -47, -47, -47, 0, -47, -47, -47, 0, 0, -47, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 112, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 66, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 115, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0),
+ (-67, -67, 0, 0, -67, -67, 0, 0, 0, 0, -67, -67, 0, -67, -67, 0, 0, -67, -67, -67, -67, 0, 0, -67, 0, -67, -67, -67, 0,
+  -67, -67, 0, -67, 0, -67, -67, -67, -67, 0, -67, -67, -67, 0, 0, -67, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 116, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (-50, -50, 0, 0, -50, -50, 0, 0, 0, 0, -50, -50, 0, -50, -50, 0, 0, -50, -50, -50, -50, 0, 0, -50, 0, -50, -50, -50, 0,
+  -50, -50, 0, -50, 0, -50, -50, -50, -50, 0, -50, -50, -50, 0, 0, -50, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 118, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (-61, -61, 120, 0, 0, 0, 0, 0, 0, 0, -61, -61, 0, 0, -61, 0, 0, -61, -61, -61, -61, 0, 0, -61, 0, -61, -61, -61, 0,
+  -61, -61, 0, -61, 0, -61, -61, -61, -61, 0, 0, 0, 0, 121, 0, -61, 0, 0),
+ (0, 0, 0, 12, 123, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, -55, 0, 0, 17, 0, 22, 10),
+ (-60, -60, 0, 0, -60, -60, 0, 0, 0, 0, -60, -60, 0, -60, -60, 0, 0, -60, -60, -60, -60, 0, 0, -60, 0, -60, -60, -60, 0,
+  -60, -60, 0, -60, 0, -60, -60, -60, -60, 0, -60, -60, -60, 0, 0, -60, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 42, 0, 0, 125, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, -56, 0, 0, 0, 31, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 127, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (-42, -42, 0, 0, -42, -42, 0, 0, 0, 0, 33, 27, 0, -42, 0, 0, 0, 0, 0, -42, 0, 0, 0, 93, 0, 0, 0, 30, 0, 0, -42, 0, 40,
+  0, -42, 28, 29, 32, 0, -42, -42, -42, 0, 0, 31, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (-18, -18, 0, 0, -18, -18, 0, 0, 0, 0, -18, -18, 0, -18, -18, 0, 0, -18, -18, -18, -18, 0, 0, -18, 0, -18, -18, -18, 0,
+  -18, -18, 0, -18, 0, -18, -18, -18, -18, 0, -18, -18, -18, 0, 0, -18, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 130, 0, 17, 0, 22, 10),
+ (0, 42, 0, 0, 101, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, 131, 0, 0, 0, 31, 0, 0),
+ (-48, -48, 0, 0, -48, -48, 0, 0, 0, 0, -48, -48, 0, -48, -48, 0, 0, -48, -48, -48, -48, 0, 0, -48, 0, -48, -48, -48, 0,
+  -48, -48, 0, -48, 0, -48, -48, -48, -48, 0, -48, -48, -48, 0, 0, -48, 0, 0),
+ (0, 42, 0, 0, 0, -73, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, -73, -73, 0, 0, 31, 0, 0),
+ (0, 42, 0, 0, 101, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, 132, 0, 0, 0, 31, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, -72, 0, 0, 0, -72, 0, 0, 0, 0, -72, -72, 0, 0, -72, 0, 0, -72, -72, -72, -72, 48, 0, -72, 47, -72, -72, -72, 0,
+  -72, 0, 0, -72, 0, -72, -72, -72, -72, 0, 0, 0, -75, 0, 0, -72, 0, 0),
+ (0, 0, 0, 0, 0, 134, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  -29, 0, 0, 0, 0, 0, 0, 0),
+ (-51, -51, 0, 0, -51, -51, 0, 0, 0, 0, -51, -51, 0, -51, -51, 0, 0, -51, -51, -51, -51, 0, 0, -51, 0, -51, -51, -51, 0,
+  -51, -51, 0, -51, 0, -51, -51, -51, -51, 0, -51, -51, -51, 0, 0, -51, 0, 0),
+ (0, 42, 0, 0, 0, -30, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, -30, 0, 0, 0, 0, 31, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (0, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, -54, 0, 0, 0, 31, 0, 0),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, -57, 0, 0, 0, 0, 0, 0),
+ (0, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, 0, 0, 40, 0,
+  43, 28, 29, 32, 0, 0, -59, 0, 0, 0, 31, 0, 0),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, -58, 0, 0, 0, 0, 0, 0),
+ (0, 0, 0, 0, 0, 138, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 137, 0, 0, 0, 0, 0),
+ (-25, -25, 0, 0, -25, -25, 0, 0, 0, 0, -25, -25, 0, -25, -25, 0, 0, -25, -25, -25, -25, 0, 0, -25, 0, -25, -25, -25, 0,
+  -25, -25, 0, -25, 0, -25, -25, -25, -25, 0, -25, -25, -25, 0, 0, -25, 0, 0),
+ (0, 0, 0, 0, 0, 140, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 139, 0, 0, 0, 0, 0),
+ (-65, 42, 0, 0, -65, -65, 0, 0, 0, 0, 33, 27, 0, -65, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -65, 0,
+  40, 0, 43, 28, 29, 32, 0, -65, -65, -65, 0, 0, 31, 0, 0),
+ (-19, -19, 0, 0, -19, -19, 0, 0, 0, 0, -19, -19, 0, -19, -19, 0, 0, -19, -19, -19, -19, 0, 0, -19, 0, -19, -19, -19, 0,
+  -19, -19, 0, -19, 0, -19, -19, -19, -19, 0, -19, -19, -19, 0, 0, -19, 0, 0),
+ (-62, -61, 0, 0, 0, 0, 0, 0, 0, 0, -61, -61, 0, 0, -61, 0, 0, -61, -61, -61, -61, 0, 0, -61, 0, -61, -61, -61, 0, -61,
+  -62, 0, -61, 0, -61, -61, -61, -61, 0, 0, 0, 0, 0, 0, -61, 0, 0),
+ (-61, -61, 0, 0, -61, -61, 0, 0, 0, 0, -61, -61, 0, -61, -61, 0, 0, -61, -61, -61, -61, 0, 0, -61, 0, -61, -61, -61, 0,
+  -61, -61, 0, -61, 0, -61, -61, -61, -61, 0, -61, -61, -61, 0, 0, -61, 0, 0),
+ (-28, 42, 0, 0, -28, -28, 0, 0, 0, 0, 33, 27, 0, -28, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -28, 0,
+  40, 0, 43, 28, 29, 32, 0, -28, -28, -28, 0, 0, 31, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 0, 0, 17, 0, 22, 10),
+ (-63, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -63, 0, 40,
+  0, 43, 28, 29, 32, 0, 0, 0, 0, 0, 0, 31, 0, 0),
+ (-64, 42, 0, 0, 0, 0, 0, 0, 0, 0, 33, 27, 0, 0, 34, 0, 0, 36, 38, 44, 41, 0, 0, 93, 0, 37, 39, 30, 0, 35, -64, 0, 40,
+  0, 43, 28, 29, 32, 0, 0, 0, 0, 0, 0, 31, 0, 0),
+ (-21, -21, 0, 0, -21, -21, 0, 0, 0, 0, -21, -21, 0, -21, -21, 0, 0, -21, -21, -21, -21, 0, 0, -21, 0, -21, -21, -21, 0,
+  -21, -21, 0, -21, 0, -21, -21, -21, -21, 0, -21, -21, -21, 0, 0, -21, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 141, 0, 17, 0, 22, 10),
+ (-22, -22, 0, 0, -22, -22, 0, 0, 0, 0, -22, -22, 0, -22, -22, 0, 0, -22, -22, -22, -22, 0, 0, -22, 0, -22, -22, -22, 0,
+  -22, -22, 0, -22, 0, -22, -22, -22, -22, 0, -22, -22, -22, 0, 0, -22, 0, 0),
+ (0, 0, 0, 12, 0, 0, 0, 13, 14, 0, 0, 0, 11, 0, 0, 23, 9, 0, 0, 0, 0, 0, 21, 8, 18, 0, 0, 19, 50, 0, 0, 24, 20, 16, 0,
+  0, 0, 0, 15, 0, 0, 142, 0, 17, 0, 22, 10),
+ (-23, -23, 0, 0, -23, -23, 0, 0, 0, 0, -23, -23, 0, -23, -23, 0, 0, -23, -23, -23, -23, 0, 0, -23, 0, -23, -23, -23, 0,
+  -23, -23, 0, -23, 0, -23, -23, -23, -23, 0, -23, -23, -23, 0, 0, -23, 0, 0),
+ (-24, -24, 0, 0, -24, -24, 0, 0, 0, 0, -24, -24, 0, -24, -24, 0, 0, -24, -24, -24, -24, 0, 0, -24, 0, -24, -24, -24, 0,
+  -24, -24, 0, -24, 0, -24, -24, -24, -24, 0, -24, -24, -24, 0, 0, -24, 0, 0))
+DEFAULT = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+ 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+ 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+ 0, 0, 0, -57, 0, -58, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+GOTO = ((0, 0, 0, 0, 0, 0, 0, 0, 52, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 87, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 126, 128, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 54, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+ (1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 61, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0),
+ (4, 0, 0, 0, 0, 0, 0, 49, 53, 0, 0, 0, 0, 0, 0, 0, 0, 0, 55, 58, 59, 62, 0, 0, 0, 4, 64, 0, 0, 69, 70, 71, 72, 73, 74,
+  75, 76, 77, 78, 79, 0, 81, 82, 83, 84, 85, 86, 53, 89, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 104, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 107, 0, 0, 0, 0, 0, 0, 0, 0, 0, 111, 0, 113, 114, 0, 0, 113, 0, 62, 119, 0, 122, 0,
+  124, 0, 53, 53, 0, 129, 0, 113, 0, 0, 0, 0, 133, 0, 0, 0, 0, 135, 136, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 62, 0, 0,
+  0, 113, 0, 113, 0, 0),
+ (2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+ (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 0, 0, 65, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+ (3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0))
@@ -1,106 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'leftASSIGNleftSHORT_OPleftORleftANDnonassocEQNEGTLTGTELTEINleftPLUSMINUSleftTIMESDIVIDErightPOWERleftPIPEleftDOTrightNOTrightUMINUSleftLBRACKETAND ASSIGN BREAK COLON COMMA COMMENT CONTINUE DEF DEL DIVIDE DOT ELIF ELSE EQ FALSE FOR GT GTE IF IN LAMBDA LBRACE LBRACKET LPAREN LT LTE MINUS NAME NE NEWLINE NONE NOT NUMBER OR PIPE PLUS POWER RAISE RBRACE RBRACKET RPAREN SHORT_OP STRING TIMES TRUE WHILE code : line\n             | code NEWLINE line line : statement  statement : expression statement :  statement : COMMENT  expression : FOR\n                   | WHILE\n                   | ELIF\n                   | BREAK\n                   | CONTINUE\n                   | DEF\n                   | RAISE expression : NUMBER  expression : STRING  statement : NAME ASSIGN expression  statement : NAME SHORT_OP expression  expression : NAME LPAREN arglist RPAREN\n                   | NAME LPAREN arglist COMMA RPAREN\n                   | NAME LPAREN RPAREN\n     expression : expression DOT NAME LPAREN arglist RPAREN\n                   | expression PIPE NAME LPAREN arglist RPAREN\n                   | expression DOT NAME LPAREN arglist COMMA RPAREN\n                   | expression PIPE NAME LPAREN arglist COMMA RPAREN\n                   | expression DOT NAME LPAREN RPAREN\n                   | expression PIPE NAME\n     expression : NAME LAMBDA expression\n                   | LPAREN arglist_def RPAREN LAMBDA expression\n     dict_item : dict_item COMMA dict_item\n                  | expression COLON expression\n     expression : expression PLUS expression\n                   | expression MINUS expression\n                   | expression TIMES expression\n                   | expression POWER expression\n                   | expression DIVIDE expression\n                   | expression EQ expression\n                   | expression NE expression\n                   | expression GT expression\n                   | expression LT expression\n                   | expression GTE expression\n                   | expression LTE expression\n                   | expression NOT IN expression\n                   | expression IN expression\n                   | expression AND expression\n                   | expression OR expression\n     expression : LBRACKET RBRACKET\n                   | LBRACKET arglist RBRACKET\n                   | LBRACKET arglist COMMA RBRACKET\n     expression : LBRACE RBRACE\n                   | LBRACE dict_item RBRACE\n                   | LBRACE dict_item COMMA RBRACE\n     slice : expression\n              | COLON\n              | expression COLON expression\n              | expression COLON\n              | COLON expression\n              | expression COLON COLON\n              | COLON expression COLON\n              | COLON COLON expression\n     expression : expression LBRACKET slice RBRACKET\n                   | expression LBRACKET expression RBRACKET\n     statement : DEL expression LBRACKET expression RBRACKET\n     statement : expression LBRACKET expression RBRACKET ASSIGN expression\n     statement : expression LBRACKET expression RBRACKET SHORT_OP expression\n     expression : expression IF expression ELSE expression\n     expression : MINUS expression %prec UMINUS  expression : LPAREN expression RPAREN expression : TRUE  expression : FALSE  expression : NONE  expression : NOT expression  expression : NAME  arglist : arglist COMMA expression\n                | expression\n     arglist_def : arglist COMMA NAME\n                    | NAME\n    '
-    
-_lr_action_items = {'NEWLINE':([0,1,2,3,4,5,6,9,10,11,12,13,14,15,16,17,22,23,24,25,50,51,58,59,60,63,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,85,86,88,89,91,95,97,100,102,107,109,112,118,127,129,130,131,132,133,135,136,137,139,141,142,],[-5,25,-1,-3,-4,-6,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,-5,-72,-46,-66,-71,-49,-2,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-16,-17,-20,-27,-47,-67,-50,-61,-60,-42,-18,-48,-51,-25,-65,-19,-62,-61,-28,-63,-64,-21,-22,-23,-24,]),'$end':([0,1,2,3,4,5,6,9,10,11,12,13,14,15,16,17,22,23,24,25,50,51,58,59,60,63,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,85,86,88,89,91,95,97,100,102,107,109,112,118,127,129,130,131,132,133,135,136,137,139,141,142,],[-5,0,-1,-3,-4,-6,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,-5,-72,-46,-66,-71,-49,-2,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-16,-17,-20,-27,-47,-67,-50,-61,-60,-42,-18,-48,-51,-25,-65,-19,-62,-61,-28,-63,-64,-21,-22,-23,-24,]),'COMMENT':([0,25,],[5,5,]),'NAME':([0,7,8,18,19,20,21,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[6,50,50,57,50,50,50,6,50,67,68,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,116,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'DEL':([0,25,],[7,7,]),'FOR':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'WHILE':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'ELIF':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'BREAK':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'CONTINUE':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'DEF':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'RAISE':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'NUMBER':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'STRING':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'LPAREN':([0,6,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,50,57,66,67,68,80,90,92,93,96,98,99,101,103,105,106,108,110,115,116,120,121,134,138,140,],[18,47,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,47,47,18,105,106,18,18,18,18,18,18,18,18,18,18,18,18,18,18,47,18,18,18,18,18,]),'LBRACKET':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,53,55,57,58,59,60,62,64,66,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,88,89,90,91,92,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,119,120,121,122,124,127,129,130,131,132,133,134,135,136,137,138,139,140,141,142,],[8,26,-72,8,8,-7,-8,-9,-10,-11,-12,-13,-14,-15,8,8,8,8,-68,-69,-70,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,90,-72,-46,93,93,-72,93,93,-49,93,93,8,-26,93,93,93,93,93,93,93,93,93,93,93,8,93,93,93,93,93,93,-20,93,8,-47,8,8,-67,8,-50,8,8,-61,8,-60,8,93,8,8,93,8,-18,8,93,-48,93,93,8,-72,-51,93,8,8,93,93,-25,93,-19,-61,-61,93,8,93,93,-21,8,-22,8,-23,-24,]),'LBRACE':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'MINUS':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,53,55,57,58,59,60,62,64,66,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,88,89,90,91,92,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,119,120,121,122,124,127,129,130,131,132,133,134,135,136,137,138,139,140,141,142,],[19,30,-72,19,19,-7,-8,-9,-10,-11,-12,-13,-14,-15,19,19,19,19,-68,-69,-70,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,30,-72,-46,30,30,-72,-66,-71,-49,30,30,19,-26,-31,-32,-33,-34,-35,30,30,30,30,30,30,19,30,30,30,30,30,30,-20,30,19,-47,19,19,-67,19,-50,19,19,-61,19,-60,19,30,19,19,30,19,-18,19,30,-48,30,30,19,-72,-51,30,19,19,30,30,-25,30,-19,-61,-61,30,19,30,30,-21,19,-22,19,-23,-24,]),'TRUE':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'FALSE':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'NONE':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'NOT':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,53,55,57,58,59,60,62,64,66,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,88,89,90,91,92,93,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,119,120,121,122,124,127,129,130,131,132,133,134,135,136,137,138,139,140,141,142,],[20,40,-72,20,20,-7,-8,-9,-10,-11,-12,-13,-14,-15,20,20,20,20,-68,-69,-70,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,40,-72,-46,40,40,-72,-66,40,-49,40,40,20,-26,40,40,40,40,40,40,40,40,40,40,40,20,40,40,40,40,40,40,-20,40,20,-47,20,20,-67,20,-50,20,20,-61,20,-60,20,40,20,20,40,20,-18,20,40,-48,40,40,20,-72,-51,40,20,20,40,40,-25,40,-19,-61,-61,40,20,40,40,-21,20,-22,20,-23,-24,]),'DOT':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[27,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,27,-72,-46,27,27,-72,-66,-71,-49,27,27,-26,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-20,27,-47,-67,-50,-61,-60,27,27,-18,27,-48,27,27,-72,-51,27,27,27,-25,27,-19,-61,-61,27,27,27,-21,-22,-23,-24,]),'PIPE':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[28,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,28,-72,-46,28,28,-72,-66,-71,-49,28,28,-26,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-20,28,-47,-67,-50,-61,-60,28,28,-18,28,-48,28,28,-72,-51,28,28,28,-25,28,-19,-61,-61,28,28,28,-21,-22,-23,-24,]),'PLUS':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[29,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,29,-72,-46,29,29,-72,-66,-71,-49,29,29,-26,-31,-32,-33,-34,-35,29,29,29,29,29,29,29,29,29,29,29,29,-20,29,-47,-67,-50,-61,-60,29,29,-18,29,-48,29,29,-72,-51,29,29,29,-25,29,-19,-61,-61,29,29,29,-21,-22,-23,-24,]),'TIMES':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[31,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,31,-72,-46,31,31,-72,-66,-71,-49,31,31,-26,31,31,-33,-34,-35,31,31,31,31,31,31,31,31,31,31,31,31,-20,31,-47,-67,-50,-61,-60,31,31,-18,31,-48,31,31,-72,-51,31,31,31,-25,31,-19,-61,-61,31,31,31,-21,-22,-23,-24,]),'POWER':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[32,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,32,-72,-46,32,32,-72,-66,-71,-49,32,32,-26,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-20,32,-47,-67,-50,-61,-60,32,32,-18,32,-48,32,32,-72,-51,32,32,32,-25,32,-19,-61,-61,32,32,32,-21,-22,-23,-24,]),'DIVIDE':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[33,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,33,-72,-46,33,33,-72,-66,-71,-49,33,33,-26,33,33,-33,-34,-35,33,33,33,33,33,33,33,33,33,33,33,33,-20,33,-47,-67,-50,-61,-60,33,33,-18,33,-48,33,33,-72,-51,33,33,33,-25,33,-19,-61,-61,33,33,33,-21,-22,-23,-24,]),'EQ':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[34,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,34,-72,-46,34,34,-72,-66,-71,-49,34,34,-26,-31,-32,-33,-34,-35,None,None,None,None,None,None,None,34,34,34,34,34,-20,34,-47,-67,-50,-61,-60,34,None,-18,34,-48,34,34,-72,-51,34,34,34,-25,34,-19,-61,-61,34,34,34,-21,-22,-23,-24,]),'NE':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[35,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,35,-72,-46,35,35,-72,-66,-71,-49,35,35,-26,-31,-32,-33,-34,-35,None,None,None,None,None,None,None,35,35,35,35,35,-20,35,-47,-67,-50,-61,-60,35,None,-18,35,-48,35,35,-72,-51,35,35,35,-25,35,-19,-61,-61,35,35,35,-21,-22,-23,-24,]),'GT':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[36,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,36,-72,-46,36,36,-72,-66,-71,-49,36,36,-26,-31,-32,-33,-34,-35,None,None,None,None,None,None,None,36,36,36,36,36,-20,36,-47,-67,-50,-61,-60,36,None,-18,36,-48,36,36,-72,-51,36,36,36,-25,36,-19,-61,-61,36,36,36,-21,-22,-23,-24,]),'LT':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[37,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,37,-72,-46,37,37,-72,-66,-71,-49,37,37,-26,-31,-32,-33,-34,-35,None,None,None,None,None,None,None,37,37,37,37,37,-20,37,-47,-67,-50,-61,-60,37,None,-18,37,-48,37,37,-72,-51,37,37,37,-25,37,-19,-61,-61,37,37,37,-21,-22,-23,-24,]),'GTE':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[38,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,38,-72,-46,38,38,-72,-66,-71,-49,38,38,-26,-31,-32,-33,-34,-35,None,None,None,None,None,None,None,38,38,38,38,38,-20,38,-47,-67,-50,-61,-60,38,None,-18,38,-48,38,38,-72,-51,38,38,38,-25,38,-19,-61,-61,38,38,38,-21,-22,-23,-24,]),'LTE':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[39,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,39,-72,-46,39,39,-72,-66,-71,-49,39,39,-26,-31,-32,-33,-34,-35,None,None,None,None,None,None,None,39,39,39,39,39,-20,39,-47,-67,-50,-61,-60,39,None,-18,39,-48,39,39,-72,-51,39,39,39,-25,39,-19,-61,-61,39,39,39,-21,-22,-23,-24,]),'IN':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,40,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[41,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,80,41,-72,-46,41,41,-72,-66,-71,-49,41,41,-26,-31,-32,-33,-34,-35,None,None,None,None,None,None,None,41,41,41,41,41,-20,41,-47,-67,-50,-61,-60,41,None,-18,41,-48,41,41,-72,-51,41,41,41,-25,41,-19,-61,-61,41,41,41,-21,-22,-23,-24,]),'AND':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[42,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,42,-72,-46,42,42,-72,-66,-71,-49,42,42,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,42,42,42,42,-20,42,-47,-67,-50,-61,-60,42,-42,-18,42,-48,42,42,-72,-51,42,42,42,-25,42,-19,-61,-61,42,42,42,-21,-22,-23,-24,]),'OR':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[43,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,43,-72,-46,43,43,-72,-66,-71,-49,43,43,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,43,43,43,-20,43,-47,-67,-50,-61,-60,43,-42,-18,43,-48,43,43,-72,-51,43,43,43,-25,43,-19,-61,-61,43,43,43,-21,-22,-23,-24,]),'IF':([4,6,9,10,11,12,13,14,15,16,17,22,23,24,49,50,51,53,55,57,58,59,60,62,64,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,88,89,91,95,97,100,102,104,107,109,111,112,113,114,116,118,119,122,124,127,129,130,131,132,133,135,136,137,139,141,142,],[44,-72,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,44,-72,-46,44,44,-72,-66,-71,-49,44,44,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,44,44,44,-20,44,-47,-67,-50,-61,-60,44,-42,-18,44,-48,44,44,-72,-51,44,44,44,-25,44,-19,-61,-61,44,44,44,-21,-22,-23,-24,]),'ASSIGN':([6,100,],[45,120,]),'SHORT_OP':([6,100,],[46,121,]),'LAMBDA':([6,50,57,94,116,],[48,48,48,115,48,]),'RBRACKET':([8,9,10,11,12,13,14,15,16,17,22,23,24,50,51,52,53,58,59,60,64,65,66,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,88,89,91,92,95,97,101,102,104,107,109,111,112,113,114,118,122,123,124,125,127,129,130,132,133,137,139,141,142,],[51,-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,-72,-46,91,-74,-66,-71,-49,100,102,-53,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-20,-27,-47,112,-67,-50,-55,-60,-56,-42,-18,131,-48,-73,132,-51,-54,-57,-59,-58,-25,-65,-19,-61,-28,-21,-22,-23,-24,]),'COMMA':([9,10,11,12,13,14,15,16,17,22,23,24,50,51,52,53,55,56,57,58,59,60,61,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,87,88,89,91,95,97,102,107,109,112,113,116,117,118,119,126,127,128,129,130,132,133,137,139,141,142,],[-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,-72,-46,92,-74,-74,96,-72,-66,-71,-49,98,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,110,-20,-27,-47,-67,-50,-60,-42,-18,-48,-73,-72,134,-51,-30,138,-25,140,-65,-19,-61,-28,-21,-22,-23,-24,]),'RPAREN':([9,10,11,12,13,14,15,16,17,22,23,24,47,50,51,53,54,55,57,58,59,60,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,87,88,89,91,95,97,102,105,107,109,110,112,113,116,118,126,127,128,129,130,132,133,137,138,139,140,141,142,],[-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,88,-72,-46,-74,94,95,-72,-66,-71,-49,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,109,-20,-27,-47,-67,-50,-60,127,-42,-18,130,-48,-73,-75,-51,137,-25,139,-65,-19,-61,-28,-21,141,-22,142,-23,-24,]),'COLON':([9,10,11,12,13,14,15,16,17,22,23,24,26,50,51,58,59,60,62,64,66,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,88,89,90,91,93,95,97,101,102,104,107,109,111,112,114,118,127,129,130,132,133,137,139,141,142,],[-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,66,-72,-46,-66,-71,-49,99,101,103,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-20,-27,66,-47,66,-67,-50,123,-60,125,-42,-18,101,-48,101,-51,-25,-65,-19,-61,-28,-21,-22,-23,-24,]),'ELSE':([9,10,11,12,13,14,15,16,17,22,23,24,50,51,58,59,60,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,88,89,91,95,97,102,107,109,112,118,127,129,130,132,133,137,139,141,142,],[-7,-8,-9,-10,-11,-12,-13,-14,-15,-68,-69,-70,-72,-46,-66,-71,-49,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,108,-20,-27,-47,-67,-50,-60,-42,-18,-48,-51,-25,-65,-19,-61,-28,-21,-22,-23,-24,]),'RBRACE':([9,10,11,12,13,14,15,16,17,21,22,23,24,50,51,58,59,60,61,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,88,89,91,95,97,98,102,107,109,112,117,118,119,127,129,130,132,133,137,139,141,142,],[-7,-8,-9,-10,-11,-12,-13,-14,-15,60,-68,-69,-70,-72,-46,-66,-71,-49,97,-26,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-20,-27,-47,-67,-50,118,-60,-42,-18,-48,-29,-51,-30,-25,-65,-19,-61,-28,-21,-22,-23,-24,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'code':([0,],[1,]),'line':([0,25,],[2,63,]),'statement':([0,25,],[3,3,]),'expression':([0,7,8,18,19,20,21,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,66,80,90,92,93,96,98,99,101,103,105,106,108,110,115,120,121,134,138,140,],[4,49,53,55,58,59,62,4,64,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,85,86,53,89,104,107,111,113,114,113,62,119,122,124,53,53,129,113,133,135,136,62,113,113,]),'arglist':([8,18,47,105,106,],[52,56,87,126,128,]),'arglist_def':([18,],[54,]),'dict_item':([21,98,134,],[61,117,117,]),'slice':([26,90,93,],[65,65,65,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> code","S'",1,None,None,None),
-  ('code -> line','code',1,'p_code','rules.py',12),
-  ('code -> code NEWLINE line','code',3,'p_code','rules.py',13),
-  ('line -> statement','line',1,'p_line','rules.py',24),
-  ('statement -> expression','statement',1,'p_statement_expr','rules.py',29),
-  ('statement -> <empty>','statement',0,'p_statement_empty','rules.py',34),
-  ('statement -> COMMENT','statement',1,'p_statement_comment','rules.py',39),
-  ('expression -> FOR','expression',1,'p_expression_reserved_unused','rules.py',44),
-  ('expression -> WHILE','expression',1,'p_expression_reserved_unused','rules.py',45),
-  ('expression -> ELIF','expression',1,'p_expression_reserved_unused','rules.py',46),
-  ('expression -> BREAK','expression',1,'p_expression_reserved_unused','rules.py',47),
-  ('expression -> CONTINUE','expression',1,'p_expression_reserved_unused','rules.py',48),
-  ('expression -> DEF','expression',1,'p_expression_reserved_unused','rules.py',49),
-  ('expression -> RAISE','expression',1,'p_expression_reserved_unused','rules.py',50),
-  ('expression -> NUMBER','expression',1,'p_expression_number','rules.py',55),
-  ('expression -> STRING','expression',1,'p_expression_string','rules.py',60),
-  ('statement -> NAME ASSIGN expression','statement',3,'p_statement_assign','rules.py',65),
-  ('statement -> NAME SHORT_OP expression','statement',3,'p_statement_short_op','rules.py',70),
-  ('expression -> NAME LPAREN arglist RPAREN','expression',4,'p_expression_call','rules.py',75),
-  ('expression -> NAME LPAREN arglist COMMA RPAREN','expression',5,'p_expression_call','rules.py',76),
-  ('expression -> NAME LPAREN RPAREN','expression',3,'p_expression_call','rules.py',77),
-  ('expression -> expression DOT NAME LPAREN arglist RPAREN','expression',6,'p_expression_method_call','rules.py',86),
-  ('expression -> expression PIPE NAME LPAREN arglist RPAREN','expression',6,'p_expression_method_call','rules.py',87),
-  ('expression -> expression DOT NAME LPAREN arglist COMMA RPAREN','expression',7,'p_expression_method_call','rules.py',88),
-  ('expression -> expression PIPE NAME LPAREN arglist COMMA RPAREN','expression',7,'p_expression_method_call','rules.py',89),
-  ('expression -> expression DOT NAME LPAREN RPAREN','expression',5,'p_expression_method_call','rules.py',90),
-  ('expression -> expression PIPE NAME','expression',3,'p_expression_method_call','rules.py',91),
-  ('expression -> NAME LAMBDA expression','expression',3,'p_expression_lambda','rules.py',103),
-  ('expression -> LPAREN arglist_def RPAREN LAMBDA expression','expression',5,'p_expression_lambda','rules.py',104),
-  ('dict_item -> dict_item COMMA dict_item','dict_item',3,'p_dict_item','rules.py',113),
-  ('dict_item -> expression COLON expression','dict_item',3,'p_dict_item','rules.py',114),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','rules.py',123),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','rules.py',124),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','rules.py',125),
-  ('expression -> expression POWER expression','expression',3,'p_expression_binop','rules.py',126),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','rules.py',127),
-  ('expression -> expression EQ expression','expression',3,'p_expression_binop','rules.py',128),
-  ('expression -> expression NE expression','expression',3,'p_expression_binop','rules.py',129),
-  ('expression -> expression GT expression','expression',3,'p_expression_binop','rules.py',130),
-  ('expression -> expression LT expression','expression',3,'p_expression_binop','rules.py',131),
-  ('expression -> expression GTE expression','expression',3,'p_expression_binop','rules.py',132),
-  ('expression -> expression LTE expression','expression',3,'p_expression_binop','rules.py',133),
-  ('expression -> expression NOT IN expression','expression',4,'p_expression_binop','rules.py',134),
-  ('expression -> expression IN expression','expression',3,'p_expression_binop','rules.py',135),
-  ('expression -> expression AND expression','expression',3,'p_expression_binop','rules.py',136),
-  ('expression -> expression OR expression','expression',3,'p_expression_binop','rules.py',137),
-  ('expression -> LBRACKET RBRACKET','expression',2,'p_list_literal','rules.py',146),
-  ('expression -> LBRACKET arglist RBRACKET','expression',3,'p_list_literal','rules.py',147),
-  ('expression -> LBRACKET arglist COMMA RBRACKET','expression',4,'p_list_literal','rules.py',148),
-  ('expression -> LBRACE RBRACE','expression',2,'p_dict_literal','rules.py',157),
-  ('expression -> LBRACE dict_item RBRACE','expression',3,'p_dict_literal','rules.py',158),
-  ('expression -> LBRACE dict_item COMMA RBRACE','expression',4,'p_dict_literal','rules.py',159),
-  ('slice -> expression','slice',1,'p_slice','rules.py',168),
-  ('slice -> COLON','slice',1,'p_slice','rules.py',169),
-  ('slice -> expression COLON expression','slice',3,'p_slice','rules.py',170),
-  ('slice -> expression COLON','slice',2,'p_slice','rules.py',171),
-  ('slice -> COLON expression','slice',2,'p_slice','rules.py',172),
-  ('slice -> expression COLON COLON','slice',3,'p_slice','rules.py',173),
-  ('slice -> COLON expression COLON','slice',3,'p_slice','rules.py',174),
-  ('slice -> COLON COLON expression','slice',3,'p_slice','rules.py',175),
-  ('expression -> expression LBRACKET slice RBRACKET','expression',4,'p_getitem','rules.py',181),
-  ('expression -> expression LBRACKET expression RBRACKET','expression',4,'p_getitem','rules.py',182),
-  ('statement -> DEL expression LBRACKET expression RBRACKET','statement',5,'p_delitem','rules.py',206),
-  ('statement -> expression LBRACKET expression RBRACKET ASSIGN expression','statement',6,'p_setitem','rules.py',212),
-  ('statement -> expression LBRACKET expression RBRACKET SHORT_OP expression','statement',6,'p_setitem_with_op','rules.py',218),
-  ('expression -> expression IF expression ELSE expression','expression',5,'p_if_expr','rules.py',224),
-  ('expression -> MINUS expression','expression',2,'p_expression_uminus','rules.py',230),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','rules.py',235),
-  ('expression -> TRUE','expression',1,'p_expression_true','rules.py',240),
-  ('expression -> FALSE','expression',1,'p_expression_false','rules.py',245),
-  ('expression -> NONE','expression',1,'p_expression_none','rules.py',250),
-  ('expression -> NOT expression','expression',2,'p_expression_not','rules.py',255),
-  ('expression -> NAME','expression',1,'p_expression_name','rules.py',260),
-  ('arglist -> arglist COMMA expression','arglist',3,'p_arglist','rules.py',265),
-  ('arglist -> expression','arglist',1,'p_arglist','rules.py',266),
-  ('arglist_def -> arglist COMMA NAME','arglist_def',3,'p_arglist_def','rules.py',275),
-  ('arglist_def -> NAME','arglist_def',1,'p_arglist_def','rules.py',276),
-]
@@ -0,0 +1,110 @@
+from decimal import Decimal as Decimal_
+from typing import Any, Dict, Tuple, Type
+
+import dataclasses
+import threading
+import weakref
+
+from smartquery.ast_ops import Op
+
+
+# Hash-consing of parsed programs: structurally equal subtrees of all interned trees are the same objects,
+# so memory of cached programs grows with unique code only.
+# A node is looked up by its type, field values and identities of its (already interned) children.
+# The table references nodes weakly, so they are dropped together with the last tree,
+# which uses them (e.g. when it's evicted from parse_cache).
+
+_nodes: 'weakref.WeakValueDictionary[Tuple[Any, ...], Op]' = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+# roots of interned trees by id, see is_interned()
+_roots: 'weakref.WeakValueDictionary[int, Op]' = weakref.WeakValueDictionary()
+
+_fields: Dict[Type[Op], Tuple[str, ...]] = {}
+
+
+class _Ref:
+    # a child in the key of its parent: compared by identity, and kept alive while the parent is in the table.
+    # Children are interned before their parent, so equal children are the same object already: identity is
+    # an O(1) hash and comparison, where the dataclass __hash__/__eq__ of a node would walk its whole subtree
+    # (and fail on list fields, e.g. CodeOp.lines) and == would mix up values such as 1, 1.0 and True
+    __slots__ = ('op',)
+
+    def __init__(self, op: Op):
+        self.op = op
+
+    def __hash__(self):
+        return id(self.op)
+
+    def __eq__(self, other):
+        return type(other) is _Ref and other.op is self.op
+
+
+def intern_tree(op: Op) -> Op:
+    with _lock:
+        op = _intern(op)
+        _roots[id(op)] = op
+        return op
+
+
+def interned_nodes() -> int:
+    return len(_nodes)
+
+
+def is_interned(op: Op) -> bool:
+    # one lookup by identity, cheap enough for every parse cache hit
+    return _roots.get(id(op)) is op
+
+
+def _init_fields(cls: Type[Op]) -> Tuple[str, ...]:
+    names = _fields.get(cls)
+    if names is None:
+        names = _fields[cls] = tuple(f.name for f in dataclasses.fields(cls) if f.init)
+
+    return names
+
+
+def _intern(op: Op) -> Op:
+    changes: Dict[str, Any] = {}
+    values = []
+    for name in _init_fields(type(op)):
+        v = getattr(op, name)
+        interned = _intern_value(v)
+        if interned is not v:
+            changes[name] = interned
+        values.append(interned)
+
+    if changes:
+        op = dataclasses.replace(op, **changes)
+
+    try:
+        key = (type(op), *map(_key, values))
+        return _nodes.setdefault(key, op)
+    except TypeError:
+        # e.g. ConstOp with a dict value: dicts have no key (see _key), such nodes are left unshared
+        return op
+
+
+def _intern_value(v: Any) -> Any:
+    if isinstance(v, Op):
+        return _intern(v)
+    elif isinstance(v, (list, tuple)):
+        items = [_intern_value(item) for item in v]
+        if any(a is not b for a, b in zip(items, v)):
+            return type(v)(items)
+
+    return v
+
+
+def _key(v: Any) -> Any:
+    if isinstance(v, Op):
+        return _Ref(v)
+    elif isinstance(v, (list, tuple)):
+        return type(v), tuple(map(_key, v))
+    elif isinstance(v, (float, Decimal_)):
+        # 1.0 and 1.00, or 0.0 and -0.0 are equal, but not the same
+        return type(v), repr(v)
+
+    # the type keeps True, 1 and Decimal(1) apart; unhashable values raise TypeError
+    hash(v)
+    return type(v), v
@@ -0,0 +1,167 @@
+from typing import Any, Dict, List, Tuple
+
+from pathlib import Path
+import pprint
+
+from smartquery import rules
+from smartquery.ply import yacc
+
+
+# LALR(1) driver over dense tables from gen/lalrtab.py, a replacement of ply.yacc.LRParser for SqParser.
+# States, terminals and nonterminals are integers, so every shift/reduce is a tuple index
+# instead of the string keyed dict lookups of PLY; the only dict lookup is the type of each token.
+#
+# Tables are generated from smartquery/rules.py (which stays the reference grammar) by
+#     python -m smartquery.lalr
+# and must be regenerated after changing the grammar (SIGNATURE is checked by the tests).
+#
+# ACTION[state][terminal] is a shift to state (> 0), a reduce by production (< 0), ACCEPT or 0 (syntax error);
+# DEFAULT[state] is the only action of a state, if it's a reduce: it's taken without reading a lookahead,
+# as PLY's defaulted states do; GOTO[nonterminal][state] is the state after a reduce.
+
+_TABLES_PATH = Path(__file__).parent / 'gen' / 'lalrtab.py'
+
+
+def build_tables() -> Dict[str, Any]:
+    # PLY computes the tables in memory (no parsetab module is shipped or written)
+    parser = yacc.yacc(module=rules, debug=False, write_tables=False, errorlog=yacc.NullLogger())
+
+    pinfo = yacc.ParserReflect(vars(rules))
+    pinfo.get_all()
+
+    terminals = ('$end', *sorted(rules.tokens))
+    nonterminals = tuple(sorted({p.name for p in parser.productions[1:]}))
+    term_ids = {t: i for i, t in enumerate(terminals)}
+    states = len(parser.action)
+    accept = states
+
+    action = []
+    default = []
+    for state in range(states):
+        row = [0] * len(terminals)
+        for t, a in parser.action[state].items():
+            # None is an error of a nonassoc operator
+            row[term_ids[t]] = accept if a == 0 else a or 0
+        action.append(tuple(row))
+        default.append(parser.defaulted_states.get(state, 0))
+
+    goto = []
+    for nt in nonterminals:
+        goto.append(tuple(parser.goto.get(state, {}).get(nt, 0) for state in range(states)))
+
+    return {
+        'SIGNATURE': pinfo.signature(),
+        'TERMINALS': terminals,
+        'NONTERMINALS': nonterminals,
+        'PRODUCTIONS': tuple((p.name, p.func, p.len) for p in parser.productions),
+        'ACCEPT': accept,
+        'ACTION': tuple(action),
+        'DEFAULT': tuple(default),
+        'GOTO': tuple(goto),
+    }
+
+
+def write_tables(path: Path = _TABLES_PATH):
+    lines = [
+        '# lalrtab.py',
+        '# This file is automatically generated by `python -m smartquery.lalr`. Do not edit.',
+        '# pylint: skip-file',
+    ]
+    for name, value in build_tables().items():
+        lines.append(f'{name} = {pprint.pformat(value, width=120, compact=True)}')
+
+    path.write_text('\n'.join(lines) + '\n')
+
+
+class _Symbol(yacc.YaccSymbol):
+    # YaccSymbol of ply with its attributes declared
+    type: str
+    value: Any
+
+
+class LalrParser:
+    def __init__(self):
+        from smartquery.gen import lalrtab
+
+        self.signature: str = lalrtab.SIGNATURE
+        self.accept: int = lalrtab.ACCEPT
+        self.action: Tuple[Tuple[int, ...], ...] = lalrtab.ACTION
+        self.default: Tuple[int, ...] = lalrtab.DEFAULT
+        self.term_ids: Dict[str, int] = {t: i for i, t in enumerate(lalrtab.TERMINALS)}
+
+        # (name, callable, len, goto row) per production
+        nt_ids = {nt: i for i, nt in enumerate(lalrtab.NONTERMINALS)}
+        self.productions: List[Tuple[str, Any, int, Tuple[int, ...]]] = [
+            (name, getattr(rules, func) if func else None, plen, lalrtab.GOTO[nt_ids[name]] if name in nt_ids else ())
+            for name, func, plen in lalrtab.PRODUCTIONS
+        ]
+
+    def parse(self, lexer: Any) -> Any:
+        # doesn't modify the parser, so it can be used from many threads at once
+        actions = self.action
+        defaults = self.default
+        productions = self.productions
+        term_ids = self.term_ids
+        accept = self.accept
+        get_token = lexer.token
+        symbol = _Symbol
+
+        end = symbol()
+        end.type = '$end'
+        statestack = [0]
+        symstack: List[Any] = [end]
+
+        pslice = yacc.YaccProduction(None, symstack)
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        state = 0
+        lookahead = None
+        tid = None  # terminal id of the lookahead, None if it's not read yet
+        while True:
+            t = defaults[state]
+            if not t:
+                if tid is None:
+                    lookahead = get_token()
+                    tid = term_ids[lookahead.type] if lookahead is not None else 0
+                t = actions[state][tid]
+
+            if t > 0:
+                if t == accept:
+                    return symstack[-1].value
+
+                statestack.append(t)
+                symstack.append(lookahead)
+                state = t
+                tid = None
+            elif t < 0:
+                name, func, plen, goto = productions[-t]
+
+                sym = symbol()
+                sym.type = name
+                sym.value = None
+
+                if plen:
+                    targ = symstack[-plen - 1:]
+                    targ[0] = sym
+                    del symstack[-plen:]
+                    del statestack[-plen:]
+                else:
+                    targ = [sym]
+
+                pslice.slice = targ
+                func(pslice)
+
+                symstack.append(sym)
+                state = goto[statestack[-1]]
+                statestack.append(state)
+            else:
+                # rules.p_error always raises, so there is no error recovery
+                if lookahead is not None and not hasattr(lookahead, 'lexer'):
+                    lookahead.lexer = lexer
+                rules.p_error(lookahead)
+                return None
+
+
+if __name__ == '__main__':
+    write_tables()
@@ -122,7 +122,8 @@ def t_STRING(t):
 
 def t_NUMBER(t):
     r""" \d+(\.\d+)? """
-    t.value = Decimal(t.value)
+    # lexers may set number_type (see Tokenizer), e.g. to float
+    t.value = getattr(t.lexer, 'number_type', Decimal)(t.value)
     return t
 
 
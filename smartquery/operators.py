@@ -0,0 +1,159 @@
+from decimal import Context, Decimal as Decimal_, getcontext
+from typing import Any, Callable, Dict
+
+import math
+import operator
+
+from smartquery.exceptions import ParserError
+
+
+NUMERIC_TYPES = (Decimal_, int, float)
+
+# powers are computed with the precision, rounding and traps of the decimal context of the calling thread,
+# but their exponent stays within the default bounds, so e.g. 10 ** 10 ** 9 fails fast instead of
+# building a huge number even if the thread's context allows it
+POWER_MAX_EXP = 999999
+
+
+def _power_context() -> Context:
+    context = getcontext()
+    if context.Emax <= POWER_MAX_EXP and context.Emin >= -POWER_MAX_EXP:
+        return context
+
+    context = context.copy()
+    context.Emax = min(context.Emax, POWER_MAX_EXP)
+    context.Emin = max(context.Emin, -POWER_MAX_EXP)
+    return context
+
+
+def _floats(op1: Any, op2: Any) -> bool:
+    # numeric_mode='float': floats are computed natively, unless a Decimal is involved
+    return (
+        (isinstance(op1, float) or isinstance(op2, float))
+        and isinstance(op1, (float, int)) and isinstance(op2, (float, int))
+    )
+
+
+def _decimal(v: Any) -> Decimal_:
+    # numbers of the language are Decimals already: only host values (ints, floats) are converted
+    return v if isinstance(v, Decimal_) else Decimal_(v)
+
+
+def add(op1: Any, op2: Any) -> Any:
+    if isinstance(op1, str) and not isinstance(op2, str):
+        op2 = str(op2)
+    return op1 + op2
+
+
+def mul(op1: Any, op2: Any) -> Any:
+    if not isinstance(op1, NUMERIC_TYPES) or not isinstance(op2, NUMERIC_TYPES):
+        raise ParserError(f'Can\'t multiply non-numbers')
+
+    return _decimal(op1) * _decimal(op2)
+
+
+def power(op1: Any, op2: Any) -> Any:
+    # explicitly cast to Decimal to avoid powering of big integers
+    return _power_context().power(_decimal(op1), _decimal(op2))
+
+
+def float_str(v: Any) -> str:
+    # numeric_mode='float': integral floats are printed as ints, as Decimals are (i.e. '1', not '1.0')
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+
+    return str(v)
+
+
+def float_add(op1: Any, op2: Any) -> Any:
+    if isinstance(op1, str) and not isinstance(op2, str):
+        op2 = float_str(op2)
+    return op1 + op2
+
+
+def float_mul(op1: Any, op2: Any) -> Any:
+    if _floats(op1, op2):
+        return op1 * op2
+
+    return mul(op1, op2)
+
+
+def float_power(op1: Any, op2: Any) -> Any:
+    if _floats(op1, op2):
+        # math.pow raises on overflow and on negative bases with fractional exponents, instead of returning complex
+        return math.pow(op1, op2)
+
+    return power(op1, op2)
+
+
+def contains(op1: Any, op2: Any) -> bool:
+    return op1 in op2
+
+
+def not_contains(op1: Any, op2: Any) -> bool:
+    return op1 not in op2
+
+
+BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': add,
+    '-': operator.sub,
+    '*': mul,
+    '**': power,
+    '/': operator.truediv,
+
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    'not in': not_contains,
+    'in': contains,
+}
+
+# numeric_mode='float' (see SqParser)
+FLOAT_BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    **BINARY_OPERATORS,
+    '+': float_add,
+    '*': float_mul,
+    '**': float_power,
+}
+
+# and/or are lazy: the value of op1 on which op2 is not evaluated
+SHORT_CIRCUIT_OPERATORS: Dict[str, bool] = {
+    'and': False,
+    'or': True,
+}
+
+UNARY_OPERATORS: Dict[str, Callable[[Any], Any]] = {
+    '-': operator.neg,
+    'not': operator.not_,
+}
+
+SHORT_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+=': operator.iadd,
+    '-=': operator.isub,
+    '*=': operator.imul,
+    '/=': operator.itruediv,
+}
+
+
+def binary_operator(op: str, float_mode: bool = False) -> Callable[[Any, Any], Any]:
+    try:
+        return (FLOAT_BINARY_OPERATORS if float_mode else BINARY_OPERATORS)[op]
+    except KeyError:
+        raise ParserError(f'Unsupported binary operation: {op}')
+
+
+def unary_operator(op: str) -> Callable[[Any], Any]:
+    try:
+        return UNARY_OPERATORS[op]
+    except KeyError:
+        raise ParserError(f'Unsupported unary operation: {op}')
+
+
+def short_operator(op: str) -> Callable[[Any, Any], Any]:
+    try:
+        return SHORT_OPERATORS[op]
+    except KeyError:
+        raise ParserError(f'Unsupported short op: {op}')
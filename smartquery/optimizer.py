@@ -0,0 +1,135 @@
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+import dataclasses
+
+from smartquery.ast_ops import Op, NoOp, ValueOp, ConstOp, CodeOp, BinOp, UnaryOp, AssignOp, ShortOp, IfExprOp, \
+    SliceOp, CallOp, DictOp, LambdaOp, IMMUTABLE_TYPES
+
+
+# Constant folding and dead code elimination over parsed programs.
+# Operations, which fail on constant operands (e.g. `"a" * 2` or `1 / 0`), are left as is,
+# so they still raise the same errors at runtime.
+
+
+def optimize(op: Optional[Op]) -> Optional[Op]:
+    if op is None:
+        return None
+
+    return _optimize(op)
+
+
+def _optimize(op: Op) -> Op:
+    optimizer = _OPTIMIZERS.get(type(op))
+    if optimizer is None:
+        return op
+
+    return optimizer(op)
+
+
+def _is_const(op: Op) -> bool:
+    return type(op) is ValueOp or type(op) is ConstOp
+
+
+def _const_value(op: Any) -> Any:
+    # op is a ValueOp or a ConstOp (see _is_const)
+    return op.v
+
+
+def _const_builtins(ops: List[Op]) -> Tuple[str, ...]:
+    builtins: Set[str] = set()
+    for op in ops:
+        if type(op) is ConstOp:
+            builtins.update(op.builtins)
+
+    return tuple(sorted(builtins))
+
+
+def _optimize_code(op: CodeOp) -> Op:
+    lines = [_optimize(line) for line in op.lines]
+
+    # lines without side effects are dead, unless it's the last one, providing the result
+    return CodeOp([
+        line for i, line in enumerate(lines)
+        if i == len(lines) - 1 or type(line) not in (NoOp, ValueOp, ConstOp)
+    ])
+
+
+def _optimize_binop(op: BinOp) -> Op:
+    op1 = _optimize(op.op1)
+    op2 = _optimize(op.op2)
+
+    if type(op1) is ValueOp:
+        if op.short_circuit is not None:
+            return op1 if bool(op1.v) is op.short_circuit else op2
+
+        if type(op2) is ValueOp:
+            try:
+                v = op.f(op1.v, op2.v)
+            except Exception:  # pylint: disable=broad-except
+                pass
+            else:
+                if isinstance(v, IMMUTABLE_TYPES):
+                    return ValueOp(v)
+
+    return BinOp(op.op, op1, op2, op.float_mode)
+
+
+def _optimize_unary(op: UnaryOp) -> Op:
+    op1 = _optimize(op.op1)
+
+    if type(op1) is ValueOp:
+        try:
+            return ValueOp(op.f(op1.v))
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    return UnaryOp(op.op, op1)
+
+
+def _optimize_if_expr(op: IfExprOp) -> Op:
+    cond = _optimize(op.cond)
+
+    if type(cond) is ValueOp:
+        return _optimize(op.op1) if cond.v else _optimize(op.op2)
+
+    return IfExprOp(cond=cond, op1=_optimize(op.op1), op2=_optimize(op.op2))
+
+
+def _optimize_call(op: CallOp) -> Op:
+    args = [_optimize(arg) for arg in op.args]
+    call = CallOp(op.name, args=args)
+
+    if op.name == 'list' and all(_is_const(arg) for arg in args):
+        return ConstOp(
+            [_const_value(arg) for arg in args],
+            origin=call,
+            builtins=tuple(sorted({*_const_builtins(args), 'list'})))
+
+    return call
+
+
+def _optimize_dict(op: DictOp) -> Op:
+    d: List[tuple] = [(_optimize(k), _optimize(v)) for k, v in op.d]
+    dict_op = DictOp(d, op.float_mode)
+
+    if all(type(k) is ValueOp and _is_const(v) for k, v in d):
+        return ConstOp(
+            {dict_op.key_cast(_const_value(k)): _const_value(v) for k, v in d},
+            origin=dict_op,
+            builtins=_const_builtins([v for _, v in d]))
+
+    return dict_op
+
+
+_OPTIMIZERS: Dict[Type[Op], Callable[[Any], Op]] = {
+    CodeOp: _optimize_code,
+    BinOp: _optimize_binop,
+    UnaryOp: _optimize_unary,
+    IfExprOp: _optimize_if_expr,
+    CallOp: _optimize_call,
+    DictOp: _optimize_dict,
+    AssignOp: lambda op: dataclasses.replace(op, value=_optimize(op.value)),
+    ShortOp: lambda op: dataclasses.replace(op, value=_optimize(op.value)),
+    SliceOp: lambda op: SliceOp(_optimize(op.start), _optimize(op.stop), _optimize(op.step)),
+    LambdaOp: lambda op: LambdaOp(args=op.args, expr=_optimize(op.expr)),
+}
@@ -0,0 +1,764 @@
+from abc import ABC, abstractmethod
+from decimal import Decimal as Decimal_
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import sys
+
+from smartquery.custom_types import Decimal
+from smartquery.exceptions import ParserError
+from smartquery.values import copy_value
+
+
+# Persistent values (SqParser(persistent_values=True)): lists and dicts of variables are stored
+# as immutable trees with structural sharing, so assigning a value is O(1) instead of a copy,
+# and push, a[k] = v, pop or del produce a new version of the tree in O(log n).
+#
+# PVector is a 32-way trie with a tail (as vectors of Clojure), PMap is a hash array mapped trie
+# with insertion order, kept in a PVector of its items. Both are never mutated once built.
+# Programs see them through PList and PDict: mutable handles over a version of the tree,
+# implementing the part of list/dict interface used by builtins. Nested containers are stored as trees,
+# so they are values (never aliased), and an item got from a handle is a handle, which writes its
+# changes through to the parent (e.g. push(a[0], 1)), while it's still the item of the parent.
+# Results of SqParser.eval are converted back to plain lists and dicts with to_plain().
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+_IMMUTABLE = frozenset({str, bool, type(None), Decimal_, Decimal, int, float})
+
+
+class PVector:
+    # nodes are lists of (up to 32) children, leaves are lists of items; all of them are shared between versions
+    __slots__ = ('_count', '_shift', '_root', '_tail')
+
+    def __init__(self, count: int = 0, shift: int = _BITS, root: Optional[list] = None, tail: Optional[list] = None):
+        self._count = count
+        self._shift = shift
+        self._root = root if root is not None else []
+        self._tail = tail if tail is not None else []
+
+    @classmethod
+    def from_list(cls, items: list) -> 'PVector':
+        count = len(items)
+        if count <= _WIDTH:
+            return cls(count, _BITS, [], items[:])
+
+        tail_offset = ((count - 1) >> _BITS) << _BITS
+        nodes = [items[i:i + _WIDTH] for i in range(0, tail_offset, _WIDTH)]
+
+        shift = _BITS
+        while len(nodes) > _WIDTH:
+            nodes = [nodes[i:i + _WIDTH] for i in range(0, len(nodes), _WIDTH)]
+            shift += _BITS
+
+        return cls(count, shift, nodes, items[tail_offset:])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _tail_offset(self) -> int:
+        return 0 if self._count <= _WIDTH else ((self._count - 1) >> _BITS) << _BITS
+
+    def _leaf(self, i: int) -> list:
+        if i >= self._tail_offset():
+            return self._tail
+
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node[(i >> level) & _MASK]
+            level -= _BITS
+
+        return node
+
+    def get(self, i: int) -> Any:
+        # i is in range(len(self))
+        return self._leaf(i)[i & _MASK]
+
+    def set(self, i: int, v: Any) -> 'PVector':
+        if i >= self._tail_offset():
+            tail = self._tail.copy()
+            tail[i & _MASK] = v
+            return PVector(self._count, self._shift, self._root, tail)
+
+        return PVector(self._count, self._shift, self._assoc(self._shift, self._root, i, v), self._tail)
+
+    def _assoc(self, level: int, node: list, i: int, v: Any) -> list:
+        node = node.copy()
+        if level == 0:
+            node[i & _MASK] = v
+        else:
+            sub = (i >> level) & _MASK
+            node[sub] = self._assoc(level - _BITS, node[sub], i, v)
+
+        return node
+
+    def append(self, v: Any) -> 'PVector':
+        count = self._count
+        if count - self._tail_offset() < _WIDTH:
+            return PVector(count + 1, self._shift, self._root, [*self._tail, v])
+
+        # the tail is full: move it to the tree
+        shift = self._shift
+        if (count >> _BITS) > (1 << shift):
+            root = [self._root, _new_path(shift, self._tail)]
+            shift += _BITS
+        else:
+            root = self._push_tail(shift, self._root, self._tail)
+
+        return PVector(count + 1, shift, root, [v])
+
+    def _push_tail(self, level: int, node: list, tail: list) -> list:
+        sub = ((self._count - 1) >> level) & _MASK
+        node = node.copy()
+
+        if level == _BITS:
+            child = tail
+        elif sub < len(node):
+            child = self._push_tail(level - _BITS, node[sub], tail)
+        else:
+            child = _new_path(level - _BITS, tail)
+
+        if sub < len(node):
+            node[sub] = child
+        else:
+            node.append(child)
+
+        return node
+
+    def pop(self) -> 'PVector':
+        # drops the last item
+        count = self._count
+        if count <= 1:
+            return _EMPTY_VECTOR
+
+        if count - self._tail_offset() > 1:
+            return PVector(count - 1, self._shift, self._root, self._tail[:-1])
+
+        tail = self._leaf(count - 2)
+        root = self._pop_tail(self._shift, self._root)
+        shift = self._shift
+        if root is None:
+            root = []
+        elif shift > _BITS and len(root) == 1:
+            root = root[0]
+            shift -= _BITS
+
+        return PVector(count - 1, shift, root, tail)
+
+    def _pop_tail(self, level: int, node: list) -> Optional[list]:
+        sub = ((self._count - 2) >> level) & _MASK
+        if level > _BITS:
+            child = self._pop_tail(level - _BITS, node[sub])
+            if child is None:
+                return node[:sub] if sub else None
+
+            node = node.copy()
+            node[sub] = child
+            return node
+
+        return node[:sub] if sub else None
+
+    def tolist(self) -> list:
+        items: list = []
+        _collect(self._root, self._shift, items)
+        items.extend(self._tail)
+        return items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.tolist())
+
+
+def _new_path(level: int, node: list) -> list:
+    while level > 0:
+        node = [node]
+        level -= _BITS
+
+    return node
+
+
+def _collect(node: list, level: int, items: list):
+    if level == _BITS:
+        for leaf in node:
+            items.extend(leaf)
+    else:
+        for child in node:
+            _collect(child, level - _BITS, items)
+
+
+_EMPTY_VECTOR = PVector()
+
+
+# HAMT: a node is a bitmap of occupied slots (5 bits of the hash per level) and a list of its entries,
+# an entry is a leaf (hash, key, value) or a child node;
+# keys with the same 64 bit hash end up in a collision node (a list of leaves) below the last level.
+# Keys are never removed: a deleted key is set to _HOLE
+
+_HASH_MASK = (1 << 64) - 1
+_MAX_SHIFT = 64
+
+
+class _Node:
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap: int, entries: list):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _Collision:
+    __slots__ = ('leaves',)
+
+    def __init__(self, leaves: list):
+        self.leaves = leaves
+
+
+if sys.version_info >= (3, 10):
+    _popcount = int.bit_count
+else:
+    def _popcount(v: int) -> int:
+        return bin(v).count('1')
+
+
+_MISSING = object()
+
+
+def _hamt_get(node: Optional[Union[_Node, _Collision]], h: int, key: Any) -> Any:
+    shift = 0
+    while node is not None:
+        if isinstance(node, _Collision):
+            for leaf in node.leaves:
+                if leaf[1] is key or leaf[1] == key:
+                    return leaf[2]
+            return _MISSING
+
+        bit = 1 << ((h >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return _MISSING
+
+        entry = node.entries[_popcount(node.bitmap & (bit - 1))]
+        if type(entry) is tuple:
+            return entry[2] if entry[0] == h and (entry[1] is key or entry[1] == key) else _MISSING
+
+        node = entry
+        shift += _BITS
+
+    return _MISSING
+
+
+def _hamt_set(node: Optional[Union[_Node, _Collision]], shift: int, leaf: tuple) -> Union[_Node, _Collision]:
+    h, key = leaf[0], leaf[1]
+
+    if node is None:
+        return _Node(1 << ((h >> shift) & _MASK), [leaf])
+
+    if isinstance(node, _Collision):
+        leaves = [old for old in node.leaves if not (old[1] is key or old[1] == key)]
+        leaves.append(leaf)
+        return _Collision(leaves)
+
+    bit = 1 << ((h >> shift) & _MASK)
+    i = _popcount(node.bitmap & (bit - 1))
+    entries = node.entries.copy()
+
+    if not node.bitmap & bit:
+        entries.insert(i, leaf)
+        return _Node(node.bitmap | bit, entries)
+
+    entry = entries[i]
+    if type(entry) is tuple:
+        if entry[0] == h and (entry[1] is key or entry[1] == key):
+            entries[i] = leaf
+        else:
+            entries[i] = _merge(shift + _BITS, entry, leaf)
+    else:
+        entries[i] = _hamt_set(entry, shift + _BITS, leaf)
+
+    return _Node(node.bitmap, entries)
+
+
+def _merge(shift: int, leaf1: tuple, leaf2: tuple) -> Union[_Node, _Collision]:
+    if shift >= _MAX_SHIFT:
+        return _Collision([leaf1, leaf2])
+
+    i1 = (leaf1[0] >> shift) & _MASK
+    i2 = (leaf2[0] >> shift) & _MASK
+    if i1 == i2:
+        return _Node(1 << i1, [_merge(shift + _BITS, leaf1, leaf2)])
+
+    return _Node((1 << i1) | (1 << i2), [leaf1, leaf2] if i1 < i2 else [leaf2, leaf1])
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+_HOLE = object()
+
+
+class PMap:
+    # the index maps keys to positions in _items, a PVector of (key, value) pairs in insertion order.
+    # It's a plain dict (never mutated), built at C speed, and a trie of keys added or deleted since then:
+    # once there are more of them than half of the items, the map is built again,
+    # which also drops holes, left by deleted items
+    __slots__ = ('_base', '_overlay', '_changes', '_items', '_len')
+
+    def __init__(
+        self,
+        base: Optional[Dict[Any, int]] = None,
+        overlay: Optional[Union[_Node, _Collision]] = None,
+        changes: int = 0,
+        items: PVector = _EMPTY_VECTOR,
+        length: int = 0,
+    ):
+        self._base = base if base is not None else {}
+        self._overlay = overlay
+        self._changes = changes
+        self._items = items
+        self._len = length
+
+    @classmethod
+    def from_pairs(cls, pairs: List[Tuple[Any, Any]]) -> 'PMap':
+        # keys are unique
+        return cls({k: i for i, (k, _) in enumerate(pairs)}, None, 0, PVector.from_list(pairs), len(pairs))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _position(self, key: Any) -> Any:
+        if self._overlay is not None:
+            i = _hamt_get(self._overlay, _hash(key), key)
+            if i is not _MISSING:
+                return _MISSING if i is _HOLE else i
+
+        return self._base.get(key, _MISSING)
+
+    def _changed(self, key: Any, i: Any, items: PVector, length: int) -> 'PMap':
+        res = PMap(
+            self._base, _hamt_set(self._overlay, 0, (_hash(key), key, i)), self._changes + 1, items, length)
+        if res._changes > (len(items) >> 1) + _WIDTH:
+            return PMap.from_pairs(res.pairs())
+
+        return res
+
+    def get(self, key: Any, default: Any = _MISSING) -> Any:
+        i = self._position(key)
+        if i is _MISSING:
+            return default
+
+        return self._items.get(i)[1]
+
+    def __contains__(self, key: Any) -> bool:
+        return self._position(key) is not _MISSING
+
+    def set(self, key: Any, value: Any) -> 'PMap':
+        i = self._position(key)
+        if i is not _MISSING:
+            return PMap(self._base, self._overlay, self._changes, self._items.set(i, (key, value)), self._len)
+
+        return self._changed(key, len(self._items), self._items.append((key, value)), self._len + 1)
+
+    def delete(self, key: Any) -> 'PMap':
+        i = self._position(key)
+        if i is _MISSING:
+            return self
+
+        return self._changed(key, _HOLE, self._items.set(i, _HOLE), self._len - 1)
+
+    def pairs(self) -> List[Tuple[Any, Any]]:
+        return [p for p in self._items.tolist() if p is not _HOLE]
+
+
+_EMPTY_MAP = PMap()
+
+
+def _check_index(v: PVector, i: Any) -> int:
+    if type(i) is not int and type(i) is not bool:
+        raise TypeError(f'list indices must be integers or slices, not {type(i).__name__}')
+
+    n = len(v)
+    if i < 0:
+        i += n
+    if not 0 <= i < n:
+        raise IndexError('list index out of range')
+
+    return i
+
+
+class _Handle(ABC):
+    # an item of a parent handle writes its changes through, while the parent still has it at the same key
+    __slots__ = ('_parent', '_key')
+
+    def _init_parent(self, parent: Optional['_Handle'], key: Any):
+        self._parent = parent
+        self._key = key
+
+    @abstractmethod
+    def _replace(self, key: Any, new: Any):
+        ...
+
+    def _written(self, old: Any, new: Any):
+        parent = self._parent
+        if parent is not None:
+            if parent._frozen_item(self._key) is old:
+                parent._replace(self._key, new)
+            else:
+                self._parent = None
+
+    @abstractmethod
+    def _frozen_item(self, key: Any) -> Any:
+        ...
+
+    def __eq__(self, other):
+        if isinstance(other, (list, dict, _Handle)):
+            return to_plain(self) == to_plain(other)
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        res = self.__eq__(other)
+        return res if res is NotImplemented else not res
+
+    def __repr__(self):
+        return repr(to_plain(self))
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    @abstractmethod
+    def copy(self) -> '_Handle':
+        ...
+
+    __hash__ = None  # type: ignore
+
+
+class PList(_Handle):
+    __slots__ = ('_v',)
+
+    def __init__(self, v: PVector = _EMPTY_VECTOR, parent: Optional[_Handle] = None, key: Any = None):
+        self._v = v
+        self._init_parent(parent, key)
+
+    def _set_root(self, v: PVector):
+        old = self._v
+        self._v = v
+        self._written(old, v)
+
+    def _frozen_item(self, key: int) -> Any:
+        return self._v.get(key) if key < len(self._v) else _MISSING
+
+    def _replace(self, key: int, new: Any):
+        self._set_root(self._v.set(key, new))
+
+    def copy(self) -> 'PList':
+        return PList(self._v)
+
+    def __len__(self) -> int:
+        return len(self._v)
+
+    def __getitem__(self, i: Any) -> Any:
+        if type(i) is slice:
+            return PList(PVector.from_list(self._v.tolist()[i]))
+
+        i = _check_index(self._v, i)
+        return _thaw(self._v.get(i), self, i)
+
+    def __setitem__(self, i: Any, value: Any):
+        i = _check_index(self._v, i)
+        self._set_root(self._v.set(i, freeze(value)))
+
+    def __delitem__(self, i: Any):
+        i = _check_index(self._v, i)
+        if i == len(self._v) - 1:
+            self._set_root(self._v.pop())
+        else:
+            items = self._v.tolist()
+            del items[i]
+            self._set_root(PVector.from_list(items))
+
+    def __iter__(self) -> Iterator[Any]:
+        for i, item in enumerate(self._v.tolist()):
+            yield item if type(item) in _IMMUTABLE else _thaw(item, self, i)
+
+    def __reversed__(self) -> Iterator[Any]:
+        items = self._v.tolist()
+        for i in range(len(items) - 1, -1, -1):
+            yield _thaw(items[i], self, i)
+
+    def __contains__(self, value: Any) -> bool:
+        return any(item == value for item in self)
+
+    def __lt__(self, other):
+        return to_plain(self) < to_plain(other)
+
+    def __le__(self, other):
+        return to_plain(self) <= to_plain(other)
+
+    def __gt__(self, other):
+        return to_plain(self) > to_plain(other)
+
+    def __ge__(self, other):
+        return to_plain(self) >= to_plain(other)
+
+    def __add__(self, other: Any) -> 'PList':
+        if not isinstance(other, (list, PList)):
+            return NotImplemented
+
+        return PList(PVector.from_list(self._v.tolist() + _frozen_items(other)))
+
+    def __radd__(self, other: Any) -> 'PList':
+        if not isinstance(other, list):
+            return NotImplemented
+
+        return PList(PVector.from_list(_frozen_items(other) + self._v.tolist()))
+
+    def __iadd__(self, other: Any) -> 'PList':
+        v = self._v
+        for item in _frozen_items(other):
+            v = v.append(item)
+
+        self._set_root(v)
+        return self
+
+    def append(self, value: Any):
+        self._set_root(self._v.append(freeze(value)))
+
+    def insert(self, i: int, value: Any):
+        n = len(self._v)
+        if i >= n:
+            self.append(value)
+            return
+
+        items = self._v.tolist()
+        items.insert(i, freeze(value))
+        self._set_root(PVector.from_list(items))
+
+    def pop(self, i: int = -1) -> Any:
+        if not len(self._v):
+            raise IndexError('pop from empty list')
+
+        i = _check_index(self._v, i)
+        item = _thaw(self._v.get(i), None, None)
+        del self[i]
+        return item
+
+    def index(self, value: Any) -> int:
+        for i, item in enumerate(self):
+            if item == value:
+                return i
+
+        raise ValueError(f'{value!r} is not in list')
+
+    def remove(self, value: Any):
+        del self[self.index(value)]
+
+
+class PDict(_Handle):
+    __slots__ = ('_m',)
+
+    def __init__(self, m: PMap = _EMPTY_MAP, parent: Optional[_Handle] = None, key: Any = None):
+        self._m = m
+        self._init_parent(parent, key)
+
+    def _set_root(self, m: PMap):
+        old = self._m
+        self._m = m
+        self._written(old, m)
+
+    def _frozen_item(self, key: Any) -> Any:
+        return self._m.get(key)
+
+    def _replace(self, key: Any, new: Any):
+        self._set_root(self._m.set(key, new))
+
+    def copy(self) -> 'PDict':
+        return PDict(self._m)
+
+    def __len__(self) -> int:
+        return len(self._m)
+
+    def __getitem__(self, key: Any) -> Any:
+        v = self._m.get(key)
+        if v is _MISSING:
+            raise KeyError(key)
+
+        return _thaw(v, self, key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        v = self._m.get(key)
+        if v is _MISSING:
+            return default
+
+        return _thaw(v, self, key)
+
+    def __setitem__(self, key: Any, value: Any):
+        self._set_root(self._m.set(key, freeze(value)))
+
+    def __delitem__(self, key: Any):
+        if key not in self._m:
+            raise KeyError(key)
+
+        self._set_root(self._m.delete(key))
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._m
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.keys())
+
+    def keys(self) -> List[Any]:
+        return [k for k, _ in self._m.pairs()]
+
+    def values(self) -> List[Any]:
+        return [_thaw(v, self, k) for k, v in self._m.pairs()]
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        return [(k, _thaw(v, self, k)) for k, v in self._m.pairs()]
+
+
+def _thaw(item: Any, parent: Optional[_Handle], key: Any) -> Any:
+    t = type(item)
+    if t is PVector:
+        return PList(item, parent, key)
+    elif t is PMap:
+        return PDict(item, parent, key)
+    elif t is tuple:
+        return tuple(_thaw(v, None, None) for v in item)
+
+    return item
+
+
+def _frozen_items(items: Any) -> list:
+    return [freeze(item) for item in items]
+
+
+def persist(v: Any) -> Any:
+    # copy of an assigned value (see VMState.copy_value): lists and dicts become persistent
+    t = type(v)
+    if t in _IMMUTABLE:
+        return v
+    elif t is PList or t is PDict:
+        return v.copy()
+    elif t is list or t is dict or t is PVector or t is PMap:
+        return _thaw(freeze(v), None, None)
+
+    return copy_value(v)
+
+
+def freeze(v: Any, _seen: Optional[set] = None) -> Any:
+    # immutable version of a value: the tree of a persistent value, new tree of a plain list or dict
+    t = type(v)
+    if t in _IMMUTABLE:
+        return v
+    elif t is PList:
+        return v._v
+    elif t is PDict:
+        return v._m
+    elif t is list or t is dict or t is tuple:
+        items = v if t is not dict else v.values()
+        if all(type(item) in _IMMUTABLE for item in items):
+            if t is list:
+                return PVector.from_list(v)
+            elif t is dict:
+                return PMap.from_pairs(list(v.items()))
+
+            return v
+
+        if _seen is None:
+            _seen = set()
+        if id(v) in _seen:
+            raise ParserError('Cyclic values can\'t be persistent')
+
+        _seen.add(id(v))
+        try:
+            if t is list:
+                return PVector.from_list([freeze(item, _seen) for item in v])
+            elif t is dict:
+                return PMap.from_pairs([(k, freeze(item, _seen)) for k, item in v.items()])
+
+            return tuple(freeze(item, _seen) for item in v)
+        finally:
+            _seen.discard(id(v))
+    elif t is PVector or t is PMap:
+        return v
+
+    return copy_value(v)
+
+
+def to_plain(v: Any) -> Any:
+    # plain lists and dicts instead of persistent values (anywhere in v)
+    t = type(v)
+    if t in _IMMUTABLE:
+        return v
+    elif t is PList:
+        return _plain_vector(v._v)
+    elif t is PDict:
+        return _plain_map(v._m)
+    elif t is PVector:
+        return _plain_vector(v)
+    elif t is PMap:
+        return _plain_map(v)
+    elif t is list:
+        if all(type(item) in _IMMUTABLE for item in v):
+            return v
+
+        return [to_plain(item) for item in v]
+    elif t is dict:
+        if all(type(item) in _IMMUTABLE for item in v.values()):
+            return v
+
+        return {k: to_plain(item) for k, item in v.items()}
+    elif t is tuple:
+        return tuple(to_plain(item) for item in v)
+
+    return v
+
+
+def plain_names(names: Dict[str, Any]):
+    # variables assigned by a program end up in the names dict of the caller, and persistent values may be
+    # written into plain lists and dicts of the caller (e.g. push(a, b) or d["k"] = b):
+    # all of them are made plain in place, so the caller's containers stay the same objects
+    _plain_in_place(names, set())
+
+
+def _plain_in_place(container: Any, seen: Set[int]):
+    if id(container) in seen:
+        return
+    seen.add(id(container))
+
+    items = enumerate(container) if type(container) is list else list(container.items())
+    for k, v in items:
+        if type(v) not in _IMMUTABLE:
+            plain = _plain_item(v, seen)
+            if plain is not v:
+                container[k] = plain
+
+
+def _plain_item(v: Any, seen: Set[int]) -> Any:
+    t = type(v)
+    if t is list or t is dict:
+        _plain_in_place(v, seen)
+    elif t is PList or t is PDict or t is PVector or t is PMap:
+        return to_plain(v)
+    elif t is tuple:
+        items = [_plain_item(item, seen) for item in v]
+        if any(a is not b for a, b in zip(items, v)):
+            return tuple(items)
+
+    return v
+
+
+def _plain_vector(v: PVector) -> list:
+    items = v.tolist()
+    if all(type(item) in _IMMUTABLE for item in items):
+        return items
+
+    return [to_plain(item) for item in items]
+
+
+def _plain_map(m: PMap) -> Dict[Any, Any]:
+    return {k: to_plain(item) for k, item in m.pairs()}
@@ -0,0 +1,377 @@
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple, cast
+
+from smartquery import lexer as lexer_module
+from smartquery import rules
+from smartquery.ast_ops import ValueOp, UnaryOp, NameOp, AssignOp, CallOp, LambdaOp, BinOp, IfExprOp, \
+    SliceOp, Op, DictOp, CodeOp, ShortOp, NONE, TRUE, FALSE
+from smartquery.exceptions import ParserError
+
+
+# Hand-written precedence climbing parser, producing the same Op trees and errors as the LALR parser
+# built from smartquery/rules.py (which stays the reference grammar).
+#
+# Shift/reduce decisions follow PLY's resolution of conflicts with lexer.precedence:
+# an operator token is shifted while its level is higher than the level of the rule being parsed
+# (or equal for right associative rules) and is a syntax error for equal nonassoc levels.
+# Rules without a precedence (lambdas and else branches) have level 0, so they take everything to the right.
+# Quirks of the grammar are kept as is, e.g.:
+# - `not` and unary minus bind tighter than `.` and `|`: `-a.f()` is `(-a).f()`
+# - `not in` shifts at the level of `not`: `a + b not in c` is `a + (b not in c)`
+# - `x.f(a, b,)` loses its last argument, `{a: 1, b: 2,}` is a syntax error
+
+_PRECEDENCE: Dict[str, Tuple[int, str]] = {
+    token: (level, assoc)
+    for level, (assoc, *tokens) in enumerate(lexer_module.precedence, start=1)
+    for token in tokens
+}
+
+_NO_PRECEDENCE = (0, 'right')
+_TOP = (-1, 'right')
+
+_BINARY = {'PLUS', 'MINUS', 'TIMES', 'POWER', 'DIVIDE', 'EQ', 'NE', 'GT', 'LT', 'GTE', 'LTE', 'IN', 'AND', 'OR'}
+
+# tokens, which continue an expression, and the precedence they are shifted with
+_INFIX: Dict[str, Tuple[int, str]] = {
+    **{token: _PRECEDENCE[token] for token in _BINARY},
+    'NOT': _PRECEDENCE['NOT'],
+    'DOT': _PRECEDENCE['DOT'],
+    'PIPE': _PRECEDENCE['PIPE'],
+    'LBRACKET': _PRECEDENCE['LBRACKET'],
+    'IF': _NO_PRECEDENCE,
+}
+
+_RESERVED_UNUSED = set(lexer_module.reserved_unused.values())
+
+# lookaheads, on which the LALR parser reduces a complete primary expression
+_EXPRESSION_FOLLOW = {*_INFIX, 'NEWLINE', '$end', 'RBRACKET', 'COMMA', 'RPAREN', 'COLON', 'ELSE', 'RBRACE'}
+
+_VALUES = {
+    'TRUE': TRUE,
+    'FALSE': FALSE,
+    'NONE': NONE,
+}
+
+
+class PrattParser:
+    def __init__(self, lexer: Any):
+        self.lexer = lexer
+        self._next_token: Callable[[], Any] = lexer.token
+
+        self.tok: Any = None
+        self.type = '$end'
+        self.count = 0
+
+        # (base, key) of the last `base[key]` of the outermost expression parsed, for statements
+        self._subscript: Optional[Tuple[Op, Op]] = None
+
+    def parse(self, s: str) -> CodeOp:
+        self.lexer.input(s)
+        self._next_token = self.lexer.token
+        self._advance()
+
+        lines = [self._statement()]
+        while self.type == 'NEWLINE':
+            self._advance()
+            lines.append(self._statement())
+
+        if self.type != '$end':
+            self._error()
+
+        return CodeOp([line for line in lines if line is not None])
+
+    def _advance(self) -> Any:
+        tok = self.tok
+        self.tok = self._next_token()
+        self.type = self.tok.type if self.tok is not None else '$end'
+        self.count += 1
+        return tok
+
+    def _expect(self, type_: str) -> Any:
+        if self.type != type_:
+            self._error()
+
+        return self._advance()
+
+    def _error(self) -> NoReturn:
+        tok = self.tok
+        if tok is not None:
+            tok.lexer = self.lexer
+
+        rules.p_error(tok)
+        raise AssertionError  # unreachable, p_error always raises
+
+    # statements
+
+    def _statement(self) -> Optional[Op]:
+        type_ = self.type
+
+        if type_ == 'NEWLINE' or type_ == '$end':
+            return None
+
+        if type_ == 'DEL':
+            self._advance()
+            self._expression(_TOP)
+
+            if self._subscript is None:
+                self._error()
+
+            return CallOp(name='__delitem__', args=[*self._subscript])
+
+        if type_ == 'NAME':
+            tok = self._advance()
+
+            if self.type == 'ASSIGN':
+                self._advance()
+                return AssignOp(tok.value, self._expression(_TOP))
+            elif self.type == 'SHORT_OP':
+                op = self._advance().value
+                return ShortOp(tok.value, op, self._expression(_TOP))
+
+            left = self._infix(self._name(tok), _TOP)
+        else:
+            left = self._expression(_TOP)
+
+        if self.type == 'ASSIGN' or self.type == 'SHORT_OP':
+            subscript = self._subscript
+            if subscript is None:
+                self._error()
+
+            tok = self._advance()
+            if tok.type == 'ASSIGN':
+                return CallOp(name='__setitem__', args=[*subscript, self._expression(_TOP)])
+
+            return CallOp(name='__setitem_with_op__', args=[*subscript, ValueOp(tok.value), self._expression(_TOP)])
+
+        return left
+
+    # expressions
+
+    def _expression(self, rule: Tuple[int, str]) -> Op:
+        return self._infix(self._prefix(), rule)
+
+    def _prefix(self) -> Op:
+        type_ = self.type
+
+        if type_ == 'NAME':
+            return self._name(self._advance())
+        elif type_ == 'NUMBER' or type_ == 'STRING':
+            return ValueOp(self._advance().value)
+        elif type_ in _VALUES:
+            self._advance()
+            return _VALUES[type_]
+        elif type_ == 'MINUS':
+            self._advance()
+            return UnaryOp('-', self._expression(_PRECEDENCE['UMINUS']))
+        elif type_ == 'NOT':
+            self._advance()
+            return UnaryOp('not', self._expression(_PRECEDENCE['NOT']))
+        elif type_ == 'LPAREN':
+            return self._paren()
+        elif type_ == 'LBRACKET':
+            self._advance()
+            if self.type == 'RBRACKET':
+                self._advance()
+                return CallOp(name='list', args=[])
+
+            args = self._arglist('RBRACKET')
+            self._expect('RBRACKET')
+            return CallOp(name='list', args=args)
+        elif type_ == 'LBRACE':
+            return self._dict()
+        elif type_ in _RESERVED_UNUSED:
+            value = self._advance().value
+            if self.type not in _EXPRESSION_FOLLOW:
+                self._error()
+
+            raise ParserError(f'{value} is reserved keyword')
+
+        self._error()
+
+    def _name(self, tok: Any) -> Op:
+        if self.type == 'LPAREN':
+            self._advance()
+            if self.type == 'RPAREN':
+                self._advance()
+                return CallOp(tok.value, args=[])
+
+            args = self._arglist('RPAREN')
+            self._expect('RPAREN')
+            return CallOp(tok.value, args=args)
+        elif self.type == 'LAMBDA':
+            self._advance()
+            return LambdaOp(args=[NameOp(tok.value)], expr=self._expression(_NO_PRECEDENCE))
+
+        return NameOp(tok.value)
+
+    def _arglist(self, closing: str) -> List[Op]:
+        # expressions separated by commas, with an optional trailing comma before the closing token
+        args = [self._expression(_TOP)]
+        while self.type == 'COMMA':
+            self._advance()
+            if self.type == closing:
+                break
+            args.append(self._expression(_TOP))
+
+        return args
+
+    def _paren(self) -> Op:
+        self._advance()
+        first = self._expression(_TOP)
+
+        if self.type == 'RPAREN':
+            self._advance()
+            return first
+
+        # (arg, ..., name) => expr
+        args = [first]
+        while self.type == 'COMMA':
+            self._advance()
+
+            start = self.count
+            tok = self.tok
+            arg = self._expression(_TOP)
+
+            if self.type == 'RPAREN' and self.count == start + 1 and tok.type == 'NAME':
+                self._advance()
+                self._expect('LAMBDA')
+                # as of the LALR grammar, args before the last one may be any expressions
+                lambda_args = cast(List[NameOp], [*args, NameOp(tok.value)])
+                return LambdaOp(args=lambda_args, expr=self._expression(_NO_PRECEDENCE))
+
+            args.append(arg)
+
+        self._error()
+
+    def _dict(self) -> Op:
+        self._advance()
+        if self.type == 'RBRACE':
+            self._advance()
+            return CallOp(name='dict', args=[])
+
+        items = [self._dict_item()]
+        if self.type == 'COMMA':
+            self._advance()
+            if self.type != 'RBRACE':
+                # a trailing comma is allowed after a single item only
+                items.append(self._dict_item())
+                while self.type == 'COMMA':
+                    self._advance()
+                    items.append(self._dict_item())
+
+        self._expect('RBRACE')
+        return DictOp(items, float_mode=self.lexer.float_mode)
+
+    def _dict_item(self) -> tuple:
+        k = self._expression(_TOP)
+        self._expect('COLON')
+        return k, self._expression(_TOP)
+
+    def _infix(self, left: Op, rule: Tuple[int, str]) -> Op:
+        rule_level, rule_assoc = rule
+        subscript = None
+
+        while True:
+            type_ = self.type
+            prec = _INFIX.get(type_)
+            if prec is None:
+                break
+
+            level = prec[0]
+            if level < rule_level or (level == rule_level and rule_assoc == 'left'):
+                break
+            if level == rule_level and rule_assoc == 'nonassoc':
+                self._error()
+
+            subscript = None
+            if type_ in _BINARY:
+                op = self._advance().value
+                left = BinOp(op, left, self._expression(prec), float_mode=self.lexer.float_mode)
+            elif type_ == 'NOT':
+                self._advance()
+                self._expect('IN')
+                left = BinOp(
+                    'not in', left, self._expression(_PRECEDENCE['IN']), float_mode=self.lexer.float_mode)
+            elif type_ == 'LBRACKET':
+                left, subscript = self._getitem(left)
+            elif type_ == 'IF':
+                self._advance()
+                cond = self._expression(_TOP)
+                self._expect('ELSE')
+                left = IfExprOp(cond=cond, op1=left, op2=self._expression(_NO_PRECEDENCE))
+            else:
+                left = self._method_call(left, type_)
+
+        self._subscript = subscript
+        return left
+
+    def _method_call(self, left: Op, type_: str) -> Op:
+        self._advance()
+        name = self._expect('NAME').value
+
+        if type_ == 'PIPE' and self.type != 'LPAREN':
+            return CallOp(name, args=[left])
+
+        self._expect('LPAREN')
+        if type_ == 'DOT' and self.type == 'RPAREN':
+            self._advance()
+            return CallOp(name, args=[left])
+
+        args = [self._expression(_TOP)]
+        while self.type == 'COMMA':
+            self._advance()
+            if self.type == 'RPAREN':
+                # the grammar drops the last argument, when it's followed by a comma
+                args.pop()
+                break
+            args.append(self._expression(_TOP))
+
+        self._expect('RPAREN')
+        return CallOp(name, args=[left, *args])
+
+    def _getitem(self, left: Op) -> Tuple[Op, Optional[Tuple[Op, Op]]]:
+        self._advance()
+
+        # slice is a list of expressions and ':', as in rules.p_slice
+        parts: List[Any]
+        if self.type == 'COLON':
+            self._advance()
+            if self.type == 'COLON':
+                self._advance()
+                parts = [':', ':', self._expression(_TOP)]
+            elif self.type == 'RBRACKET':
+                parts = [':']
+            else:
+                parts = [':', self._expression(_TOP)]
+                if self.type == 'COLON':
+                    self._advance()
+                    parts.append(':')
+        else:
+            key = self._expression(_TOP)
+            if self.type == 'RBRACKET':
+                self._advance()
+                return CallOp(name='__getitem__', args=[left, key]), (left, key)
+
+            self._expect('COLON')
+            if self.type == 'COLON':
+                self._advance()
+                parts = [key, ':', ':']
+            elif self.type == 'RBRACKET':
+                parts = [key, ':']
+            else:
+                parts = [key, ':', self._expression(_TOP)]
+
+        self._expect('RBRACKET')
+
+        args = []
+        was_arg = False
+        for el in parts:
+            if el == ':':
+                if not was_arg:
+                    args.append(NONE)
+                else:
+                    was_arg = False
+            else:
+                args.append(el)
+                was_arg = True
+
+        return CallOp(name='__getitem__', args=[left, SliceOp(*args)]), None
@@ -1,6 +1,6 @@
 from smartquery import lexer
 from smartquery.ast_ops import ValueOp, UnaryOp, NameOp, AssignOp, CallOp, LambdaOp, BinOp, IfExprOp, NoOp, \
-    SliceOp, Op, DictOp, CodeOp, ShortOp
+    SliceOp, Op, DictOp, CodeOp, ShortOp, NONE, TRUE, FALSE
 from smartquery.exceptions import ParserError
 
 
@@ -137,9 +137,9 @@ def p_expression_binop(p):
                    | expression OR expression
     """
     if p.slice[3].type == 'IN':
-        p[0] = BinOp('not in', p[1], p[4])
+        p[0] = BinOp('not in', p[1], p[4], float_mode=p.lexer.float_mode)
     else:
-        p[0] = BinOp(p[2], p[1], p[3])
+        p[0] = BinOp(p[2], p[1], p[3], float_mode=p.lexer.float_mode)
 
 
 def p_list_literal(p):
@@ -161,7 +161,7 @@ def p_dict_literal(p):
     if len(p) == 3:
         p[0] = CallOp(name='dict', args=[])
     else:
-        p[0] = DictOp(p[2])
+        p[0] = DictOp(p[2], float_mode=p.lexer.float_mode)
 
 
 def p_slice(p):
@@ -192,7 +192,7 @@ def p_getitem(p):
         for el in key:
             if el == ':':
                 if not was_arg:
-                    args.append(ValueOp(None))
+                    args.append(NONE)
                 else:
                     was_arg = False
             else:
@@ -238,17 +238,17 @@ def p_expression_group(p):
 
 def p_expression_true(p):
     """ expression : TRUE """
-    p[0] = ValueOp(True)
+    p[0] = TRUE
 
 
 def p_expression_false(p):
     """ expression : FALSE """
-    p[0] = ValueOp(False)
+    p[0] = FALSE
 
 
 def p_expression_none(p):
     """ expression : NONE """
-    p[0] = ValueOp(None)
+    p[0] = NONE
 
 
 def p_expression_not(p):
@@ -1,25 +1,106 @@
 from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+_MISSING = object()
 
 
 class ScopedDict:
-    def __init__(self, initial_scope: dict):
+    # Names are scoped dynamically: a name is resolved in the innermost scope of the call stack, which has it
+    # (e.g. a lambda sees the arguments of its callers), and assignments go to the innermost scope.
+    #
+    # The first FLAT_DEPTH scopes (functions, names of the program and the outer lambda calls) are searched as is.
+    # Bindings of the scopes of deeper calls are merged into one flat dict, which is probed first, so a lookup
+    # takes at most FLAT_DEPTH + 1 probes at any depth of calls ("shallow binding"); the base scopes, which
+    # may be large (e.g. names of a row), are never copied. Every scope above them records bindings of the flat
+    # dict it has shadowed or added, to restore them when it's popped; popping the last one drops the dict.
+    # Scope dicts stay the source of truth for assignments, so they must not be mutated directly
+    # while the flat dict is in use.
+    # A read-only scope (MappingProxyType, e.g. shared builtins) is copied on the first assignment to it.
+
+    # a walk through a few scopes is cheaper than the bookkeeping of the flat dict per call,
+    # which pays off in deep (e.g. recursive) calls only
+    FLAT_DEPTH = 10
+
+    def __init__(self, initial_scope: Mapping[str, Any]):
         self.scopes = [initial_scope]
 
+        self._flat: Optional[Dict[str, Any]] = None
+        self._flat_depth = 0
+        # the scopes below the flat dict, innermost first
+        self._base: List[Mapping[str, Any]] = []
+        # (shadowed bindings, added names) per scope pushed above _flat_depth
+        self._undo: List[Tuple[Dict[str, Any], List[str]]] = []
+
     def push_scope(self, scope: dict):
+        flat = self._flat
+        if flat is None:
+            if len(self.scopes) < self.FLAT_DEPTH:
+                self.scopes.append(scope)
+                return
+
+            flat = self._flat = {}
+            self._flat_depth = len(self.scopes)
+            self._base = self.scopes[::-1]
+
         self.scopes.append(scope)
+        self._undo.append((
+            {k: flat[k] for k in scope if k in flat},
+            [k for k in scope if k not in flat],
+        ))
+        flat.update(scope)
 
     def pop_scope(self):
         self.scopes.pop()
 
+        flat = self._flat
+        if flat is None:
+            return
+
+        if len(self.scopes) < self._flat_depth:
+            self._flat = None
+            return
+
+        shadowed, added = self._undo.pop()
+        for k in added:
+            del flat[k]
+        flat.update(shadowed)
+
     def __getitem__(self, item):
-        for scope in reversed(self.scopes):
-            if item in scope:
-                return scope[item]
+        flat = self._flat
+        if flat is not None:
+            v = flat.get(item, _MISSING)
+            if v is not _MISSING:
+                return v
+
+            for scope in self._base:
+                if item in scope:
+                    return scope[item]
+        else:
+            for scope in reversed(self.scopes):
+                if item in scope:
+                    return scope[item]
 
         raise KeyError(str(item))
 
     def __setitem__(self, key, value):
-        self.scopes[-1][key] = value
+        scope = self.scopes[-1]
+        if type(scope) is MappingProxyType:
+            scope = self.scopes[-1] = dict(scope)
+
+        flat = self._flat
+        if flat is not None:
+            if key not in scope and len(self.scopes) > self._flat_depth:
+                shadowed, added = self._undo[-1]
+                if key in flat:
+                    shadowed[key] = flat[key]
+                else:
+                    added.append(key)
+
+            flat[key] = value
+
+        scope[key] = value
 
     @contextmanager
     def make_scope(self, scope: dict):
@@ -1,63 +1,170 @@
-from pathlib import Path
-from typing import Any, Iterable, cast, MutableMapping, Optional, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, cast, Mapping, MutableMapping, Optional, Dict, List, \
+    Sequence
 
-from smartquery import lexer, rules
+import threading
+
+from smartquery import rules, optimizer, vectorized
 from smartquery.ast_ops import Op
-from smartquery.functions import FUNCTIONS
-from smartquery.ply import lex, yacc
+from smartquery.cache import CacheStats
+from smartquery.codegen import BytecodeProgram, compile_bytecode
+from smartquery.compiler import CompiledProgram, compile_program
+from smartquery.custom_types import Decimal
+from smartquery.exceptions import ParserError
+from smartquery.functions import BUILTINS, FLOAT_BUILTINS
+from smartquery.interning import intern_tree, is_interned
+from smartquery.lalr import LalrParser
+from smartquery.persistent import persist, plain_names, to_plain
+from smartquery.pratt import PrattParser
 from smartquery.scoped_dict import ScopedDict
-from smartquery.vm_state import VMState
+from smartquery.stats import EvalStats
+from smartquery.tokenizer import Tokenizer
+from smartquery.values import copy_value
+from smartquery.vm_state import VMState, make_state
+
+
+NUMERIC_MODES = ('decimal', 'float')
+
+_yacc: Optional[LalrParser] = None
+_yacc_lock = threading.Lock()
+
+
+def _shared_yacc() -> LalrParser:
+    # LALR tables are loaded from gen/lalrtab.py once per process and shared by all parsers
+    global _yacc
+
+    if _yacc is None:
+        with _yacc_lock:
+            if _yacc is None:
+                _yacc = LalrParser()
+
+    return _yacc
 
 
 class SqParser:
-    def __init__(self, parse_cache: Optional[MutableMapping[str, Op]] = None):
-        output_dir = str(Path(__file__).parent / 'gen')
+    def __init__(
+        self,
+        parse_cache: Optional[MutableMapping[str, Op]] = None,
+        code_cache: Optional[MutableMapping[str, BytecodeProgram]] = None,
+        optimize: bool = False,
+        pratt: bool = False,
+        intern_nodes: bool = False,
+        functions: Optional[Dict[str, Callable]] = None,
+        persistent_values: bool = False,
+        numeric_mode: str = 'decimal',
+    ):
+        if numeric_mode not in NUMERIC_MODES:
+            raise ParserError(f'Unsupported numeric mode: {numeric_mode}')
 
         self.parse_cache = parse_cache
+        self.code_cache = code_cache
+        self.optimize = optimize
+        self.pratt = pratt
+        # share structurally equal subtrees between all parsed programs
+        self.intern_nodes = intern_nodes
+        # numbers are Decimals, or native floats with numeric_mode='float'
+        self.numeric_mode = numeric_mode
+        float_mode = numeric_mode == 'float'
+        # custom functions are merged with builtins once, and shared by all evaluations of the parser
+        builtins = FLOAT_BUILTINS if float_mode else BUILTINS
+        self.functions: Mapping[str, Callable] = \
+            MappingProxyType({**builtins, **functions}) if functions else builtins
+        # lists and dicts of variables are persistent (see persistent.py), results are plain
+        self.persistent_values = persistent_values
 
-        self.lex = lex.lex(
-            module=lexer,
-            optimize=True,
-            debug=False,
-            outputdir=output_dir)
+        self.lex = Tokenizer(number_type=float if float_mode else Decimal)
 
-        self.yacc = yacc.yacc(
-            module=rules,
-            optimize=True,
-            debug=False,
-            outputdir=output_dir)
+    @property
+    def yacc(self) -> LalrParser:
+        return _shared_yacc()
 
-    def list_names(self, expr: str) -> Iterable[str]:
-        self.lex.lexpos = 0
-        self.lex.lineno = 1
-        self.lex.paren_count = 0
+    def _make_lexer(self) -> Tokenizer:
+        # every call works with its own lexer and parser state,
+        # so one SqParser can be shared between threads
+        lexer = self.lex.clone()
+        lexer.lineno = 1
+        lexer.paren_count = 0
+        lexer.ast = None
+
+        return lexer
 
-        self.lex.input(expr)
+    def list_names(self, expr: str) -> Iterable[str]:
+        lexer = self._make_lexer()
+        lexer.input(expr)
 
         while True:
-            t = self.lex.token()
+            t = lexer.token()
             if t is None:
                 return
             if t.type == 'NAME':
                 yield t.value
 
     def parse(self, expr: str) -> Op:
-        if self.parse_cache is None or expr not in self.parse_cache:
-            self.lex.lexpos = 0
-            self.lex.lineno = 1
-            self.lex.paren_count = 0
+        if self.parse_cache is not None:
+            ast = self.parse_cache.get(expr)
+            if ast is not None:
+                if self.intern_nodes and not is_interned(ast):
+                    # e.g. unpickled by SqliteCache: interned once, and written back for the next hits
+                    ast = intern_tree(ast)
+                    self.parse_cache[expr] = ast
 
-            self.lex.ast = None
-            self.yacc.parse(input=expr, lexer=self.lex)
+                return ast
 
-            ast = cast(Op, self.lex.ast)
+        lexer = self._make_lexer()
+        if self.pratt:
+            ast = PrattParser(lexer).parse(expr)
+        else:
+            lexer.input(expr)
+            self.yacc.parse(lexer)
+            ast = cast(Op, lexer.ast)
 
-            if self.parse_cache is not None:
-                self.parse_cache[expr] = ast
+        if self.optimize:
+            ast = cast(Op, optimizer.optimize(ast))
 
-            return ast
-        else:
-            return self.parse_cache[expr]
+        if self.intern_nodes:
+            ast = intern_tree(ast)
+
+        if self.parse_cache is not None:
+            self.parse_cache[expr] = ast
+
+        return ast
+
+    @property
+    def parse_cache_stats(self) -> Optional[CacheStats]:
+        return getattr(self.parse_cache, 'stats', None)
+
+    def compile(self, expr: str) -> CompiledProgram:
+        # the program is evaluated with the functions and the value mode of the parser by default
+        return compile_program(
+            self.parse(expr=expr.rstrip()),
+            functions=self.functions,
+            persistent_values=self.persistent_values,
+        )
+
+    def compile_bytecode(self, expr: str) -> BytecodeProgram:
+        if self.code_cache is not None:
+            program = self.code_cache.get(expr)
+            if program is not None:
+                if program.functions is not self.functions or program.persistent_values != self.persistent_values:
+                    # unpickled (defaults aren't pickled) or cached by another parser
+                    program = program.bind(self.functions, self.persistent_values)
+
+                return program
+
+        program = compile_bytecode(
+            self.parse(expr=expr.rstrip()),
+            functions=self.functions,
+            persistent_values=self.persistent_values,
+        )
+
+        if self.code_cache is not None:
+            self.code_cache[expr] = program
+
+        return program
+
+    @property
+    def code_cache_stats(self) -> Optional[CacheStats]:
+        return getattr(self.code_cache, 'stats', None)
 
     def eval(
         self,
@@ -65,19 +172,97 @@ class SqParser:
         names: Dict[str, Any] = None,
         ast_names: Dict[str, Op] = None,
         max_ops_evaluated: int = 100,
+        collect_stats: bool = False,
     ) -> Any:
-        scoped_names = ScopedDict({**FUNCTIONS})
-        scoped_names.push_scope(names if names is not None else {})
-
+        # with collect_stats, returns (result, EvalStats of the evaluation)
         ast = self.parse(expr=expr.rstrip())
+        stats = EvalStats() if collect_stats else None
 
         if ast is not None:
-            state = VMState(names=scoped_names, max_ops_evaluated=max_ops_evaluated)
+            state = make_state(
+                names=names,
+                ast_names=ast_names,
+                max_ops_evaluated=max_ops_evaluated,
+                functions=self.functions,
+                persistent_values=self.persistent_values,
+                stats=stats,
+            )
+            if self.persistent_values:
+                try:
+                    res = to_plain(ast.run(state))
+                finally:
+                    if names is not None:
+                        plain_names(names)
+            else:
+                res = ast.run(state)
+        else:
+            res = None
 
-            if ast_names is not None:
-                for k, v in ast_names.items():
-                    scoped_names[k] = v.eval(state)
+        return (res, stats) if collect_stats else res
 
-            return ast.eval(state)
-        else:
-            return None
+    def eval_many(
+        self,
+        expr: str,
+        rows: Iterable[Dict[str, Any]],
+        ast_names: Dict[str, Op] = None,
+        max_ops_evaluated: int = 100,
+        return_errors: bool = False,
+    ) -> Iterator[Any]:
+        # evaluates one program against every names dict from rows, lazily;
+        # with return_errors an exception of a failed row is yielded as its result
+        ast = self.parse(expr=expr.rstrip())
+
+        scoped_names = ScopedDict(self.functions)
+        state = VMState(
+            names=scoped_names,
+            max_ops_evaluated=max_ops_evaluated,
+            copy_value=persist if self.persistent_values else copy_value,
+        )
+
+        for names in rows:
+            state.ops_evaluated = 0
+
+            scoped_names.push_scope(names)
+            try:
+                if ast_names is not None:
+                    for k, v in ast_names.items():
+                        scoped_names[k] = v.run(state)
+
+                res = ast.run(state) if ast is not None else None
+                if self.persistent_values:
+                    res = to_plain(res)
+            except Exception as e:  # pylint: disable=broad-except
+                if not return_errors:
+                    raise
+
+                res = e
+            finally:
+                scoped_names.pop_scope()
+                if self.persistent_values:
+                    plain_names(names)
+
+            yield res
+
+    def eval_columns(
+        self,
+        expr: str,
+        columns: Dict[str, Sequence[Any]],
+        ast_names: Dict[str, Op] = None,
+        max_ops_evaluated: int = 100,
+        return_errors: bool = False,
+    ) -> List[Any]:
+        # evaluates one program against columns of names (lists or NumPy arrays of the same length),
+        # returning a list of per-row results; single expression programs are evaluated column-at-a-time,
+        # anything else (or any error) falls back to row-wise eval_many
+        if ast_names is None:
+            res = vectorized.eval_columns(self.parse(expr=expr.rstrip()), columns, max_ops_evaluated)
+            if res is not None:
+                return res
+
+        return list(self.eval_many(
+            expr,
+            vectorized.rows(columns),
+            ast_names=ast_names,
+            max_ops_evaluated=max_ops_evaluated,
+            return_errors=return_errors,
+        ))
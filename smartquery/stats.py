@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
+
+from smartquery.ast_ops import Op, BinOp, UnaryOp, AssignOp, ShortOp, IfExprOp, SliceOp, CallOp, DictOp
+from smartquery.functions import REGEX_FUNCTIONS
+
+
+# Execution statistics of one evaluation (SqParser.eval(..., collect_stats=True)).
+#
+# Collection costs nothing but a `state.stats is not None` check per block, call of a function and call of a lambda,
+# when it's disabled. Nodes are counted per block, just like ops are charged (see Op.cost):
+# the nodes of a block are counted once per block (by their types), and then added on every charge of the block,
+# so `sum(stats.nodes.values())` is the number of ops evaluated.
+
+
+@dataclass
+class EvalStats:
+    # evaluated nodes per Op type name
+    nodes: Dict[str, int] = field(default_factory=dict)
+    # calls and their cumulative time in seconds (including the nested calls, e.g. of lambdas by map) per function
+    calls: Dict[str, int] = field(default_factory=dict)
+    call_time: Dict[str, float] = field(default_factory=dict)
+    lambda_calls: int = 0
+    # the peak number of scopes: builtins, names and one per active lambda call
+    max_scope_depth: int = 0
+
+    # id of the block root -> (the root, its nodes per type); the root is kept, so its id isn't reused
+    _blocks: Dict[int, Tuple[Op, List[Tuple[str, int]]]] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def regex_time(self) -> float:
+        return sum(self.call_time.get(name, 0.0) for name in REGEX_FUNCTIONS)
+
+    def add_block(self, op: Op):
+        block = self._blocks.get(id(op))
+        if block is None:
+            counts: Dict[str, int] = {}
+            _count_block(op, counts)
+            block = self._blocks[id(op)] = (op, list(counts.items()))
+
+        nodes = self.nodes
+        for name, count in block[1]:
+            nodes[name] = nodes.get(name, 0) + count
+
+    def add_node(self, op: Op, n: int = 1):
+        name = type(op).__name__
+        self.nodes[name] = self.nodes.get(name, 0) + n
+
+    def add_call(self, name: str, time: float):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.call_time[name] = self.call_time.get(name, 0.0) + time
+
+    def add_lambda_call(self, scope_depth: int):
+        self.lambda_calls += 1
+        if scope_depth > self.max_scope_depth:
+            self.max_scope_depth = scope_depth
+
+
+def _count_block(op: Op, counts: Dict[str, int]):
+    # nodes evaluated unconditionally with op, the same as summed up by Op.static_cost()
+    if op.cost == 0:
+        # custom Op subclasses are counted by Op.eval
+        return
+
+    name = type(op).__name__
+    counts[name] = counts.get(name, 0) + 1
+
+    children = _BLOCK_CHILDREN.get(type(op))
+    if children is not None:
+        for child in children(op):
+            _count_block(child, counts)
+
+
+def _binop_children(op: BinOp) -> Iterable[Op]:
+    return (op.op1,) if op.short_circuit is not None else (op.op1, op.op2)
+
+
+def _dict_children(op: DictOp) -> Iterable[Op]:
+    return [item for kv in op.d for item in kv]
+
+
+# children of the nodes, which are evaluated in the same block;
+# NoOp, ValueOp, ConstOp, CodeOp, NameOp and LambdaOp have none (lines and the body of a lambda are blocks)
+_BLOCK_CHILDREN: Dict[Type[Op], Callable[[Any], Iterable[Op]]] = {
+    BinOp: _binop_children,
+    UnaryOp: lambda op: (op.op1,),
+    AssignOp: lambda op: (op.value,),
+    ShortOp: lambda op: (op.value,),
+    IfExprOp: lambda op: (op.cond,),
+    SliceOp: lambda op: (op.start, op.stop, op.step),
+    CallOp: lambda op: op.args,
+    DictOp: _dict_children,
+}
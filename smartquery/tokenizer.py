@@ -0,0 +1,271 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Tuple
+
+import copy
+import functools
+import re
+
+from smartquery.custom_types import Decimal
+from smartquery.exceptions import ParserError
+from smartquery.lexer import reserved
+from smartquery.ply.lex import LexToken
+
+if TYPE_CHECKING:
+    from smartquery.ast_ops import Op
+
+
+# Single pass scanner, producing the same token stream as the PLY lexer built from smartquery/lexer.py
+# (which stays the reference definition of tokens): the kind of a token is picked by its first char,
+# and only names, numbers, strings and %names% are matched with regexes.
+
+_NAME = re.compile(r'[^\W\d]\w*')
+_PERCENT_NAME = re.compile(r'%.*?%')
+_NUMBER = re.compile(r'\d+(\.\d+)?')
+_STRING = re.compile(r""" "([^\\\n]|(\\.))*?" | '([^\\\n]|(\\.))*?' """, re.VERBOSE)
+
+_IGNORE = 0
+_SINGLE = 1
+_OPEN = 2
+_CLOSE = 3
+_NEWLINE = 4
+_WITH_EQ = 5
+_STAR = 6
+_EQ = 7
+_STRING_START = 8
+_COMMENT = 9
+_PERCENT = 10
+_BANG = 11
+
+# char -> (kind, arg): arg is the token type of _SINGLE/_OPEN/_CLOSE, a pair of types of _WITH_EQ, or None
+_CHARS: Dict[str, Tuple[int, Any]] = {
+    ' ': (_IGNORE, None),
+    '\t': (_IGNORE, None),
+    ',': (_SINGLE, 'COMMA'),
+    '.': (_SINGLE, 'DOT'),
+    '|': (_SINGLE, 'PIPE'),
+    ':': (_SINGLE, 'COLON'),
+    '(': (_OPEN, 'LPAREN'),
+    '[': (_OPEN, 'LBRACKET'),
+    '{': (_OPEN, 'LBRACE'),
+    ')': (_CLOSE, 'RPAREN'),
+    ']': (_CLOSE, 'RBRACKET'),
+    '}': (_CLOSE, 'RBRACE'),
+    '\n': (_NEWLINE, None),
+    '\r': (_NEWLINE, None),
+    ';': (_NEWLINE, None),
+    # token types without and with a trailing '='
+    '+': (_WITH_EQ, ('PLUS', 'SHORT_OP')),
+    '-': (_WITH_EQ, ('MINUS', 'SHORT_OP')),
+    '/': (_WITH_EQ, ('DIVIDE', 'SHORT_OP')),
+    '>': (_WITH_EQ, ('GT', 'GTE')),
+    '<': (_WITH_EQ, ('LT', 'LTE')),
+    '*': (_STAR, None),
+    '=': (_EQ, None),
+    '"': (_STRING_START, None),
+    "'": (_STRING_START, None),
+    '#': (_COMMENT, None),
+    '%': (_PERCENT, None),
+    '!': (_BANG, None),
+}
+# names, numbers and raw strings
+_OTHER: Tuple[Optional[int], Any] = (None, None)
+
+
+class Token(LexToken):
+    # LexToken of ply, with its attributes declared and set at once
+    __slots__ = ('type', 'value', 'lineno', 'lexpos')
+
+    def __init__(self, type_: str, value: Any, lineno: int, lexpos: int):
+        self.type = type_
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+def _unescape(s: str) -> str:
+    if '\\' not in s:
+        return s
+
+    return s \
+        .replace(r'\n', '\n') \
+        .replace(r'\t', '\t') \
+        .replace(r'\'', "'") \
+        .replace(r'\"', '"')
+
+
+class Tokenizer:
+    # drop-in replacement of ply.lex.Lexer for SqParser: input(), token(), clone(), lineno, lexpos
+
+    def __init__(self, number_type: Callable[[str], Any] = Decimal):
+        self.lexdata = ''
+        # type of NUMBER token values: Decimal, or float with numeric_mode='float'
+        self.number_type = number_type
+        self.lexpos = 0
+        self.lineno = 1
+        self.paren_count = 0
+        self._tokens: Optional[Iterator[Token]] = None
+        # the tree built by the LALR parser (see rules.py)
+        self.ast: Optional['Op'] = None
+
+    @property
+    def float_mode(self) -> bool:
+        # numeric_mode='float' of SqParser: operators and dict literals are parsed for floats
+        return self.number_type is float
+
+    def clone(self) -> 'Tokenizer':
+        c = copy.copy(self)
+        c.__dict__.pop('token', None)
+        c._tokens = None
+        return c
+
+    def input(self, s: str):
+        self.lexdata = s
+        self.lexpos = 0
+        self._tokens = self._scan(s)
+
+        # avoids a python level call per token
+        self.token = functools.partial(next, self._tokens, None)  # type: ignore
+
+    def token(self) -> Optional[Token]:
+        # replaced by input()
+        return None
+
+    def __iter__(self) -> Iterator[Token]:
+        return self
+
+    def __next__(self) -> Token:
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+
+    def _scan(self, data: str) -> Iterator[Token]:
+        pos = 0
+        end = len(data)
+        chars = _CHARS
+        number_type = self.number_type
+
+        while pos < end:
+            c = data[pos]
+            if c == ' ':
+                pos += 1
+                continue
+
+            start = pos
+            kind, arg = chars.get(c, _OTHER)
+
+            if kind is None:
+                m = None
+                if c == 'r' and data[pos + 1:pos + 2] in ('"', "'"):
+                    m = _STRING.match(data, pos + 1)
+
+                if m is not None:
+                    # raw string
+                    pos = m.end()
+                    type_, value = 'STRING', data[start + 2:pos - 1]
+                else:
+                    m = _NAME.match(data, pos) or _NUMBER.match(data, pos)
+                    if m is None:
+                        self.lexpos = pos
+                        raise ParserError(f'Illegal character {c}')
+
+                    pos = m.end()
+                    value = m.group()
+                    if m.re is _NAME:
+                        type_ = reserved.get(value, 'NAME')
+                    else:
+                        type_, value = 'NUMBER', number_type(value)
+            elif kind == _IGNORE:
+                pos += 1
+                continue
+            elif kind == _SINGLE:
+                pos += 1
+                type_, value = arg, c
+            elif kind == _WITH_EQ:
+                if data[pos + 1:pos + 2] == '=':
+                    pos += 2
+                    type_, value = arg[1], data[start:pos]
+                else:
+                    pos += 1
+                    type_, value = arg[0], c
+            elif kind == _OPEN:
+                pos += 1
+                self.paren_count += 1
+                type_, value = arg, c
+            elif kind == _CLOSE:
+                pos += 1
+                self.paren_count -= 1
+                type_, value = arg, c
+            elif kind == _NEWLINE:
+                if c == '\r':
+                    if data[pos + 1:pos + 2] != '\n':
+                        self.lexpos = pos
+                        raise ParserError(f'Illegal character {c}')
+                    pos += 2
+                else:
+                    pos += 1
+
+                if c != ';' and self.paren_count != 0:
+                    # ignore newlines inside of parens, braces and brackets
+                    continue
+
+                tok = Token('NEWLINE', data[start:pos], self.lineno, start)
+                self.lineno += 1
+                self.lexpos = pos
+                yield tok
+                continue
+            elif kind == _STAR:
+                nxt = data[pos + 1:pos + 2]
+                if nxt == '=':
+                    pos += 2
+                    type_, value = 'SHORT_OP', '*='
+                elif nxt == '*':
+                    pos += 2
+                    type_, value = 'POWER', '**'
+                else:
+                    pos += 1
+                    type_, value = 'TIMES', c
+            elif kind == _EQ:
+                nxt = data[pos + 1:pos + 2]
+                if nxt == '=':
+                    pos += 2
+                    type_, value = 'EQ', '=='
+                elif nxt == '>':
+                    pos += 2
+                    type_, value = 'LAMBDA', '=>'
+                else:
+                    pos += 1
+                    type_, value = 'ASSIGN', c
+            elif kind == _STRING_START:
+                m = _STRING.match(data, pos)
+                if m is None:
+                    self.lexpos = pos
+                    raise ParserError(f'Illegal character {c}')
+
+                pos = m.end()
+                type_, value = 'STRING', _unescape(data[start + 1:pos - 1])
+            elif kind == _COMMENT:
+                pos = data.find('\n', pos)
+                if pos == -1:
+                    pos = end
+                continue
+            elif kind == _PERCENT:
+                m = _PERCENT_NAME.match(data, pos)
+                if m is None:
+                    self.lexpos = pos
+                    raise ParserError(f'Illegal character {c}')
+
+                pos = m.end()
+                type_, value = 'NAME', m.group()
+            else:  # _BANG
+                if data[pos + 1:pos + 2] != '=':
+                    self.lexpos = pos
+                    raise ParserError(f'Illegal character {c}')
+
+                pos += 2
+                type_, value = 'NE', '!='
+
+            tok = Token(type_, value, self.lineno, start)
+            self.lexpos = pos
+            yield tok
+
+        self.lexpos = pos
@@ -0,0 +1,67 @@
+from decimal import Decimal as Decimal_
+from typing import Any, Dict
+
+import copy
+
+from smartquery.custom_types import Decimal
+
+
+# Assigned values are copied, so a variable never shares containers with another variable or with names
+# of the caller, and mutating one of them (push, a[k] = v, ...) never affects the other.
+# The copy is eager (not copy-on-write): every assignment of a container costs O(n) in its total size,
+# whether the copy is mutated later or not; see persistent.py for O(1) assignments.
+# copy_value() is copy.deepcopy for values of programs, with fast paths:
+# - immutable values are returned as is
+# - lists, dicts and tuples of immutable values are copied at C speed, without memo and dispatch per item
+# - nested lists and dicts are copied recursively, other values are passed to copy.deepcopy;
+#   the memo keeps aliasing and cycles of the source, just like copy.deepcopy does
+
+_IMMUTABLE = frozenset({str, bool, type(None), Decimal_, Decimal, int, float})
+
+
+def copy_value(v: Any) -> Any:
+    if type(v) in _IMMUTABLE:
+        return v
+
+    return _copy(v, {})
+
+
+def _copy(v: Any, memo: Dict[int, Any]) -> Any:
+    t = type(v)
+    if t in _IMMUTABLE:
+        return v
+
+    if t is list:
+        c = memo.get(id(v))
+        if c is None:
+            if _all_immutable(v):
+                c = memo[id(v)] = v.copy()
+            else:
+                c = memo[id(v)] = []
+                c.extend([_copy(item, memo) for item in v])
+
+        return c
+    elif t is dict:
+        c = memo.get(id(v))
+        if c is None:
+            if _all_immutable(v) and _all_immutable(v.values()):
+                c = memo[id(v)] = v.copy()
+            else:
+                c = memo[id(v)] = {}
+                for k, item in v.items():
+                    c[_copy(k, memo)] = _copy(item, memo)
+
+        return c
+    elif t is tuple and _all_immutable(v):
+        return v
+
+    return copy.deepcopy(v, memo)
+
+
+def _all_immutable(items: Any) -> bool:
+    immutable = _IMMUTABLE
+    for item in items:
+        if type(item) not in immutable:
+            return False
+
+    return True
@@ -0,0 +1,232 @@
+from dataclasses import dataclass
+from decimal import Decimal as Decimal_
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+
+import operator
+
+from smartquery.ast_ops import Op, CodeOp, ValueOp, NameOp, BinOp, UnaryOp, IfExprOp
+from smartquery.exceptions import ParserError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+
+# Column-at-a-time evaluation of single expression programs over scalar names,
+# e.g. `age > 18 and city == "Moscow"` evaluated over {'age': [...], 'city': [...]}.
+#
+# Every operation is applied to whole columns with the same operator functions,
+# which are used by Op.eval, so results are the same as of row-wise evaluation.
+# Comparisons and boolean logic over NumPy arrays are done by NumPy, when it's exact.
+# Whenever a program can't be vectorised or an operation fails, eval_columns returns None
+# and the caller has to fall back to row-wise evaluation.
+
+
+@dataclass
+class _Scalar:
+    v: Any
+
+
+class _Fallback(Exception):
+    pass
+
+
+_COMPARISONS = {operator.eq, operator.ne, operator.gt, operator.lt, operator.ge, operator.le}
+
+# ints above this are rounded when compared with float64 arrays
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def column_length(columns: Mapping[str, Sequence]) -> int:
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ParserError('Columns have different lengths')
+
+    return lengths.pop() if lengths else 0
+
+
+def rows(columns: Mapping[str, Sequence]) -> List[Dict[str, Any]]:
+    length = column_length(columns)
+    names = list(columns)
+    values = [_to_list(column) for column in columns.values()]
+
+    return [
+        dict(zip(names, row)) for row in zip(*values)
+    ] if names else [{} for _ in range(length)]
+
+
+def eval_columns(ast: Optional[Op], columns: Mapping[str, Sequence], max_ops_evaluated: int = 100) -> Optional[list]:
+    length = column_length(columns)
+
+    if type(ast) is not CodeOp or len(ast.lines) != 1:
+        return None
+
+    expr = ast.lines[0]
+
+    # every row evaluates at most all the nodes of the program (+ CodeOp),
+    # if that may hit the limit, rows have to be checked one by one
+    nodes = _count_nodes(expr)
+    if nodes is None or nodes + 1 >= max_ops_evaluated:
+        return None
+
+    try:
+        res = _eval(expr, columns)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    if isinstance(res, _Scalar):
+        return [res.v] * length
+
+    return _to_list(res)
+
+
+def _count_nodes(op: Op) -> Optional[int]:
+    # type(op) is checked inline (not via a local), so mypy narrows op
+    if type(op) is ValueOp or type(op) is NameOp:
+        return 1
+    elif type(op) is BinOp:
+        n1 = _count_nodes(op.op1)
+        n2 = _count_nodes(op.op2)
+        return 1 + n1 + n2 if n1 is not None and n2 is not None else None
+    elif type(op) is UnaryOp:
+        n1 = _count_nodes(op.op1)
+        return 1 + n1 if n1 is not None else None
+    elif type(op) is IfExprOp:
+        counts = [_count_nodes(op.cond), _count_nodes(op.op1), _count_nodes(op.op2)]
+        return 1 + sum(counts) if None not in counts else None  # type: ignore
+
+    # not vectorisable
+    return None
+
+
+def _is_array(v: Any) -> bool:
+    return numpy is not None and isinstance(v, numpy.ndarray)
+
+
+def _to_list(column: Any) -> list:
+    # always a new list: results must not alias the caller's columns
+    if _is_array(column):
+        return column.tolist()
+
+    return list(column)
+
+
+def _iter(v: Any) -> Iterator[Any]:
+    if isinstance(v, _Scalar):
+        return repeat(v.v)
+
+    return iter(_to_list(v))
+
+
+def _eval(op: Op, columns: Mapping[str, Sequence]) -> Any:
+    if type(op) is ValueOp:
+        return _Scalar(op.v)
+    elif type(op) is NameOp:
+        if op.name not in columns:
+            raise _Fallback(op.name)
+
+        column: Any = columns[op.name]
+        if _is_array(column) and column.ndim != 1:
+            raise _Fallback(op.name)
+
+        return column
+    elif type(op) is BinOp:
+        return _eval_binop(op, _eval(op.op1, columns), _eval(op.op2, columns))
+    elif type(op) is UnaryOp:
+        return _eval_unary(op, _eval(op.op1, columns))
+    elif type(op) is IfExprOp:
+        return _eval_if_expr(_eval(op.cond, columns), _eval(op.op1, columns), _eval(op.op2, columns))
+
+    raise _Fallback(op)
+
+
+def _is_bool_array(v: Any) -> bool:
+    return _is_array(v) and v.dtype == bool
+
+
+def _numpy_scalar(v: Any) -> Any:
+    # Decimal literals are converted to int/float, if that's exact
+    if isinstance(v, Decimal_) and v.is_finite():
+        if v == v.to_integral_value():
+            return int(v)
+
+        if Decimal_(float(v)) == v:
+            return float(v)
+
+    return v
+
+
+def _numpy_comparable(column: Any, scalar: Any) -> bool:
+    # whether NumPy compares column items with the scalar exactly as Python does
+    kind = column.dtype.kind
+    if kind in 'biu':
+        return type(scalar) in (int, bool)
+    elif kind == 'f':
+        return type(scalar) is float or type(scalar) in (int, bool) and abs(scalar) <= _MAX_EXACT_FLOAT_INT
+    elif kind == 'U':
+        return type(scalar) is str
+
+    return False
+
+
+def _eval_binop(op: BinOp, op1: Any, op2: Any) -> Any:
+    if isinstance(op1, _Scalar) and isinstance(op2, _Scalar):
+        if op.short_circuit is not None:
+            return op1 if bool(op1.v) is op.short_circuit else op2
+
+        return _Scalar(op.f(op1.v, op2.v))
+
+    if op.short_circuit is not None:
+        if _is_bool_array(op1) and _is_bool_array(op2):
+            return op1 & op2 if op.op == 'and' else op1 | op2
+
+        short_circuit = op.short_circuit
+        return [
+            v1 if bool(v1) is short_circuit else v2 for v1, v2 in zip(_iter(op1), _iter(op2))
+        ]
+
+    if op.f in _COMPARISONS:
+        try:
+            return _eval_numpy_comparison(op.f, op1, op2)
+        except _Fallback:
+            pass
+
+    return list(map(op.f, _iter(op1), _iter(op2)))
+
+
+def _eval_numpy_comparison(f: Callable, op1: Any, op2: Any) -> Any:
+    if _is_array(op1) and isinstance(op2, _Scalar):
+        scalar = _numpy_scalar(op2.v)
+        if _numpy_comparable(op1, scalar):
+            return f(op1, scalar)
+    elif isinstance(op1, _Scalar) and _is_array(op2):
+        scalar = _numpy_scalar(op1.v)
+        if _numpy_comparable(op2, scalar):
+            return f(scalar, op2)
+    elif _is_array(op1) and _is_array(op2):
+        kind1, kind2 = op1.dtype.kind, op2.dtype.kind
+        if kind1 in 'biu' and kind2 in 'biu' or kind1 == kind2 and kind1 in 'fU':
+            return f(op1, op2)
+
+    raise _Fallback()
+
+
+def _eval_unary(op: UnaryOp, op1: Any) -> Any:
+    if isinstance(op1, _Scalar):
+        return _Scalar(op.f(op1.v))
+
+    if op.op == 'not' and _is_bool_array(op1):
+        return ~op1
+
+    return list(map(op.f, _iter(op1)))
+
+
+def _eval_if_expr(cond: Any, op1: Any, op2: Any) -> Any:
+    if isinstance(cond, _Scalar):
+        return op1 if cond.v else op2
+
+    return [
+        v1 if c else v2 for c, v1, v2 in zip(_iter(cond), _iter(op1), _iter(op2))
+    ]
@@ -1,6 +1,13 @@
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional
 
+from smartquery.functions import BUILTINS
+from smartquery.persistent import persist
 from smartquery.scoped_dict import ScopedDict
+from smartquery.values import copy_value
+
+if TYPE_CHECKING:
+    from smartquery.stats import EvalStats
 
 
 @dataclass
@@ -9,3 +16,37 @@ class VMState:
     ops_evaluated: int = 0
 
     max_ops_evaluated: int = 100
+
+    # copy of an assigned value: copy_value, or persist with persistent values
+    copy_value: Callable[[Any], Any] = copy_value
+
+    # collector of execution statistics, if enabled (see stats.py)
+    stats: Optional['EvalStats'] = None
+
+
+def make_state(
+    names: Optional[Dict[str, Any]] = None,
+    ast_names: Optional[Dict[str, Any]] = None,
+    max_ops_evaluated: int = 100,
+    functions: Mapping[str, Callable] = BUILTINS,
+    persistent_values: bool = False,
+    stats: Optional['EvalStats'] = None,
+) -> VMState:
+    scoped_names = ScopedDict(functions)
+    scoped_names.push_scope(names if names is not None else {})
+
+    state = VMState(
+        names=scoped_names,
+        max_ops_evaluated=max_ops_evaluated,
+        copy_value=persist if persistent_values else copy_value,
+        stats=stats,
+    )
+
+    if stats is not None:
+        stats.max_scope_depth = max(stats.max_scope_depth, len(scoped_names.scopes))
+
+    if ast_names is not None:
+        for k, v in ast_names.items():
+            scoped_names[k] = v.run(state)
+
+    return state
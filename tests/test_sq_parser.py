@@ -1,11 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from decimal import Decimal
+from pathlib import Path
+from typing import Any, Iterator
 from unittest import TestCase
 
-import pytest
+import ast as py_ast
+import copy
+import decimal
+import gc
+import json
+import math
+import operator
+import os
+import pickle
+import random
+import tempfile
+import threading
 
-from smartquery.ast_ops import LambdaOp, NameOp
-from smartquery.exceptions import ParserError
+import pytest
+import regex
+
+from smartquery import LRUCache, SqliteCache, ChainedCache, SqExecutor, functions, interning, lalr, lexer, rules
+from smartquery.ast_ops import Op, LambdaOp, NameOp, BinOp, ValueOp, UnaryOp, ShortOp, CodeOp, CallOp, SliceOp, NONE
+from smartquery.cache import CacheStats
+from smartquery.compiler import compile_program
+from smartquery.exceptions import ParserError, OpsExecutionLimitExceededError, ExecutionTimeoutError, \
+    WorkerCrashedError
+from smartquery.functions import BUILTINS
+from smartquery.gen import lalrtab
+from smartquery.interning import interned_nodes
+from smartquery.persistent import PList, PMap, PVector
+from smartquery.ply import lex, yacc
+from smartquery.scoped_dict import ScopedDict
 from smartquery.sq_parser import SqParser
+from smartquery.stats import EvalStats
+from smartquery.tokenizer import Tokenizer
+from smartquery.values import copy_value
+from smartquery.vm_state import make_state
 from tests.utils import measure_for_tests
 
 
@@ -81,6 +113,10 @@ def test_priority(parser, expr, expected):
 
 @pytest.mark.parametrize('expr, expected', [
     ('round(2/3, 2)', Decimal('0.67')),
+    ('round(2.675, 2)', Decimal('2.68')),
+    ('round(7 / 2)', Decimal('4')),
+    ('floor(7 / 2)', Decimal('3')),
+    ('ceil(7 / 2)', Decimal('4')),
 ])
 def test_round(parser, expr, expected):
     assert parser.eval(expr) == expected
@@ -270,6 +306,23 @@ def test_custom_ast_functions(parser):
     ) == 6
 
 
+@dataclass
+class CustomOp(Op):
+    v: Any
+
+    def eval(self, state):
+        return self.v
+
+
+def test_custom_op_subclass(parser):
+    ast_names = {'x': CustomOp(41)}
+    assert parser.eval('x + 1', ast_names=ast_names) == 42
+    assert parser.eval('f(1)', names={'f': lambda v: v}, ast_names={'f': CustomOp(lambda v: v + 1)}) == 2
+    assert parser.compile('x + 1').eval(ast_names=ast_names) == 42
+    assert parser.compile_bytecode('x + 1').eval(ast_names=ast_names) == 42
+    assert parser.eval('y', ast_names={'y': CodeOp([CustomOp(1)])}) == 1
+
+
 def test_call_multiline(parser):
     assert parser.eval('''
     len(
@@ -720,3 +773,1364 @@ class TestPerf(TestCase):
 
         measure_for_tests(lambda: self.parser.eval(
             '%сообщение% == "Привет" and %пол% == "мужской"', names=names), iterations=self.RUNS)
+
+
+COMPILE_NAMES = {
+    'arr': [1, 2, 3, 4, 5],
+    'd': {'a': 1},
+    's': 'Привет',
+}
+
+COMPILE_EXPRS = [
+    '5 * 5 + 5 / 5',
+    '-5 - -5',
+    '2 ** 10',
+    '2 <= 3 and 3 >= 2 and 2 != 3 and not 2 == 3',
+    'False and 1/0',
+    'True or 1/0',
+    '"a" + 1',
+    '"П" in s and "x" not in s',
+    'True if 2 > 4 else False',
+    'arr[1:3]',
+    'arr[::-1]',
+    'arr | map(v => v * 2) | filter(v => v > 4)',
+    '{"x": 10, 1: d["a"]}',
+    'x = 10; x += 5; x',
+    'f = (a, b) => a + b; f(2, 3)',
+    '# comment',
+]
+
+
+class TestCompile(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = SqParser()
+
+    def test_same_as_eval(self):
+        for expr in COMPILE_EXPRS:
+            with self.subTest(expr):
+                program = self.parser.compile(expr)
+                self.assertEqual(
+                    program.eval(names={**COMPILE_NAMES}), self.parser.eval(expr, names={**COMPILE_NAMES}))
+
+    def test_names(self):
+        program = self.parser.compile('x = y * 2')
+
+        names = {'y': 21}
+        program.eval(names=names)
+        self.assertEqual(names['x'], 42)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ParserError, 'Undefined variable y'):
+            self.parser.compile('y').eval()
+
+        with self.assertRaisesRegex(ParserError, 'Can\'t multiply non-numbers'):
+            self.parser.compile('"a" * 2').eval()
+
+    def test_eval_limit(self):
+        program = self.parser.compile('l | map(v => v)')
+
+        with self.assertRaises(ParserError):
+            program.eval(names={
+                'l': [1] * 1000,
+            })
+
+
+class TestBytecode(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = SqParser(code_cache={})
+
+    def test_same_as_eval(self):
+        for expr in COMPILE_EXPRS:
+            with self.subTest(expr):
+                program = self.parser.compile_bytecode(expr)
+                self.assertEqual(
+                    program.eval(names={**COMPILE_NAMES}), self.parser.eval(expr, names={**COMPILE_NAMES}))
+
+    def test_same_ops_limit(self):
+        for expr in COMPILE_EXPRS:
+            for max_ops_evaluated in range(1, 40):
+                with self.subTest(expr=expr, max_ops_evaluated=max_ops_evaluated):
+                    try:
+                        expected = self.parser.eval(expr, names={**COMPILE_NAMES}, max_ops_evaluated=max_ops_evaluated)
+                    except OpsExecutionLimitExceededError:
+                        with self.assertRaises(OpsExecutionLimitExceededError):
+                            self.parser.compile_bytecode(expr).eval(
+                                names={**COMPILE_NAMES}, max_ops_evaluated=max_ops_evaluated)
+                    else:
+                        self.assertEqual(self.parser.compile_bytecode(expr).eval(
+                            names={**COMPILE_NAMES}, max_ops_evaluated=max_ops_evaluated), expected)
+
+    def test_cache(self):
+        program = self.parser.compile_bytecode('2 * 2')
+        self.assertIs(self.parser.compile_bytecode('2 * 2'), program)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ParserError, 'Undefined variable y'):
+            self.parser.compile_bytecode('y').eval()
+
+        with self.assertRaisesRegex(ParserError, 'Undefined function y'):
+            self.parser.compile_bytecode('y()').eval()
+
+        with self.assertRaisesRegex(ParserError, 'Can\'t multiply non-numbers'):
+            self.parser.compile_bytecode('"a" * 2').eval()
+
+    def test_no_python_builtins(self):
+        with self.assertRaisesRegex(ParserError, 'Undefined function __import__'):
+            self.parser.compile_bytecode('__import__("os")').eval()
+
+
+class TestOperators(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = SqParser()
+
+    def test_resolved_at_parse_time(self):
+        op = self.parser.parse('1 <= 2').lines[0]
+        self.assertIs(op.f, operator.le)
+
+    def test_unsupported(self):
+        with self.assertRaisesRegex(ParserError, 'Unsupported binary operation: %'):
+            BinOp('%', ValueOp(1), ValueOp(2))
+
+        with self.assertRaisesRegex(ParserError, 'Unsupported unary operation: \\+'):
+            UnaryOp('+', ValueOp(1))
+
+        with self.assertRaisesRegex(ParserError, 'Unsupported short op: %='):
+            ShortOp('x', '%=', ValueOp(1))
+
+    def test_filter_comparisons(self):
+        self.assertEqual(self.parser.eval(
+            'arr | filter(v => v >= 2 and v <= 4 or v == 0)', names={
+                'arr': [0, 1, 2, 3, 4, 5],
+            }), [0, 2, 3, 4])
+
+
+class TestOptimizer(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = SqParser()
+        cls.optimizing_parser = SqParser(optimize=True)
+
+    def test_same_as_eval(self):
+        for expr in [
+            *COMPILE_EXPRS,
+            '60 * 60 * 24',
+            '-(2 ** 3) + 0.1 + 0.2',
+            'not True or s',
+            '"x" + 1 == "x1"',
+            's if 1 > 2 else arr',
+            '[1, [2, 3], {"a": [4]}]',
+            '{"x": 10, 1: "a", "y": [1, 2]}',
+            'l = [1, 2]; l.push(3); [1, 2]',
+        ]:
+            with self.subTest(expr):
+                self.assertEqual(
+                    self.optimizing_parser.eval(expr, names={**COMPILE_NAMES}),
+                    self.parser.eval(expr, names={**COMPILE_NAMES}))
+
+    def test_folding(self):
+        self.assertEqual(self.optimizing_parser.parse('60 * 60 * 24'), CodeOp([ValueOp(Decimal(86400))]))
+        self.assertEqual(self.optimizing_parser.parse('1 if True else x'), CodeOp([ValueOp(Decimal(1))]))
+        self.assertEqual(self.optimizing_parser.parse('False and x'), CodeOp([ValueOp(False)]))
+        self.assertEqual(self.optimizing_parser.parse('True and x'), CodeOp([NameOp('x')]))
+
+    def test_errors_are_kept(self):
+        with self.assertRaisesRegex(ParserError, 'Can\'t multiply non-numbers'):
+            self.optimizing_parser.eval('"a" * 2')
+
+        with self.assertRaises(ZeroDivisionError):
+            self.optimizing_parser.eval('1 / 0')
+
+    def test_const_literals_are_copied(self):
+        expr = 'x = [[1], 2]; x[0].push(3); c = {"a": 1}; c["b"] = 2; [1, 2]'
+        names: dict = {}
+
+        for _ in range(2):
+            self.optimizing_parser.eval(expr, names=names)
+            self.assertEqual(names['x'], [[1, 3], 2])
+            self.assertEqual(names['c'], {'a': 1, 'b': 2})
+
+        program = self.optimizing_parser.compile('[[1], 2]')
+        program.eval()[0].append(3)
+        self.assertEqual(program.eval(), [[1], 2])
+
+    def test_overridden_list(self):
+        self.assertEqual(self.optimizing_parser.eval('[1, 2]', names={
+            'list': lambda *args: sum(args),
+        }), 3)
+
+
+class TestLRUCache(TestCase):
+    def test_parser_stats(self):
+        parser = SqParser(parse_cache=LRUCache(max_entries=2))
+
+        parser.eval('1 + 1')
+        parser.eval('1 + 1')
+        parser.eval('2 + 2')
+        parser.eval('3 + 3')
+        parser.eval('1 + 1')
+
+        stats = parser.parse_cache_stats
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (1, 4, 2))
+        self.assertEqual(stats.hit_rate, 0.2)
+        self.assertEqual(set(parser.parse_cache), {'3 + 3', '1 + 1'})
+
+    def test_no_stats(self):
+        self.assertIsNone(SqParser(parse_cache={}).parse_cache_stats)
+
+    def test_lru(self):
+        cache = LRUCache(max_entries=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+
+        cache['c'] = 3
+        self.assertEqual(dict(cache), {'a': 1, 'c': 3})
+
+    def test_max_bytes(self):
+        cache = LRUCache(max_bytes=4)
+        cache['aa'] = 1
+        cache['bb'] = 2
+        self.assertEqual(cache.size, 4)
+
+        cache['ы'] = 3
+        self.assertEqual(dict(cache), {'bb': 2, 'ы': 3})
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_ttl(self):
+        cache = LRUCache(ttl=0)
+        cache['a'] = 1
+
+        self.assertNotIn('a', cache)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats.expirations, 1)
+
+
+class TestSqliteCache(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / 'programs.db'
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_warm_start(self):
+        expr = 'f = (a, b) => a * b; [1, 2, 3] | map(v => f(v, 2))'
+
+        cache = SqliteCache(self.path)
+        self.assertEqual(SqParser(parse_cache=cache).eval(expr), [2, 4, 6])
+        self.assertEqual(cache.stats.misses, 1)
+        cache.close()
+
+        cache = SqliteCache(self.path)
+        parser = SqParser(parse_cache=cache)
+        self.assertEqual(parser.eval(expr), [2, 4, 6])
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 0))
+        self.assertEqual(list(cache), [expr])
+
+    def test_bytecode(self):
+        expr = 'x * 2 if x > 1 else -x'
+
+        SqParser(code_cache=SqliteCache(self.path)).compile_bytecode(expr)
+
+        cache = SqliteCache(self.path)
+        program = SqParser(code_cache=cache).compile_bytecode(expr)
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(program.eval(names={'x': 2}), 4)
+
+    def test_namespace(self):
+        SqliteCache(self.path)['1'] = 1
+
+        cache = SqliteCache(self.path, namespace='other')
+        self.assertNotIn('1', cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_chained(self):
+        SqParser(parse_cache=SqliteCache(self.path)).parse('1 + 1')
+
+        memory = LRUCache()
+        parser = SqParser(parse_cache=ChainedCache(memory, SqliteCache(self.path)))
+        parser.parse('1 + 1')
+        self.assertIn('1 + 1', memory)
+
+        parser.parse('1 + 1')
+        self.assertEqual(memory.stats.hits, 1)
+
+
+class TestThreads(TestCase):
+    def test_shared_parser(self):
+        parser = SqParser()
+
+        exprs = [
+            (f'x = {i}\nl = [x, x * 2, (x + 1) * 3]\nl | map(v => v + {i})', [2 * i, 3 * i, 3 * i + 3 + i])
+            for i in range(200)
+        ]
+
+        def run(expr_expected):
+            expr, expected = expr_expected
+            return parser.eval(expr, names={}) == expected and list(parser.list_names(expr))[0] == 'x'
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertTrue(all(executor.map(run, exprs * 5)))
+
+    def test_syntax_error_line(self):
+        parser = SqParser()
+        parser.eval('1\n2\n3')
+
+        with self.assertRaisesRegex(ParserError, 'Syntax error: asd at line 2'):
+            parser.eval('1\nx asd')
+
+
+class TestEvalMany(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = SqParser()
+
+    def test_rows(self):
+        rows = [{'age': age, 'city': city} for age, city in [(20, 'Moscow'), (17, 'Moscow'), (30, 'Kazan')]]
+
+        res = self.parser.eval_many('age > 18 and city == "Moscow"', rows)
+        self.assertIsInstance(res, Iterator)
+        self.assertEqual(list(res), [True, False, False])
+
+    def test_assignments_are_isolated(self):
+        rows = [{'x': 1}, {}]
+
+        res = list(self.parser.eval_many('y = x if x > 0 else 0; y', rows, return_errors=True))
+        self.assertEqual(res[0], 1)
+        self.assertIsInstance(res[1], ParserError)
+        self.assertEqual(rows[0], {'x': 1, 'y': 1})
+
+    def test_errors(self):
+        rows = [{'x': '1'}, {'x': '0'}, {'x': [1] * 1000}, {'x': '2'}]
+        expr = '1 / int(x) if x | len == 1 else x | map(v => v)'
+
+        res = list(self.parser.eval_many(expr, rows, return_errors=True))
+        self.assertEqual(res[0], 1)
+        self.assertIsInstance(res[1], ZeroDivisionError)
+        self.assertIsInstance(res[2], ParserError)
+        self.assertEqual(res[3], Decimal('0.5'))
+
+        with self.assertRaises(ZeroDivisionError):
+            list(self.parser.eval_many(expr, rows))
+
+    def test_ops_limit_per_row(self):
+        rows = [{'l': [1] * 40}] * 10
+        self.assertEqual(len(list(self.parser.eval_many('l | map(v => v)', rows))), 10)
+
+
+class TestEvalColumns(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = SqParser()
+        cls.columns = {
+            'age': [20, 17, 30, 0, 18],
+            'city': ['Moscow', 'Moscow', 'Kazan', '', 'Omsk'],
+            'score': [Decimal('1.5'), Decimal(0), Decimal('2.5'), -1, True],
+        }
+
+    def _rows(self):
+        return [dict(zip(self.columns, row)) for row in zip(*self.columns.values())]
+
+    def test_same_as_rows(self):
+        exprs = [
+            'age > 18 and city == "Moscow"',
+            'age >= 18 or city',
+            'not age',
+            '-age + score * 2',
+            '"young" if age < 18 else city + "!"',
+            'score / 2 if score else age',
+            'city in ["Moscow", "Kazan"]',
+            '1 + 2',
+            'age == 20 and 18',
+        ]
+
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertEqual(
+                    self.parser.eval_columns(expr, self.columns),
+                    list(self.parser.eval_many(expr, self._rows())))
+
+    def test_fallback(self):
+        exprs = [
+            'age | str',
+            'x = age; x + 1',
+            'age > 18 and 1 / age > 0',
+            'city * 2 if age > 100 else city',
+        ]
+
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertEqual(
+                    self.parser.eval_columns(expr, self.columns, return_errors=True)[1:],
+                    list(self.parser.eval_many(expr, self._rows(), return_errors=True))[1:])
+
+    def test_errors(self):
+        res = self.parser.eval_columns('1 / age', self.columns, return_errors=True)
+        self.assertIsInstance(res[3], ZeroDivisionError)
+        self.assertEqual(res[0], Decimal('0.05'))
+
+        with self.assertRaises(ZeroDivisionError):
+            self.parser.eval_columns('1 / age', self.columns)
+
+        with self.assertRaises(ParserError):
+            self.parser.eval_columns('age', {'age': [1], 'city': []})
+
+    def test_ops_limit(self):
+        with self.assertRaises(OpsExecutionLimitExceededError):
+            self.parser.eval_columns('age + age + age', self.columns, max_ops_evaluated=5)
+
+        self.assertEqual(self.parser.eval_columns('age + age', self.columns, max_ops_evaluated=5)[0], 40)
+
+    def test_result_is_new_list(self):
+        res = self.parser.eval_columns('age', self.columns)
+        self.assertEqual(res, self.columns['age'])
+        self.assertIsNot(res, self.columns['age'])
+
+    def test_numpy(self):
+        numpy = pytest.importorskip('numpy')
+
+        columns = {
+            'age': numpy.array([20, 17, 30, 2 ** 60]),
+            'weight': numpy.array([70.5, 0.1, 80.0, 1.0]),
+            'city': numpy.array(['Moscow', 'Moscow', 'Kazan', 'Omsk']),
+        }
+        rows = [dict(zip(columns, row)) for row in zip(*(c.tolist() for c in columns.values()))]
+
+        exprs = [
+            'age > 18 and city == "Moscow"',
+            'not (age > 18) or weight <= 0.1',
+            'weight > 70 and age != 1152921504606846977',
+            'age * 2 if weight > 1 else city',
+        ]
+
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertEqual(
+                    self.parser.eval_columns(expr, columns),
+                    list(self.parser.eval_many(expr, rows)))
+
+
+class TestExecutor(TestCase):
+    def _worker_pids(self, executor):
+        return sorted(worker.pid for worker in executor._all.values())
+
+    def test_eval(self):
+        with SqExecutor(workers=2) as executor:
+            self.assertEqual(executor.eval('a + 1', {'a': 1}), 2)
+            self.assertEqual(executor.eval('{"a": [1, 2]}'), {'a': [1, 2]})
+
+            futures = [executor.submit('x * 2', {'x': i}) for i in range(10)]
+            self.assertEqual([f.result() for f in futures], [i * 2 for i in range(10)])
+
+    def test_errors(self):
+        with SqExecutor(workers=1) as executor:
+            with self.assertRaises(OpsExecutionLimitExceededError):
+                executor.eval('l | map(v => v)', {'l': [1] * 100})
+
+            with self.assertRaisesRegex(ParserError, 'non-numbers'):
+                executor.eval('"x" * 2')
+
+            with self.assertRaises(ParserError):
+                executor.eval('x => x')
+
+    def test_timeout(self):
+        big = {'s': 'a' * 20000}
+
+        with SqExecutor(workers=1, timeout=0.05) as executor:
+            pids = self._worker_pids(executor)
+
+            with self.assertRaises(ExecutionTimeoutError):
+                executor.eval('s | replace("a", s) | len', big)
+
+            self.assertNotEqual(self._worker_pids(executor), pids)
+            self.assertEqual(executor.eval('1 + 1'), 2)
+            self.assertEqual(executor.eval('s | len', big, timeout=5), 20000)
+
+    def test_fork_server(self):
+        # workers are forked by the fork server, also when a worker is replaced by a thread of submit()
+        parser = SqParser(functions={'ppid': os.getppid})
+        big = {'s': 'a' * 20000}
+
+        with SqExecutor(workers=1, timeout=0.05, parser=parser) as executor:
+            server_pid = executor._starter.process.pid
+            self.assertEqual(executor.eval('ppid()'), server_pid)
+
+            with self.assertRaises(ExecutionTimeoutError):
+                executor.submit('s | replace("a", s) | len', big).result()
+
+            self.assertEqual(executor.submit('ppid()').result(), server_pid)
+
+        self.assertFalse(executor._starter.process.is_alive())
+
+    def test_locks_held(self):
+        # locks held by other threads of the caller aren't inherited by workers
+        with SqExecutor(workers=1, timeout=5, max_tasks_per_worker=1, parser=SqParser(intern_nodes=True)) as executor:
+            with interning._lock:
+                self.assertEqual(executor.eval('a + 1', {'a': 1}), 2)
+                self.assertEqual(executor.submit('a * 2', {'a': 2}).result(), 4)
+
+    def test_crash(self):
+        with SqExecutor(workers=1) as executor:
+            os.kill(self._worker_pids(executor)[0], 9)
+
+            with self.assertRaisesRegex(WorkerCrashedError, 'code -9'):
+                executor.eval('1 + 1')
+
+            self.assertEqual(executor.eval('1 + 1'), 2)
+
+    def test_memory(self):
+        pytest.importorskip('resource')
+
+        with SqExecutor(workers=1, max_memory=256 * 2 ** 20) as executor:
+            with self.assertRaises(MemoryError):
+                executor.eval('s | replace("a", s) | len', {'s': 'a' * 20000})
+
+            self.assertEqual(executor.eval('1 + 1'), 2)
+
+    def test_recycling(self):
+        with SqExecutor(workers=1, max_tasks_per_worker=2) as executor:
+            pids = []
+            for _ in range(4):
+                pids.append(self._worker_pids(executor))
+                executor.eval('1')
+
+            self.assertEqual(pids[0], pids[1])
+            self.assertNotEqual(pids[1], pids[2])
+            self.assertEqual(pids[2], pids[3])
+
+    def test_max_rss(self):
+        if not os.path.exists('/proc/self/statm'):
+            pytest.skip('no /proc')
+
+        # memory of the caller doesn't count, memory gained by a worker does
+        inherited = b'x' * 64 * 2 ** 20
+        held = []
+        parser = SqParser(functions={'hold': lambda n: len(held.append(b'x' * int(n)) or held)})
+
+        with SqExecutor(workers=1, max_rss=32 * 2 ** 20, parser=parser) as executor:
+            pids = self._worker_pids(executor)
+            self.assertEqual(executor.eval('1 + 1'), 2)
+            self.assertEqual(self._worker_pids(executor), pids)
+
+            self.assertEqual(executor.eval('hold(16 * 2 ** 20)'), 1)
+            self.assertEqual(self._worker_pids(executor), pids)
+
+            self.assertEqual(executor.eval('hold(32 * 2 ** 20)'), 2)
+            self.assertNotEqual(self._worker_pids(executor), pids)
+
+            self.assertEqual(executor.eval('hold(16 * 2 ** 20)'), 1)
+
+        self.assertEqual(len(inherited), 64 * 2 ** 20)
+        self.assertEqual(held, [])
+
+
+class TestTokenizer(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ply_lexer = lex.lex(
+            module=lexer,
+            optimize=True,
+            debug=False,
+            outputdir=str(Path(lexer.__file__).parent / 'gen'))
+
+    def _tokens(self, lexer_, expr):
+        lexer_ = lexer_.clone()
+        lexer_.lineno = 1
+        lexer_.paren_count = 0
+        lexer_.input(expr)
+
+        res = []
+        try:
+            for t in iter(lexer_.token, None):
+                res.append((t.type, t.value, t.lineno, t.lexpos, lexer_.lineno))
+        except ParserError as e:
+            res.append(str(e))
+
+        return res
+
+    def assertSameTokens(self, expr):
+        self.assertEqual(self._tokens(Tokenizer(), expr), self._tokens(self.ply_lexer, expr), repr(expr))
+
+    def test_same_as_ply(self):
+        exprs = [
+            'x = l | map(v => v * 2 + 1) | filter(v => v > 3 and v != 10)',
+            'y = {"a": [1, 2.5, 3],\n "b": "s\\n\\t\\"\\\'"} # comment\r\nz',
+            "r'a\\n' + r\"b\\\"\" + 'c\\\\n'",
+            'a **= 2; b *= 3; c -= 1; d /= 2; e += 1',
+            '%var.name% >= 1 <= 2 == 3 != 4 < 5 > 6',
+            'not a in b or c not in d if True else False or None',
+            'del a[1:2]; for x',
+            'a ! b',
+            '"unterminated',
+            'a \r b',
+            'фу_1 + ٣',
+        ]
+
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertSameTokens(expr)
+
+    def test_random(self):
+        alphabet = [
+            'a', 'r', 'r"', "r'", '"', "'", '\\', '\\n', '\\t', "\\'", '\\"', '1', '2.5', '.', '%', 'x.y', '#',
+            '\n', '\r', '\r\n', ';', ' ', '\t', '(', ')', '[', ']', '{', '}', '+', '-', '*', '/', '=', '>', '<', '!',
+            '|', ':', ',', 'and', 'not', 'for', 'True', 'ф', '٣', '$', '_',
+        ]
+        rnd = random.Random(0)
+
+        for _ in range(2000):
+            self.assertSameTokens(''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 20))))
+
+
+class TestPratt(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.lalr = SqParser()
+        cls.pratt = SqParser(pratt=True)
+
+    def _parse(self, parser, expr):
+        try:
+            return parser.parse(expr)
+        except Exception as e:  # pylint: disable=broad-except
+            return type(e), str(e)
+
+    def assertSameParse(self, expr):
+        self.assertEqual(self._parse(self.pratt, expr), self._parse(self.lalr, expr), repr(expr))
+
+    def test_corpus(self):
+        # every string literal of this file, most of them are programs
+        tree = py_ast.parse(Path(__file__).read_text())
+        corpus = {
+            node.value for node in py_ast.walk(tree)
+            if isinstance(node, py_ast.Constant) and isinstance(node.value, str)
+        }
+
+        for expr in sorted(corpus):
+            with self.subTest(expr=expr):
+                self.assertSameParse(expr)
+
+    def test_quirks(self):
+        exprs = [
+            '-a.f()',
+            'not a == b',
+            'a + b not in c',
+            'not a not in b',
+            'a < b not in c',
+            'a < b < c',
+            'x => x + 1 if a else b',
+            'a if b else c if d else e',
+            'a + b if c else d',
+            '(a, b) => a + b',
+            '(1, b) => b',
+            '(a) => a',
+            '(a, b)',
+            'a.f(1, 2,)',
+            'a | f(1,)',
+            'a | f()',
+            '{"a": 1,}',
+            '{"a": 1, "b": 2,}',
+            'a[1:2]; a[:]; a[::2]; a[1::]; a[:1:]',
+            'a[1:2:3]',
+            'a | f[0] = 1',
+            'a + b[0] = 1',
+            'a[0] += 1; del a[0][1]',
+            'del a',
+            'for + 1',
+            'for 1',
+            '1 +',
+            'x = 1\ny = (\n2 +\n3)\nz = *',
+        ]
+
+        for expr in exprs:
+            with self.subTest(expr=expr):
+                self.assertSameParse(expr)
+
+    def test_random(self):
+        alphabet = [
+            'a', 'b', 'f', '1', '"s"', 'True', 'None', 'for', 'del ', ' = ', ' += ', '.', '|', '(', ')', '[', ']',
+            '{', '}', ',', ':', ';', '\n', ' + ', ' - ', '-', ' * ', ' ** ', ' / ', ' == ', ' != ', ' < ', ' >= ',
+            ' in ', ' not ', 'not ', ' and ', ' or ', ' if ', ' else ', ' => ',
+        ]
+        rnd = random.Random(0)
+
+        for _ in range(3000):
+            self.assertSameParse(''.join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 12))))
+
+
+class TestStartup(TestCase):
+    def test_tables_up_to_date(self):
+        # gen/lalrtab.py is loaded without validation, so it must be regenerated on grammar changes
+        pinfo = yacc.ParserReflect(vars(rules))
+        pinfo.get_all()
+        self.assertFalse(pinfo.error)
+        self.assertEqual(pinfo.signature(), lalrtab.SIGNATURE)
+
+    def test_tables_match_ply(self):
+        tables = lalr.build_tables()
+        for name, value in tables.items():
+            self.assertEqual(getattr(lalrtab, name), value, name)
+
+    def test_shared_tables(self):
+        p1, p2 = SqParser(), SqParser()
+        self.assertIs(p1.yacc, p2.yacc)
+        self.assertEqual(p1.eval('x + 1', {'x': 1}), 2)
+        self.assertEqual(p2.eval('x + 1', {'x': 2}), 3)
+
+    def test_construction_is_cheap(self):
+        SqParser()
+        self.assertLess(measure_for_tests(SqParser, iterations=100), 0.001)
+
+
+class TestLalr(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = SqParser()
+        cls.ply = yacc.yacc(module=rules, debug=False, write_tables=False, errorlog=yacc.NullLogger())
+
+    def _parse(self, parse, expr):
+        lexer = Tokenizer()
+        lexer.ast = None
+        try:
+            parse(lexer, expr)
+            return lexer.ast
+        except Exception as e:  # pylint: disable=broad-except
+            return type(e), str(e)
+
+    def test_same_as_ply(self):
+        # dense tables driver against PLY's own LR loop
+        tree = py_ast.parse(Path(__file__).read_text())
+        corpus = {
+            node.value for node in py_ast.walk(tree)
+            if isinstance(node, py_ast.Constant) and isinstance(node.value, str)
+        }
+        corpus.update(['del a', '1 +', 'a < b < c', 'for + 1', 'for 1', '{"a": 1, "b": 2,}', 'x = 1\ny = (\n2 +\n3)\nz = *'])
+
+        def dense(lexer, expr):
+            lexer.input(expr)
+            self.parser.yacc.parse(lexer)
+
+        def ply(lexer, expr):
+            self.ply.parse(input=expr, lexer=lexer)
+
+        for expr in sorted(corpus):
+            with self.subTest(expr=expr):
+                self.assertEqual(self._parse(dense, expr), self._parse(ply, expr))
+
+
+class TestNodes(TestCase):
+    def test_immutable(self):
+        op = BinOp('+', NameOp('a'), ValueOp(1))
+        with self.assertRaises(AttributeError):
+            op.op = '-'
+        with self.assertRaises(AttributeError):
+            op.extra = 1
+        self.assertFalse(hasattr(op, '__dict__'))
+
+    def test_interned_names(self):
+        name = ''.join(['na', 'me'])
+        self.assertIs(NameOp(name).name, 'name')
+        self.assertIs(CallOp(name, args=[]).name, 'name')
+
+    def test_shared_constants(self):
+        for pratt in (False, True):
+            ast = SqParser(pratt=pratt).parse('None; a[1:]')
+            self.assertIs(ast.lines[0], NONE)
+            self.assertIs(ast.lines[1].args[1].stop, NONE)
+
+        self.assertIs(SliceOp().step, NONE)
+
+    def test_copy(self):
+        ast = SqParser().parse('a[1:] + b.lower() if c and not d else e => e')
+
+        for copied in (copy.deepcopy(ast), pickle.loads(pickle.dumps(ast))):
+            self.assertEqual(copied, ast)
+            self.assertEqual(copied.eval(make_state(names={'a': 'abc', 'b': 'B', 'c': True, 'd': False})), 'bcb')
+
+
+class TestInterning(TestCase):
+    def test_shared_subtrees(self):
+        parser = SqParser(intern_nodes=True)
+        a = parser.parse('fmt = x => x.lower() + "!"\nfmt(a)')
+        b = parser.parse('fmt = x => x.lower() + "!"\nfmt(b)')
+
+        self.assertIs(a.lines[0], b.lines[0])
+        self.assertIsNot(a.lines[1], b.lines[1])
+        self.assertEqual(a, SqParser().parse('fmt = x => x.lower() + "!"\nfmt(a)'))
+
+    def test_equal_values_kept_apart(self):
+        parser = SqParser(intern_nodes=True)
+        ast = parser.parse('[1, 1.0, True, "1", 1.00]')
+
+        self.assertEqual([(type(arg.v).__name__, str(arg.v)) for arg in ast.lines[0].args], [
+            ('Decimal', '1'), ('Decimal', '1.0'), ('bool', 'True'), ('str', '1'), ('Decimal', '1.00')])
+
+    def test_weak(self):
+        parser = SqParser(intern_nodes=True)
+        gc.collect()
+        before = interned_nodes()
+
+        ast = parser.parse('unique_name_of_test_weak + 1')
+        self.assertGreater(interned_nodes(), before)
+
+        del ast
+        gc.collect()
+        self.assertEqual(interned_nodes(), before)
+
+    def test_persistent_cache_hits(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'programs.db'
+            prelude = 'fmt = x => x.upper() + "?"\n'
+            SqParser(parse_cache=SqliteCache(path)).parse(prelude + 'fmt(a)')
+
+            lru = LRUCache()
+            parser = SqParser(parse_cache=ChainedCache(lru, SqliteCache(path)), intern_nodes=True)
+            fresh = parser.parse(prelude + 'fmt(b)')
+            cached = parser.parse(prelude + 'fmt(a)')
+
+            self.assertIs(cached.lines[0], fresh.lines[0])
+            self.assertIs(lru.get(prelude + 'fmt(a)'), cached)
+            self.assertIs(parser.parse(prelude + 'fmt(a)'), cached)
+
+    def test_eval(self):
+        parser = SqParser(intern_nodes=True, optimize=True)
+        self.assertEqual(parser.eval('d = {"a": [1, 2]}; d["a"][0] = 3; d["a"]'), [3, 2])
+        self.assertEqual(parser.eval('d = {"a": [1, 2]}; d["a"]'), [1, 2])
+
+
+class TestScopedDict(TestCase):
+    def test_shadowing(self):
+        for flat_depth in (2, 3, ScopedDict.FLAT_DEPTH):
+            with self.subTest(flat_depth=flat_depth):
+                names = ScopedDict({'len': len, 'x': 0})
+                names.FLAT_DEPTH = flat_depth
+                names.push_scope({'x': 1})
+
+                for depth in range(2, 5):
+                    names.push_scope({'x': depth, f'y{depth}': depth})
+                    self.assertEqual(names['x'], depth)
+                    self.assertEqual(names['len'], len)
+
+                names['z'] = 'local'
+                names['len'] = 'local'
+                names.pop_scope()
+                self.assertEqual((names['x'], names['y3'], names['len']), (3, 3, len))
+                with self.assertRaises(KeyError):
+                    _ = names['z']
+
+                names['x'] = 'assigned'
+                names.pop_scope()
+                names.pop_scope()
+                self.assertEqual(names['x'], 1)
+                with self.assertRaises(KeyError):
+                    _ = names['y2']
+
+                names.pop_scope()
+                self.assertEqual(names['x'], 0)
+                self.assertEqual(names.scopes, [{'len': len, 'x': 0}])
+
+    def test_base_scopes_not_flattened(self):
+        names = ScopedDict({'len': len})
+        names.push_scope({f'k{i}': i for i in range(200)})
+        for depth in range(ScopedDict.FLAT_DEPTH + 2):
+            names.push_scope({'v': depth})
+
+        self.assertEqual((names['v'], names['k199'], names['len']), (ScopedDict.FLAT_DEPTH + 1, 199, len))
+        self.assertEqual(names._flat, {'v': ScopedDict.FLAT_DEPTH + 1})
+
+    def test_dynamic_scoping(self):
+        parser = SqParser()
+        # a lambda sees arguments of its callers
+        self.assertEqual(parser.eval('f = x => x + y\ng = y => f(1)\ng(2)'), 3)
+        self.assertEqual(parser.eval('f = (a, b) => b\nb = 5\nf(1)'), 5)
+        self.assertEqual(parser.eval(
+            'fact = n => 1 if n <= 1 else n * fact(n - 1)\nfact(30)', max_ops_evaluated=1000), math.factorial(30))
+        self.assertEqual(parser.eval('xs | map(x => ys | map(y => x * y) | sum) | sum', names={
+            'xs': [1, 2], 'ys': [3, 4]}), 21)
+
+    def test_eval_many_rows_isolated(self):
+        parser = SqParser()
+        rows = [{'x': 1}, {'y': 2}, {'x': 3}]
+        res = list(parser.eval_many('[1, 2] | map(v => v + x) | sum', rows, return_errors=True))
+
+        self.assertEqual(res[0], 5)
+        self.assertIsInstance(res[1], ParserError)
+        self.assertEqual(res[2], 9)
+
+
+class TestFunctions(TestCase):
+    def test_shared_builtins(self):
+        state = make_state(names={})
+        self.assertIs(state.names.scopes[0], BUILTINS)
+
+        with self.assertRaises(TypeError):
+            BUILTINS['len'] = None
+
+    def test_builtins_copy_on_write(self):
+        names = ScopedDict(BUILTINS)
+        names['len'] = 'shadowed'
+
+        self.assertEqual(names['len'], 'shadowed')
+        self.assertIs(BUILTINS['len'], len)
+
+    def test_custom_functions(self):
+        parser = SqParser(functions={'double': lambda v: v * 2, 'len': lambda v: -1})
+
+        self.assertEqual(parser.eval('double(len("abc"))'), -2)
+        self.assertEqual(parser.eval('len(x)', names={'len': lambda v: 0, 'x': ''}), 0)
+        self.assertEqual(list(parser.eval_many('double(x)', [{'x': 1}, {'x': 2}])), [2, 4])
+        self.assertEqual(parser.compile('double(2)').eval(functions=parser.functions), 4)
+        self.assertEqual(SqParser().eval('len("abc")'), 3)
+
+    def test_compiled_programs_bind_parser_defaults(self):
+        parser = SqParser(functions={'double': lambda v: v * 2}, code_cache={})
+        for compile_ in (parser.compile, parser.compile_bytecode, parser.compile_bytecode):
+            program = compile_('double(2)')
+            self.assertEqual(program.eval(), 4)
+            self.assertEqual(program.eval(functions={'double': lambda v: v * 3}), 6)
+
+        self.assertIs(type(SqParser(numeric_mode='float').compile('2 * 3').eval()), float)
+        self.assertIs(type(SqParser(numeric_mode='float').compile_bytecode('2 * 3').eval()), float)
+
+        parser = SqParser(persistent_values=True)
+        for program in (parser.compile('a = ["x"]; a'), parser.compile_bytecode('a = ["x"]; a')):
+            self.assertEqual(json.dumps(program.eval()), '["x"]')
+
+        # a program cached by another parser is bound to the functions of the caller
+        cache: dict = {}
+        cached = SqParser(code_cache=cache).compile_bytecode('double(2)')
+        bound = SqParser(functions={'double': lambda v: v * 2}, code_cache=cache).compile_bytecode('double(2)')
+        self.assertEqual(bound.eval(), 4)
+        # ... without executing the generated module again
+        self.assertIs(bound.program, cached.program)
+        self.assertIs(cached.functions, functions.BUILTINS)
+
+    def test_custom_functions_with_const_literals(self):
+        parser = SqParser(functions={'list': lambda *args: tuple(args)}, optimize=True)
+        self.assertEqual(parser.eval('[1, 2]'), (1, 2))
+
+
+class TestValues(TestCase):
+    def setUp(self):
+        self.parser = SqParser()
+
+    def run_all(self, expr: str, names: dict):
+        return [
+            self.parser.eval(expr, names=copy.deepcopy(names)),
+            self.parser.compile(expr).eval(names=copy.deepcopy(names)),
+            self.parser.compile_bytecode(expr).eval(names=copy.deepcopy(names)),
+        ]
+
+    def test_assignment_isolates_values(self):
+        names = {'a': [1, [2, 3], {'k': [4]}]}
+        expr = '''
+            b = a
+            push(b, 5)
+            push(b[1], 6)
+            push(b[2]["k"], 7)
+            [a, b]
+        '''
+        for res in self.run_all(expr, names):
+            self.assertEqual(res, [[1, [2, 3], {'k': [4]}], [1, [2, 3, 6], {'k': [4, 7]}, 5]])
+
+    def test_set_isolates_values(self):
+        expr = '''
+            l = [1]
+            d = {}
+            d["l"] = l
+            push(l, 2)
+            d
+        '''
+        for res in self.run_all(expr, {}):
+            self.assertEqual(res, {'l': [1]})
+
+    def test_aliasing_and_cycles(self):
+        inner = [1]
+        names = {'a': [inner, inner]}
+        for res in self.run_all('b = a; push(b[0], 2); b', names):
+            self.assertEqual(res, [[1, 2], [1, 2]])
+
+        for res in self.run_all('a = [1]; push(a, a); b = a; b[1][1][0]', {}):
+            self.assertEqual(res, 1)
+
+    def test_copy_value(self):
+        flat = [1, 'a', Decimal(1), None]
+        self.assertIsNot(copy_value(flat), flat)
+        self.assertEqual(copy_value(flat), flat)
+        self.assertEqual(copy_value({'a': 1}), {'a': 1})
+
+        t = (1, 'a')
+        self.assertIs(copy_value(t), t)
+        s = 'abc'
+        self.assertIs(copy_value(s), s)
+
+        nested = {'a': [(1, [2])]}
+        c = copy_value(nested)
+        self.assertEqual(c, nested)
+        self.assertIsNot(c['a'][0][1], nested['a'][0][1])
+
+        cyclic = [1]
+        cyclic.append(cyclic)
+        c = copy_value(cyclic)
+        self.assertIs(c[1], c)
+        self.assertIsNot(c, cyclic)
+
+
+class TestPersistent(TestCase):
+    def setUp(self):
+        self.parser = SqParser(persistent_values=True)
+
+    def run_all(self, expr: str, names: dict = None):
+        return [
+            self.parser.eval(expr, names=copy.deepcopy(names)),
+            self.parser.compile(expr).eval(names=copy.deepcopy(names), persistent_values=True),
+            self.parser.compile_bytecode(expr).eval(names=copy.deepcopy(names), persistent_values=True),
+        ]
+
+    def test_plain_names(self):
+        expr = 'a = ["x", {"k": ["y"]}]; b = a[1]; c = "z"; push(a, "w"); l = [1]'
+        for eval_ in (
+            lambda names: self.parser.eval(expr, names=names),
+            lambda names: self.parser.compile(expr).eval(names=names),
+            lambda names: self.parser.compile_bytecode(expr).eval(names=names),
+            lambda names: list(self.parser.eval_many(expr, [names])),
+        ):
+            names: dict = {}
+            eval_(names)
+            self.assertEqual(
+                json.dumps(names, default=str),
+                '{"a": ["x", {"k": ["y"]}, "w"], "b": {"k": ["y"]}, "c": "z", "l": ["1"]}',
+            )
+            self.assertIs(type(names['a']), list)
+
+        names = {}
+        with self.assertRaises(ParserError):
+            self.parser.eval('a = ["x"]; undefined', names=names)
+        self.assertEqual(names, {'a': ['x']})
+        self.assertIs(type(names['a']), list)
+
+        # persistent values written into plain containers of the caller
+        expr = 'b = [1]; push(a, b); d["k"] = b; push(t[0], {"x": b})'
+        for eval_ in (
+            lambda names: self.parser.eval(expr, names=names),
+            lambda names: self.parser.compile(expr).eval(names=names),
+            lambda names: self.parser.compile_bytecode(expr).eval(names=names),
+        ):
+            a, d, t = [], {}, ([],)
+            names = {'a': a, 'd': d, 't': t}
+            eval_(names)
+            self.assertEqual(
+                json.dumps(names, default=str),
+                '{"a": [["1"]], "d": {"k": ["1"]}, "t": [[{"x": ["1"]}]], "b": ["1"]}',
+            )
+            self.assertIs(names['a'], a)
+            self.assertIs(names['d'], d)
+            self.assertIs(names['t'], t)
+            self.assertIs(type(a[0]), list)
+            self.assertIs(type(d['k']), list)
+            self.assertIs(type(names['t'][0][0]['x']), list)
+
+    def test_vector(self):
+        rnd = random.Random(0)
+        for n in (0, 1, 32, 33, 1024, 1057, 2000):
+            items = list(range(n))
+            v = PVector.from_list(items)
+            for i in range(n + 40):
+                v = v.append(-i)
+                items.append(-i)
+
+            for _ in range(200):
+                i = rnd.randrange(len(items))
+                v = v.set(i, 'x')
+                items[i] = 'x'
+
+            self.assertEqual(v.tolist(), items)
+            self.assertEqual([v.get(i) for i in range(len(items))], items)
+
+            while items:
+                v = v.pop()
+                items.pop()
+                if len(items) % 31 == 0:
+                    self.assertEqual(v.tolist(), items)
+
+    def test_map(self):
+        rnd = random.Random(0)
+        d: dict = {}
+        m = PMap()
+        for i in range(3000):
+            k = rnd.choice([rnd.randrange(200), str(rnd.randrange(200))])
+            if rnd.random() < 0.3:
+                d.pop(k, None)
+                m = m.delete(k)
+            else:
+                d[k] = i
+                m = m.set(k, i)
+
+        self.assertEqual(m.pairs(), list(d.items()))
+        self.assertEqual(len(m), len(d))
+
+    def test_values(self):
+        expr = '''
+            a = [1, [2, 3], {"k": [4]}]
+            b = a
+            push(b, 5)
+            push(b[1], 6)
+            b[2]["k"][0] = 7
+            b[2]["n"] = 8
+            del a[0]
+            [a, b, pop(b), len(b)]
+        '''
+        for res in self.run_all(expr):
+            self.assertEqual(res, [
+                [[2, 3], {'k': [4]}],
+                [1, [2, 3, 6], {'k': [7], 'n': 8}],
+                5,
+                3,
+            ])
+
+    def test_builtins(self):
+        expr = '''
+            l = [3, 1, 2]
+            d = {"b": 1, "a": 2}
+            d["c"] = 3
+            remove(d, "b")
+            insert(l, 1, 5)
+            remove(l, 1)
+            l += [4]
+            [
+                sorted(l), l | map(v => v * 2), l | filter(v => v > 2), keys(d), values(d), 2 in l,
+                l[1:], index_of(l, 4), reversed(l), sum(l), pretty(d, ", "), l == [3, 5, 2, 4],
+            ]
+        '''
+        for res in self.run_all(expr):
+            self.assertEqual(res, [
+                [2, 3, 4, 5], [6, 10, 4, 8], [3, 5, 4], ['a', 'c'], [2, 3], True,
+                [5, 2, 4], 3, [4, 2, 5, 3], 14, 'a: 2, c: 3', True,
+            ])
+
+    def test_plain_results(self):
+        res = self.parser.eval('a = [{"k": [1]}]; a')
+        self.assertIs(type(res), list)
+        self.assertIs(type(res[0]), dict)
+        self.assertIs(type(res[0]['k']), list)
+
+    def test_assignment_shares_tree(self):
+        seen = []
+        parser = SqParser(persistent_values=True, functions={'probe': lambda *args: seen.extend(args)})
+        names = {'a': list(range(100))}
+        parser.eval('b = a; c = b; d = b; push(c, 1); probe(b, c, d)', names=names)
+
+        b, c, d = seen
+        self.assertIsInstance(b, PList)
+        self.assertIs(d._v, b._v)
+        self.assertEqual(len(b), 100)
+        self.assertEqual(len(c), 101)
+        self.assertEqual(names['c'], list(range(100)) + [1])
+
+
+class TestOpsAccounting(TestCase):
+    def setUp(self):
+        self.parser = SqParser()
+
+    def test_costs(self):
+        ast = self.parser.parse('a = 1 + x; a > 2 and f(a); l | map(v => v * 2)')
+        self.assertEqual(ast.cost, 1)
+        self.assertEqual([line.cost for line in ast.lines], [4, 4, 3])
+
+        restored = pickle.loads(pickle.dumps(ast))
+        self.assertEqual([line.cost for line in restored.lines], [4, 4, 3])
+
+    def test_same_as_per_node(self):
+        # the compiled program charges every node
+        for expr in COMPILE_EXPRS:
+            with self.subTest(expr):
+                ast = self.parser.parse(expr)
+                state = make_state(names={**COMPILE_NAMES}, max_ops_evaluated=10 ** 6)
+                ast.run(state)
+
+                expected = make_state(names={**COMPILE_NAMES}, max_ops_evaluated=10 ** 6)
+                compile_program(ast).code(expected)
+
+                self.assertEqual(state.ops_evaluated, expected.ops_evaluated)
+
+    def test_limit(self):
+        with self.assertRaises(OpsExecutionLimitExceededError):
+            self.parser.eval('f = n => f(n + 1); f(0)', max_ops_evaluated=1000)
+
+        with self.assertRaises(OpsExecutionLimitExceededError):
+            self.parser.eval('1 + 2 + 3', max_ops_evaluated=6)
+
+        self.assertEqual(self.parser.eval('1 + 2 + 3', max_ops_evaluated=7), 6)
+        self.assertEqual(self.parser.eval('x or 1 + 2 + 3', names={'x': 1}, max_ops_evaluated=4), 1)
+
+
+class TestRegexCache(TestCase):
+    def setUp(self):
+        self.parser = SqParser()
+        functions.regex_cache.clear()
+        functions.regex_cache.stats = CacheStats()
+
+    def test_literal_pattern(self):
+        ast = self.parser.parse('s | match(r"\\d+", "i")')
+        self.assertEqual(ast.lines[0].pattern.pattern, r'\d+')
+
+        expr = 's | match_groups(r"(\\d+)-(\\d+)")'
+        self.assertEqual(self.parser.eval(expr, names={'s': 'a 1-2'}), ['1-2', '1', '2'])
+        self.assertEqual(self.parser.compile(expr).eval(names={'s': 'a 1-2'}), ['1-2', '1', '2'])
+        self.assertEqual(functions.regex_cache.stats, CacheStats())
+
+        self.assertIsNone(self.parser.parse('s | match(p)').lines[0].pattern)
+        self.assertIsNone(self.parser.parse('s | match("(")').lines[0].pattern)
+        with self.assertRaises(regex.error):
+            self.parser.eval('s | match("(")', names={'s': ''})
+
+    def test_cache(self):
+        for _ in range(3):
+            self.assertEqual(self.parser.eval('match_all(s, p, "i")', names={'s': 'aAb', 'p': 'a'}), ['a', 'A'])
+
+        self.assertEqual(functions.regex_cache.stats, CacheStats(hits=2, misses=1))
+
+    def test_overridden(self):
+        parser = SqParser(functions={'match': lambda s, p: p})
+        self.assertEqual(parser.eval('match("abc", "b")'), 'b')
+        self.assertEqual(parser.compile('match("abc", "b")').eval(functions=parser.functions), 'b')
+
+
+class TestNumeric(TestCase):
+    def setUp(self):
+        self.parser = SqParser()
+
+    def test_host_numbers(self):
+        names = {'i': 3, 'f': 2.675, 'd': Decimal('1.5')}
+        self.assertEqual(self.parser.eval('i * d', names=names), Decimal('4.5'))
+        self.assertEqual(self.parser.eval('i ** 2', names=names), Decimal('9'))
+        self.assertEqual(self.parser.eval('round(f, 2)', names=names), Decimal('2.67'))
+        self.assertEqual(self.parser.eval('floor(f)', names=names), Decimal('2'))
+
+        for expr in ('i * 2', 'round(f, 2)', 'floor(f)'):
+            with self.subTest(expr=expr):
+                self.assertIsInstance(self.parser.eval(expr, names=names), Decimal)
+
+    def test_power_context(self):
+        self.assertEqual(self.parser.eval('2 ** 0.5'), Decimal('1.414213562373095048801688724'))
+
+        # precision and rounding of the host are kept, the exponent is bounded
+        with decimal.localcontext(decimal.Context(prec=50, Emax=decimal.MAX_EMAX)):
+            self.assertEqual(self.parser.eval('2 ** 0.5'), Decimal(2).sqrt())
+            with self.assertRaises(decimal.Overflow):
+                self.parser.eval('10 ** 1000000')
+
+        with decimal.localcontext(decimal.Context(prec=5, rounding=decimal.ROUND_DOWN)):
+            self.assertEqual(self.parser.eval('3 ** 0.5'), Decimal('1.7320'))
+
+
+class TestFloatMode(TestCase):
+    def setUp(self):
+        self.parser = SqParser(numeric_mode='float')
+
+    def test_eval(self):
+        names = {'l': [1, 2, 3], 'i': 2, 'd': Decimal('1.5')}
+        for expr, expected in [
+            ('1 + 2 * 3', 7.0),
+            ('2 ** 0.5', 2 ** 0.5),
+            ('i * 1.5', 3.0),
+            ('d * 2', Decimal('3')),
+            ('round(2 / 3, 2)', 0.67),
+            ('int(2.7) + float("0.5")', 2.5),
+            ('floor(2.5) + ceil(2.5) + abs(-1)', 6.0),
+            ('l[len(l) - 1]', 3),
+            ('{1: "a"}[1]', 'a'),
+            ('rand() < 1', True),
+        ]:
+            with self.subTest(expr=expr):
+                res = self.parser.eval(expr, names=names)
+                self.assertEqual(res, expected)
+                self.assertIs(type(res), type(expected))
+                self.assertEqual(self.parser.compile(expr).eval(names=names, functions=self.parser.functions), res)
+                self.assertEqual(
+                    self.parser.compile_bytecode(expr).eval(names=names, functions=self.parser.functions), res)
+
+        with self.assertRaises(ValueError):
+            self.parser.eval('(0 - 8) ** 0.5')
+
+    def test_keys_and_strings(self):
+        for expr, expected in [
+            ('{1: "a"}', {'1': 'a'}),
+            ('{2 / 2: "a"}', {'1': 'a'}),
+            ('{0.5: "a"}', {'0.5': 'a'}),
+            ('"n" + 1', 'n1'),
+            ('"n" + 0.5', 'n0.5'),
+            ('str(2)', '2'),
+            ('l = [1, 2]; l[1] = 3; l', [1, 3]),
+            ('pretty([1, 2.5])', '1, 2.5'),
+            ('pretty({"a": 2 / 2, "b": 0.5})', 'a: 1\nb: 0.5'),
+            ('pretty(3)', '3'),
+            ('join([1, 2.0], ",")', '1,2'),
+            ('[1, 2.5] | join(" ")', '1 2.5'),
+        ]:
+            with self.subTest(expr=expr):
+                self.assertEqual(self.parser.eval(expr), expected)
+                self.assertEqual(self.parser.compile(expr).eval(functions=self.parser.functions), expected)
+                self.assertEqual(
+                    self.parser.compile_bytecode(expr).eval(functions=self.parser.functions), expected)
+
+    def test_decimal_mode_unchanged(self):
+        parser = SqParser()
+        names = {'a': 3, 'b': 1.5, 'l': [1, 2], 'i': 1.0}
+        for p in (parser.eval, lambda expr, names: parser.compile(expr).eval(names=names),
+                  lambda expr, names: parser.compile_bytecode(expr).eval(names=names)):
+            res = p('a * b', names=names)
+            self.assertEqual(res, Decimal('4.5'))
+            self.assertIs(type(res), Decimal)
+            self.assertEqual(p('a ** 2', names=names), Decimal('9'))
+            self.assertIs(type(p('a ** 2', names=names)), Decimal)
+            with self.assertRaises(Exception):
+                p('l[i]', names=names)
+
+    def test_modes(self):
+        self.assertIs(type(SqParser(numeric_mode='float', pratt=True).eval('2 * 3')), float)
+        self.assertIs(type(SqParser(numeric_mode='float', functions={'f': abs}).eval('f(0 - 2)')), float)
+        self.assertIsInstance(SqParser().eval('2 * 3'), Decimal)
+
+        with self.assertRaises(ParserError):
+            SqParser(numeric_mode='double')
+
+
+class TestStats(TestCase):
+    def setUp(self):
+        self.parser = SqParser()
+
+    def test_stats(self):
+        expr = 'a = l | map(v => v * 2) | filter(v => v > 2); s = "a1b1" | match_all("1"); a and len(a) if a else 0'
+        names = {'l': [1, 2, 3]}
+        res, stats = self.parser.eval(expr, names=names, collect_stats=True, max_ops_evaluated=1000)
+        self.assertEqual(res, 2)
+        self.assertEqual(res, self.parser.eval(expr, names=names, max_ops_evaluated=1000))
+
+        state = make_state(names=names, max_ops_evaluated=1000)
+        self.parser.parse(expr).run(state)
+        self.assertEqual(sum(stats.nodes.values()), state.ops_evaluated)
+        self.assertEqual(stats.nodes['LambdaOp'], 2)
+        self.assertEqual(stats.nodes['IfExprOp'], 1)
+
+        self.assertEqual(stats.calls, {'map': 1, 'filter': 1, 'match_all': 1, 'len': 1})
+        self.assertEqual(stats.call_time.keys(), stats.calls.keys())
+        self.assertGreater(stats.call_time['map'], 0)
+        self.assertEqual(stats.regex_time, stats.call_time['match_all'])
+        self.assertEqual(stats.lambda_calls, 6)
+        self.assertEqual(stats.max_scope_depth, 3)
+
+    def test_nested(self):
+        _, stats = self.parser.eval(
+            'l | map(v => l | map(w => v * w))', names={'l': [1, 2]}, collect_stats=True)
+        self.assertEqual(stats.lambda_calls, 6)
+        self.assertEqual(stats.max_scope_depth, 4)
+        self.assertEqual(stats.calls['map'], 3)
+
+    def test_simple(self):
+        self.assertEqual(
+            self.parser.eval('1', collect_stats=True),
+            (1, EvalStats(nodes={'CodeOp': 1, 'ValueOp': 1}, max_scope_depth=2)))